@@ -76,3 +76,10 @@ class TestCallable(unittest.TestCase):
         self.assertEqual(i, "                     ^^^^^^^^^^^^^^^^")
 
         self.assertEqual(cm.exception.last_responsable().file, "dummy")
+
+    def test_wrappers_are_flat(self):
+        rewrapped = self.checker.check_and_wrap(self.fn1, DummyExecutionContext())
+        self.assertIs(rewrapped.inner, self.fn1.inner)
+
+        other = CallableFactory().create_from(Callable[[int, int], int], DummyDefaultCreationContext())
+        self.assertIsNot(other.check_and_wrap(self.fn2, DummyExecutionContext()), self.fn2)
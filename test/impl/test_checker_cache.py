@@ -0,0 +1,76 @@
+import unittest
+from typing import Optional, Annotated
+
+from test.util import DummyDefaultCreationContext
+from untypy.error import Location
+from untypy.impl import DefaultCreationContext
+from untypy.impl.checker_cache import GlobalCheckerCache
+
+
+def context_at(line_no: int) -> DefaultCreationContext:
+    return DefaultCreationContext(dict(), Location(
+        file="dummy",
+        line_no=line_no,
+        source_line="dummy"
+    ), checkedpkgprefixes=["test"])
+
+
+class TestCheckerCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        GlobalCheckerCache.clear()
+
+    def test_shared_checker(self):
+        a = DummyDefaultCreationContext().find_checker(Optional[str])
+        before = GlobalCheckerCache.info()
+        b = DummyDefaultCreationContext().find_checker(Optional[str])
+
+        self.assertIs(a, b)
+        self.assertEqual(GlobalCheckerCache.info().hits, before.hits + 1)
+
+    def test_location_dependent_checker(self):
+        a = context_at(1).find_checker(list[int])
+        b = context_at(2).find_checker(list[int])
+        c = context_at(1).find_checker(list[int])
+
+        self.assertIsNot(a, b)
+        self.assertIs(a, c)
+        self.assertEqual(b.declared.line_no, 2)
+        # the element checker does not depend on the location
+        self.assertIs(a.inner, b.inner)
+
+    def test_nested_location_dependency(self):
+        a = context_at(1).find_checker(Optional[list[int]])
+        b = context_at(2).find_checker(Optional[list[int]])
+
+        self.assertIsNot(a, b)
+        self.assertEqual(b.inner.declared.line_no, 2)
+
+    def test_typevars_and_prefixes_are_part_of_key(self):
+        a = DummyDefaultCreationContext().find_checker(int)
+        b = DefaultCreationContext(dict(), Location("dummy", 0, "dummy"), ["other"]).find_checker(int)
+        self.assertIsNot(a, b)
+
+    def test_unhashable_annotation(self):
+        before = GlobalCheckerCache.info()
+        a = DummyDefaultCreationContext().find_checker(Annotated[int, [1, 2]])
+        b = DummyDefaultCreationContext().find_checker(Annotated[int, [1, 2]])
+
+        self.assertIsNot(a, b)
+        self.assertEqual(GlobalCheckerCache.info().uncacheable, before.uncacheable + 2)
+
+    def test_redefined_class_evicts(self):
+        def define():
+            class Redefined:
+                pass
+
+            return Redefined
+
+        first = define()
+        GlobalCheckerCache.class_defined(first)
+        DummyDefaultCreationContext().find_checker(first)
+        self.assertGreater(GlobalCheckerCache.info().size, 0)
+
+        second = define()
+        GlobalCheckerCache.class_defined(second)
+        self.assertEqual(GlobalCheckerCache.info().size, 0)
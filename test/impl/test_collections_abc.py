@@ -0,0 +1,133 @@
+import collections.abc
+import unittest
+from typing import Sequence, Mapping, MutableMapping, Collection, Iterable, AbstractSet, Any
+
+from test.util import DummyExecutionContext, DummyDefaultCreationContext
+from untypy.error import UntypyTypeError
+from untypy.impl.collection_policy import set_collection_policy
+from untypy.impl.collections_abc import CollectionsAbcFactory, TypedSequence, TypedMapping
+
+
+def create_checker(annotation):
+    return CollectionsAbcFactory().create_from(annotation, DummyDefaultCreationContext())
+
+
+class TestCollectionsAbc(unittest.TestCase):
+
+    def test_sequence(self):
+        checker = create_checker(Sequence[int])
+        for seq in [[1, 2, "3"], (1, 2, "3")]:
+            wrapped = checker.check_and_wrap(seq, DummyExecutionContext())
+            self.assertIsInstance(wrapped, TypedSequence)
+            self.assertIsInstance(wrapped, collections.abc.Sequence)
+            self.assertEqual((wrapped[0], len(wrapped), wrapped.index(2), 2 in wrapped), (1, 3, 1, True))
+            self.assertEqual(list(wrapped[:2]), [1, 2])
+            self.assertEqual(wrapped, seq)
+            self.assertFalse(hasattr(wrapped, 'append'))
+
+            with self.assertRaises(UntypyTypeError) as cm:
+                list(wrapped)
+            (t, i) = cm.exception.next_type_and_indicator()
+            self.assertEqual(t, "Sequence[int]")
+            self.assertEqual(i.rstrip(), "         ^^^")
+            self.assertEqual(cm.exception.last_responsable().file, "dummy")
+
+        with self.assertRaises(UntypyTypeError):
+            checker.check_and_wrap({1, 2}, DummyExecutionContext())
+
+    def test_eager_policy(self):
+        checker = create_checker(Sequence[int])
+        set_collection_policy(eager_limit=10)
+        try:
+            lst = [1, 2, 3]
+            self.assertIs(checker.check_and_wrap(lst, DummyExecutionContext()), lst)
+            with self.assertRaises(UntypyTypeError):
+                checker.check_and_wrap((1, "2"), DummyExecutionContext())
+        finally:
+            set_collection_policy()
+
+    def test_any_is_not_wrapped(self):
+        lst = [1, "2"]
+        self.assertIs(create_checker(Sequence[Any]).check_and_wrap(lst, DummyExecutionContext()), lst)
+
+    def test_iterable_and_collection(self):
+        wrapped = create_checker(Iterable[int]).check_and_wrap(range(3), DummyExecutionContext())
+        self.assertEqual(list(wrapped), [0, 1, 2])
+        self.assertEqual(list(wrapped), [0, 1, 2])
+
+        wrapped = create_checker(Iterable[int]).check_and_wrap(iter([1, "2"]), DummyExecutionContext())
+        self.assertEqual(next(wrapped), 1)
+        with self.assertRaises(UntypyTypeError):
+            next(wrapped)
+
+        wrapped = create_checker(Collection[str]).check_and_wrap({"a": 1}, DummyExecutionContext())
+        self.assertEqual((len(wrapped), "a" in wrapped, list(wrapped)), (1, True, ["a"]))
+
+    def test_abstract_set(self):
+        checker = create_checker(AbstractSet[int])
+        wrapped = checker.check_and_wrap(frozenset({1, 2}), DummyExecutionContext())
+        self.assertEqual(wrapped, {1, 2})
+        self.assertEqual(wrapped | {3}, {1, 2, 3})
+        self.assertEqual(wrapped & {2}, {2})
+        self.assertEqual(hash(wrapped), hash(frozenset({1, 2})))
+        with self.assertRaises(UntypyTypeError):
+            set(checker.check_and_wrap({1, "2"}, DummyExecutionContext()))
+
+    def test_mapping(self):
+        checker = create_checker(Mapping[str, int])
+        wrapped = checker.check_and_wrap({"a": 1, "b": "2"}, DummyExecutionContext())
+        self.assertIsInstance(wrapped, TypedMapping)
+        self.assertEqual((wrapped["a"], wrapped.get("c", 3), len(wrapped), list(wrapped)), (1, 3, 2, ["a", "b"]))
+        self.assertFalse(hasattr(wrapped, '__setitem__'))
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            wrapped["b"]
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "Mapping[str, int]")
+        self.assertEqual(i.rstrip(), "             ^^^")
+        with self.assertRaises(UntypyTypeError):
+            list(wrapped.items())
+        with self.assertRaises(UntypyTypeError):
+            list(wrapped.values())
+
+    def test_mutable_mapping(self):
+        checker = create_checker(MutableMapping[str, int])
+        normal = {"a": 1}
+        wrapped = checker.check_and_wrap(normal, DummyExecutionContext())
+        wrapped["b"] = 2
+        wrapped.update(c=3)
+        self.assertEqual(wrapped.setdefault("d", 4), 4)
+        del wrapped["a"]
+        self.assertEqual(normal, {"b": 2, "c": 3, "d": 4})
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            wrapped.update({"e": "5"})
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "MutableMapping[str, int]")
+        self.assertEqual(i.rstrip(), "                    ^^^")
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+
+        with self.assertRaises(UntypyTypeError):
+            wrapped[5] = 5
+
+    def test_mutable_mapping_caller_resp_of_wrapping_values(self):
+        wrapped = create_checker(MutableMapping[str, list[int]]).check_and_wrap({}, DummyExecutionContext())
+        with self.assertRaises(UntypyTypeError) as cm:
+            wrapped["a"] = "b"
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+        with self.assertRaises(UntypyTypeError) as cm:
+            wrapped.setdefault("a", "b")
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+
+    def test_registered(self):
+        ctx = DummyDefaultCreationContext()
+        for annotation in [Sequence[int], collections.abc.Sequence[int], Mapping[str, int], Iterable[int],
+                           AbstractSet[int], Collection[int], MutableMapping[str, int]]:
+            checker = ctx.find_checker(annotation)
+            self.assertEqual(checker.base_type(), [annotation.__origin__])
+
+    def test_wrappers_are_flat(self):
+        checker = create_checker(Sequence[int])
+        lst = [1, 2]
+        wrapped = checker.check_and_wrap(lst, DummyExecutionContext())
+        self.assertIs(checker.check_and_wrap(wrapped, DummyExecutionContext()).inner, lst)
@@ -0,0 +1,57 @@
+import unittest
+from typing import Tuple, Optional, Union, Literal, Annotated, FrozenSet
+
+from test.util import DummyExecutionContext, DummyDefaultCreationContext
+from untypy.error import UntypyTypeError
+from untypy.impl import DefaultCreationContext
+from untypy.impl.compiler import CompiledChecker, compile_checker
+
+
+def create_checker(annotation, compiled=True):
+    DefaultCreationContext.compile_checkers = compiled
+    try:
+        return DummyDefaultCreationContext().create_checker(annotation)
+    finally:
+        DefaultCreationContext.compile_checkers = True
+
+
+def error_of(checker, arg) -> str:
+    with unittest.TestCase().assertRaises(UntypyTypeError) as cm:
+        checker.check_and_wrap(arg, DummyExecutionContext())
+    return str(cm.exception)
+
+
+class TestCompiler(unittest.TestCase):
+
+    def test_compiled_trees(self):
+        cases = [
+            (Tuple[int, str], [(1, "a"), (True, "a")], [(1, 2), (1,), [1, "a"], None]),
+            (Optional[tuple[int, Optional[float]]], [None, (1, None), (1, 2), (1, 2.5)], [(1, "2"), (1, True), 1]),
+            (tuple[Union[int, str], ...], [(), (1, "a", 2)], [(1, 2.5), [1]]),
+            (Union[Literal["a", "b"], tuple[int, ...]], ["a", (1, 2)], ["c", (1, "2")]),
+            (Annotated[Tuple[int, str], lambda t: t[0] > 0], [(1, "x")], [(0, "x"), ("1", "x")]),
+            (FrozenSet[Tuple[int, int]], [frozenset(), frozenset({(1, 2)})], [frozenset({(1, "2")}), {(1, 2)}]),
+        ]
+        for (annotation, good, bad) in cases:
+            checker = create_checker(annotation)
+            plain = create_checker(annotation, compiled=False)
+            self.assertIsInstance(checker, CompiledChecker, annotation)
+            self.assertIn("def validate", checker.source)
+            self.assertEqual(checker.describe(), plain.describe())
+            for arg in good:
+                self.assertIs(checker.check_and_wrap(arg, DummyExecutionContext()), arg)
+                self.assertEqual(checker.try_check(arg), (True, arg))
+            for arg in bad:
+                self.assertEqual(error_of(checker, arg), error_of(plain, arg))
+                self.assertFalse(checker.try_check(arg)[0])
+
+    def test_not_compiled(self):
+        for annotation in [int, Optional[int], list[int], Tuple[int, list[int]], Union[int, str]]:
+            checker = create_checker(annotation)
+            self.assertNotIsInstance(checker, CompiledChecker, annotation)
+            self.assertIs(compile_checker(checker), checker)
+
+    def test_compiled_checkers_are_inlined(self):
+        checker = create_checker(Optional[Tuple[int, str]])
+        self.assertIsInstance(checker.checker.inner, CompiledChecker)
+        self.assertEqual(checker.source.count("def validate"), 1)
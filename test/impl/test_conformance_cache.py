@@ -0,0 +1,86 @@
+import gc
+import unittest
+import weakref
+from typing import Protocol
+
+from test.util import DummyDefaultCreationContext, DummyExecutionContext
+from untypy.error import UntypyTypeError
+from untypy.impl import ProtocolFactory
+from untypy.impl.conformance_cache import GlobalConformanceCache, ConformanceCache
+
+
+class Proto(Protocol):
+    def meth(self, a: int) -> int:
+        raise NotImplementedError
+
+
+class TestConformanceCache(unittest.TestCase):
+
+    def checker(self):
+        return ProtocolFactory().create_from(Proto, DummyDefaultCreationContext())
+
+    def test_shared_between_checkers(self):
+        class Impl:
+            def meth(self, a: int) -> int:
+                return a
+
+        before = GlobalConformanceCache.info()
+        self.assertEqual(self.checker().check_and_wrap(Impl(), DummyExecutionContext()).meth(1), 1)
+        self.assertEqual(self.checker().check_and_wrap(Impl(), DummyExecutionContext()).meth(2), 2)
+        after = GlobalConformanceCache.info()
+
+        self.assertEqual(after.misses, before.misses + 1)
+        self.assertEqual(after.hits, before.hits + 1)
+
+    def test_failures_are_cached(self):
+        class Impl:
+            def meth(self, b: int) -> int:
+                return b
+
+        for i in range(2):
+            with self.assertRaises(UntypyTypeError) as cm:
+                self.checker().check_and_wrap(Impl(), DummyExecutionContext())
+            self.assertIn("Missing required parameter a", cm.exception.notes[-1])
+
+    def test_invalidated_when_class_changes(self):
+        class Impl:
+            def meth(self, a: int) -> int:
+                return a
+
+        self.checker().check_and_wrap(Impl(), DummyExecutionContext())
+
+        def meth(self, b: int) -> int:
+            return b
+
+        Impl.meth = meth
+        before = GlobalConformanceCache.info()
+        with self.assertRaises(UntypyTypeError):
+            self.checker().check_and_wrap(Impl(), DummyExecutionContext())
+        self.assertEqual(GlobalConformanceCache.info().invalidations, before.invalidations + 1)
+
+    def test_classes_are_not_kept(self):
+        class Base:
+            def meth(self, a: int) -> int:
+                return a
+
+        def make():
+            class Impl(Base):
+                def meth(self, a: int) -> int:
+                    return super().meth(a)
+
+            cache = ConformanceCache()
+            cache.conformance(Proto, Impl, {}, ['meth'], lambda: None)
+            return cache, weakref.ref(Impl)
+
+        (cache, ref) = make()
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(cache.info().size, 0)
+
+    def test_limit(self):
+        cache = ConformanceCache()
+        cache.limit = 2
+        classes = [type(f"C{i}", (), {}) for i in range(3)]
+        for clas in classes:
+            cache.conformance(Proto, clas, {}, [], lambda: None)
+        self.assertEqual(list(cache.entries.keys()), classes[1:])
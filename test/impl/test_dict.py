@@ -0,0 +1,132 @@
+import unittest
+
+from test.util import DummyExecutionContext, DummyDefaultCreationContext
+from untypy.error import UntypyTypeError
+from untypy.impl.collection_policy import set_collection_policy
+from untypy.impl.dict import DictFactory, TypedDict
+from untypy.impl.dummy_delayed import DummyDelayedType
+
+
+class TestDict(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.checker = DictFactory().create_from(dict[str, int], DummyDefaultCreationContext())
+        self.normal_dict = {"a": 1, "b": 2}
+        self.wrapped_dict = self.checker.check_and_wrap(self.normal_dict, DummyExecutionContext())
+
+        self.faulty_normal_dict = {"a": 1, "b": "2"}
+        self.faulty_wrapped_dict = self.checker.check_and_wrap(self.faulty_normal_dict, DummyExecutionContext())
+
+    def test_side_effects(self):
+        self.assertIsInstance(self.wrapped_dict, TypedDict)
+        self.assertEqual(self.wrapped_dict, self.normal_dict)
+        self.wrapped_dict["c"] = 3
+        self.assertEqual(self.normal_dict["c"], 3)
+        self.normal_dict["d"] = 4
+        self.assertEqual(self.wrapped_dict["d"], 4)
+
+    def test_not_a_dict(self):
+        with self.assertRaises(UntypyTypeError) as cm:
+            self.checker.check_and_wrap([], DummyExecutionContext())
+
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "dict[str, int]")
+
+    def test_wrapping_resp(self):
+        self.assertEqual(self.faulty_wrapped_dict["a"], 1)
+        with self.assertRaises(UntypyTypeError) as cm:
+            self.faulty_wrapped_dict["b"]
+
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "dict[str, int]")
+        self.assertEqual(i.rstrip(), "          ^^^")
+        self.assertEqual(cm.exception.last_responsable().file, "dummy")
+
+        with self.assertRaises(UntypyTypeError):
+            list(self.faulty_wrapped_dict.values())
+        with self.assertRaises(UntypyTypeError):
+            list(self.faulty_wrapped_dict.items())
+        self.assertEqual(list(self.faulty_wrapped_dict.keys()), ["a", "b"])
+
+    def test_self_resp(self):
+        with self.assertRaises(UntypyTypeError) as cm:
+            self.wrapped_dict[1] = 1
+
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "dict[str, int]")
+        self.assertEqual(i.rstrip(), "     ^^^")
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            self.wrapped_dict.update({"c": "3"})
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            self.wrapped_dict.setdefault("c", "3")
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+        self.assertNotIn("c", self.normal_dict)
+
+    def test_operations(self):
+        d = self.wrapped_dict
+        d.update({"c": 3}, d=4)
+        d |= {"e": 5}
+        self.assertEqual(d.setdefault("a", 0), 1)
+        self.assertEqual(d.setdefault("f", 6), 6)
+        self.assertEqual(d.get("g", 7), 7)
+        self.assertEqual(d.pop("f"), 6)
+        self.assertEqual(d.pop("f", None), None)
+        self.assertEqual(len(d), 5)
+        self.assertIn("a", d)
+        self.assertIn("a", d.keys())
+        self.assertEqual(sorted(d.values()), [1, 2, 3, 4, 5])
+        self.assertEqual(dict(d), {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5})
+        self.assertEqual(d | {"z": 0}, {**self.normal_dict, "z": 0})
+
+        d |= [("g", 7)]
+        self.assertEqual(d["g"], 7)
+        with self.assertRaises(UntypyTypeError):
+            d |= [("h", "8")]
+
+        self.assertEqual({"a", "x"} & d.keys(), {"a"})
+        self.assertEqual({"x"} | d.keys(), {"a", "b", "c", "d", "e", "g", "x"})
+        self.assertEqual({"a", "x"} - d.keys(), {"x"})
+        self.assertEqual({"a", "x"} ^ d.keys(), {"b", "c", "d", "e", "g", "x"})
+        self.assertEqual({("a", 1), ("x", 0)} & d.items(), {("a", 1)})
+        self.assertEqual({("x", 0)} - d.items(), {("x", 0)})
+
+    def test_values_are_wrapped(self):
+        checker = DictFactory().create_from(dict[str, DummyDelayedType], DummyDefaultCreationContext())
+        d = checker.check_and_wrap({"a": 1}, DummyExecutionContext())
+
+        for v in d.values():
+            with self.assertRaises(UntypyTypeError):
+                v.use()
+
+    def test_caller_resp_of_wrapping_values(self):
+        checker = DictFactory().create_from(dict[str, list[int]], DummyDefaultCreationContext())
+        d = checker.check_and_wrap({}, DummyExecutionContext())
+        with self.assertRaises(UntypyTypeError) as cm:
+            d["a"] = "b"
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+        with self.assertRaises(UntypyTypeError) as cm:
+            d.update(a="b")
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+
+    def test_eager_policy(self):
+        set_collection_policy(limits={"dict": 5})
+        try:
+            with self.assertRaises(UntypyTypeError):
+                self.checker.check_and_wrap({"a": 1, "b": "2"}, DummyExecutionContext())
+            small = {"a": 1}
+            self.assertIs(self.checker.check_and_wrap(small, DummyExecutionContext()), small)
+            large = {str(i): str(i) for i in range(5)}
+            self.assertIsInstance(self.checker.check_and_wrap(large, DummyExecutionContext()), TypedDict)
+
+            checker = DictFactory().create_from(dict[str, DummyDelayedType], DummyDefaultCreationContext())
+            self.assertIsInstance(checker.check_and_wrap({"a": 1}, DummyExecutionContext()), TypedDict)
+        finally:
+            set_collection_policy()
+
+    def test_wrappers_are_flat(self):
+        rewrapped = self.checker.check_and_wrap(self.wrapped_dict, DummyExecutionContext())
+        self.assertIs(rewrapped.inner, self.normal_dict)
@@ -1,9 +1,10 @@
+import asyncio
 import unittest
-from typing import Generator
+from typing import Generator, AsyncGenerator
 
 from test.util import DummyDefaultCreationContext, DummyExecutionContext
 from untypy.error import UntypyTypeError
-from untypy.impl import GeneratorFactory
+from untypy.impl import GeneratorFactory, AsyncGeneratorFactory
 from untypy.impl.dummy_delayed import DummyDelayedType
 
 
@@ -20,6 +21,22 @@ def gen_use_sent():
     return None
 
 
+def gen_count() -> Generator[int, None, str]:
+    try:
+        yield 1
+        yield 2
+    except ValueError:
+        yield -1
+    return "done"
+
+
+async def async_gen_echo():
+    sent = yield 0
+    while True:
+        await asyncio.sleep(0)
+        sent = yield sent
+
+
 def create_checker(annotation):
     return GeneratorFactory().create_from(annotation, DummyDefaultCreationContext())
 
@@ -165,3 +182,86 @@ class TestGenerator(unittest.TestCase):
         self.assertEqual(i, "                    ^^^^^^^^^^^^^^^^")
 
         self.assertEqual(cm.exception.last_responsable().file, "dummy")
+
+    def test_async_generator(self):
+        checker = AsyncGeneratorFactory().create_from(AsyncGenerator[int, int], DummyDefaultCreationContext())
+        self.assertEqual(checker.describe(), "AsyncGenerator[int, int]")
+        wrapped = checker.check_and_wrap(async_gen_echo(), DummyExecutionContext())
+
+        async def use():
+            self.assertEqual(await wrapped.asend(None), 0)
+            self.assertEqual(await wrapped.asend(1), 1)
+            with self.assertRaises(UntypyTypeError) as cm:
+                wrapped.asend("2")
+            (t, i) = cm.exception.next_type_and_indicator()
+            self.assertEqual(t, "AsyncGenerator[int, int]")
+            self.assertEqual(i.rstrip(), "                    ^^^")
+            self.assertTrue(cm.exception.last_responsable().file.endswith("test_generator.py"))
+            await wrapped.aclose()
+
+        asyncio.run(use())
+
+    def test_async_generator_yield(self):
+        checker = AsyncGeneratorFactory().create_from(AsyncGenerator[str, int], DummyDefaultCreationContext())
+        wrapped = checker.check_and_wrap(async_gen_echo(), DummyExecutionContext())
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            asyncio.run(wrapped.__anext__())
+        self.assertEqual(cm.exception.next_type_and_indicator()[0], "AsyncGenerator[str, int]")
+
+        with self.assertRaises(UntypyTypeError):
+            checker.check_and_wrap(gen_normal(), DummyExecutionContext())
+
+    def test_send_none_is_not_checked(self):
+        checker = create_checker(Generator[int, None, str])
+        wrapped = checker.check_and_wrap(gen_count(), DummyExecutionContext())
+
+        self.assertTrue(checker.none_sent_ok)
+        self.assertEqual(list(wrapped), [1, 2])
+        self.assertEqual(list(wrapped), [])
+
+    def test_throw_and_close(self):
+        checker = create_checker(Generator[int, None, str])
+
+        wrapped = checker.check_and_wrap(gen_count(), DummyExecutionContext())
+        self.assertEqual(next(wrapped), 1)
+        self.assertEqual(wrapped.throw(ValueError()), -1)
+        with self.assertRaises(StopIteration) as cm:
+            next(wrapped)
+        self.assertEqual(cm.exception.value, "done")
+
+        wrapped = checker.check_and_wrap(gen_count(), DummyExecutionContext())
+        next(wrapped)
+        wrapped.close()
+        self.assertIsNone(wrapped.gi_frame)
+        with self.assertRaises(StopIteration):
+            next(wrapped)
+
+    def test_yield_from(self):
+        checker = create_checker(Generator[int, str, bool])
+
+        def delegate():
+            ret = yield from checker.check_and_wrap(gen_normal(), DummyExecutionContext())
+            return not ret
+
+        outer = delegate()
+        self.assertEqual(outer.send(None), 1)
+        self.assertEqual(outer.send("a"), 2)
+        self.assertEqual(outer.send("b"), 3)
+        with self.assertRaises(StopIteration) as cm:
+            outer.send("c")
+        self.assertEqual(cm.exception.value, False)
+
+        outer = delegate()
+        next(outer)
+        with self.assertRaises(UntypyTypeError):
+            outer.send(42)
+
+    def test_rewraps_are_flat(self):
+        checker = create_checker(Generator[int, str, bool])
+        gen = gen_normal()
+        wrapped = checker.check_and_wrap(gen, DummyExecutionContext())
+
+        self.assertIs(checker.check_and_wrap(wrapped, DummyExecutionContext()).inner, gen)
+        self.assertIsNot(create_checker(Generator[int, str, int]).check_and_wrap(wrapped, DummyExecutionContext()),
+                         wrapped)
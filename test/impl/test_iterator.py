@@ -1,9 +1,10 @@
+import asyncio
 import unittest
-from typing import Iterator
+from typing import Iterator, AsyncIterator
 
 from test.util import DummyDefaultCreationContext, DummyExecutionContext
 from untypy.error import UntypyTypeError
-from untypy.impl import IteratorFactory
+from untypy.impl import IteratorFactory, AsyncIteratorFactory
 from untypy.impl.dummy_delayed import DummyDelayedType
 
 
@@ -13,6 +14,12 @@ def normal_iterator():
     yield 3
 
 
+async def async_iterator():
+    for i in [1, 2, "3"]:
+        await asyncio.sleep(0)
+        yield i
+
+
 def create_checker(annotation):
     return IteratorFactory().create_from(annotation, DummyDefaultCreationContext())
 
@@ -72,3 +79,53 @@ class TestIterator(unittest.TestCase):
         self.assertEqual(i, "         ^^^^^^^^^^^^^^^^")
 
         self.assertEqual(cm.exception.last_responsable().file, "dummy")
+
+    def test_async_iterator(self):
+        checker = AsyncIteratorFactory().create_from(AsyncIterator[int], DummyDefaultCreationContext())
+        wrapped = checker.check_and_wrap(async_iterator(), DummyExecutionContext())
+        items = []
+
+        async def consume():
+            async for item in wrapped:
+                items.append(item)
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            asyncio.run(consume())
+
+        self.assertEqual(items, [1, 2])
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "AsyncIterator[int]")
+        self.assertEqual(i.rstrip(), "              ^^^")
+
+        with self.assertRaises(UntypyTypeError):
+            checker.check_and_wrap(normal_iterator(), DummyExecutionContext())
+
+    def test_batched(self):
+        checker = create_checker(Iterator[int])
+        checker.batch_size = 4
+
+        def source():
+            yield from range(6)
+            yield "6"
+
+        wrapped = checker.check_and_wrap(source(), DummyExecutionContext())
+        self.assertEqual([next(wrapped) for _ in range(6)], list(range(6)))
+        with self.assertRaises(UntypyTypeError) as cm:
+            next(wrapped)
+
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "Iterator[int]")
+        self.assertEqual(i.rstrip(), "         ^^^")
+
+        def failing():
+            yield 1
+            yield 2
+            raise ValueError()
+
+        wrapped = checker.check_and_wrap(failing(), DummyExecutionContext())
+        self.assertEqual((next(wrapped), next(wrapped)), (1, 2))
+        with self.assertRaises(ValueError):
+            next(wrapped)
+
+        wrapped = checker.check_and_wrap(iter(range(8)), DummyExecutionContext())
+        self.assertEqual(list(wrapped), list(range(8)))
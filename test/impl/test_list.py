@@ -3,7 +3,9 @@ import unittest
 from test.util import DummyExecutionContext, DummyDefaultCreationContext
 from untypy.error import UntypyTypeError
 from untypy.impl.dummy_delayed import DummyDelayedType
-from untypy.impl.list import ListFactory
+from untypy.impl.collection_policy import set_collection_policy, collection_stats, CollectionDecisions
+from untypy.util.stats import GlobalStats
+from untypy.impl.list import ListFactory, ListChecker, TypedList
 
 
 class TestList(unittest.TestCase):
@@ -129,3 +131,150 @@ class TestList(unittest.TestCase):
         self.assertEqual(self.wrapped_list, [0, 1, 2, 3])
 
         self.assertEqual(f"{self.wrapped_list}", f"{self.normal_list}")
+
+    def test_slice_is_checked_lazily(self):
+        part = self.faulty_wrapped_list[0:2]
+        self.assertIsInstance(part, TypedList)
+        self.assertEqual(part[1], 1)
+
+        part = self.faulty_wrapped_list[1:]
+        self.assertEqual(part[0], 1)
+        with self.assertRaises(UntypyTypeError):
+            part[1]
+
+    def test_track_validated(self):
+        ListChecker.track_validated = True
+        try:
+            checker = ListFactory().create_from(list[int], DummyDefaultCreationContext())
+            lst = checker.check_and_wrap([0, 1, 2, 3], DummyExecutionContext())
+        finally:
+            ListChecker.track_validated = False
+
+        self.assertEqual(list(lst), [0, 1, 2, 3])
+        self.assertEqual(lst.verified, 4)
+        self.assertEqual(lst[1:3].verified, 2)
+
+        lst.append(4)
+        lst.extend([5, 6])
+        self.assertEqual(lst.verified, 7)
+
+        lst.insert(2, 7)
+        self.assertEqual(lst.verified, 8)
+
+        self.assertEqual(lst.pop(3), 2)
+        self.assertEqual(lst.verified, 3)
+        self.assertEqual(lst.pop(-6), 1)
+        self.assertEqual(lst.verified, 1)
+        with self.assertRaises(IndexError):
+            lst.pop(-10)
+        lst.insert(1, 1)
+
+        lst.sort()
+        self.assertEqual(lst.verified, 0)
+        self.assertEqual(list(lst), [0, 1, 3, 4, 5, 6, 7])
+
+        # mutations bypassing the wrapper are not noticed for verified elements
+        lst.inner[0] = "0"
+        self.assertEqual(lst[0], "0")
+
+    def test_track_validated_keeps_wrapping(self):
+        ListChecker.track_validated = True
+        try:
+            checker = ListFactory().create_from(list[list[int]], DummyDefaultCreationContext())
+            lst = checker.check_and_wrap([[0]], DummyExecutionContext())
+        finally:
+            ListChecker.track_validated = False
+
+        self.assertIsInstance(lst[0], TypedList)
+        self.assertIsInstance(lst[0], TypedList)
+        self.assertEqual(lst.verified, 0)
+
+    def test_iterator_chunks(self):
+        lst = self.checker.check_and_wrap(list(range(1000)), DummyExecutionContext())
+        self.assertEqual(list(lst), list(range(1000)))
+
+        lst.inner[700] = "700"
+        with self.assertRaises(UntypyTypeError):
+            for i in lst:
+                pass
+        self.assertEqual(i, 699)
+
+    def test_iterator_sees_mutations(self):
+        def run(lst):
+            out = []
+            for i in lst:
+                out.append(i)
+                if len(lst) < 600:
+                    lst.append(i + 3)
+                if i == 1:
+                    lst[2] = 42
+            return out
+
+        expected = run([0, 1, 2])
+        self.assertEqual(len(expected), 600)
+        self.assertEqual(run(self.checker.check_and_wrap([0, 1, 2], DummyExecutionContext())), expected)
+
+    def test_iterator_checks_elements_moved_by_mutations(self):
+        lst = self.checker.check_and_wrap([1] * 256 + ["bad"], DummyExecutionContext())
+        with self.assertRaises(UntypyTypeError):
+            for i in lst:
+                if len(lst) == 257:
+                    lst.remove(1)
+
+    def test_extend_is_streamed_and_rolled_back(self):
+        lst = self.checker.check_and_wrap([0], DummyExecutionContext())
+        lst.extend(i for i in range(1, 1000))
+        lst += (1000, 1001)
+        self.assertEqual(lst, list(range(1002)))
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            lst.extend(x for x in [1, 2, "3", 4])
+        self.assertEqual(len(lst), 1002)
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+        self.assertIn("index 2", cm.exception.notes[-1])
+
+        with self.assertRaises(UntypyTypeError):
+            lst += [1, 2.0]
+        self.assertEqual(len(lst), 1002)
+
+    def test_extend_by_itself(self):
+        lst = self.checker.check_and_wrap([0, 1], DummyExecutionContext())
+        lst.extend(lst)
+        lst += lst.inner
+        self.assertEqual(lst, [0, 1, 0, 1, 0, 1, 0, 1])
+
+    def test_eager_policy(self):
+        set_collection_policy(eager_limit=1000, limits={"dict": 0})
+        GlobalStats.enabled = True
+        try:
+            before = collection_stats().get("list", CollectionDecisions(0, 0))
+            small = [0, 1, 2]
+            self.assertIs(self.checker.check_and_wrap(small, DummyExecutionContext()), small)
+            with self.assertRaises(UntypyTypeError) as cm:
+                self.checker.check_and_wrap([0, "1"], DummyExecutionContext())
+            self.assertEqual(cm.exception.last_responsable().file, "dummy")
+            self.assertIsInstance(self.checker.check_and_wrap(list(range(1000)), DummyExecutionContext()), TypedList)
+
+            after = collection_stats()["list"]
+            self.assertEqual(after.eager - before.eager, 2)
+            self.assertEqual(after.lazy - before.lazy, 1)
+
+            GlobalStats.enabled = False
+            self.checker.check_and_wrap(small, DummyExecutionContext())
+            self.assertEqual(collection_stats()["list"], after)
+        finally:
+            GlobalStats.enabled = False
+            set_collection_policy()
+
+        self.assertIsInstance(self.checker.check_and_wrap([], DummyExecutionContext()), TypedList)
+
+    def test_wrappers_are_flat(self):
+        rewrapped = self.checker.check_and_wrap(self.wrapped_list, DummyExecutionContext())
+        self.assertIs(rewrapped.inner, self.normal_list)
+
+        checker = ListFactory().create_from(list[float], DummyDefaultCreationContext())
+        wrapped = checker.check_and_wrap(self.wrapped_list, DummyExecutionContext())
+        self.assertIsNot(wrapped, self.wrapped_list)
+        with self.assertRaises(UntypyTypeError):
+            # still checked as list[int]
+            wrapped.append(1.5)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from typing import Protocol, Union, TypeVar, Generic, NoReturn
 
@@ -5,6 +6,7 @@ import untypy
 from test.util import DummyDefaultCreationContext, DummyExecutionContext, location_of
 from untypy.error import UntypyTypeError
 from untypy.impl import ProtocolFactory, GenericFactory
+from untypy.impl.protocol import ProtocolChecker, WrapperTypesAttribute
 from untypy.impl.union import UnionFactory
 
 
@@ -228,3 +230,100 @@ class TestProtocolSpecific(unittest.TestCase):
             .create_from(Union[U2, U1], DummyDefaultCreationContext()) \
             .check_and_wrap(U2(), DummyExecutionContext()) \
             .meth()
+
+    def test_attributes_are_forwarded(self):
+        class Impl:
+            known: int
+            constant = "c"
+
+            def __init__(self):
+                self.known = 1
+                self.unknown = 2
+
+            def meth(self) -> B:
+                return B()
+
+            @property
+            def prop(self) -> int:
+                return self.known + 1
+
+        checker = ProtocolFactory().create_from(ProtoReturnB, DummyDefaultCreationContext())
+        impl = Impl()
+        wrapped = checker.check_and_wrap(impl, DummyExecutionContext())
+
+        self.assertNotIn('__dict__', vars(type(wrapped)))
+        self.assertEqual((wrapped.known, wrapped.unknown, wrapped.constant, wrapped.prop), (1, 2, "c", 2))
+        wrapped.known = 3
+        wrapped.unknown = 4
+        wrapped.new = 5
+        self.assertEqual((impl.known, impl.unknown, impl.new, wrapped.prop), (3, 4, 5, 4))
+        del wrapped.known
+        self.assertFalse(hasattr(impl, 'known'))
+        with self.assertRaises(AttributeError):
+            wrapped.missing
+
+    def test_wrapper_types_do_not_keep_classes(self):
+        import gc
+        import weakref
+        from untypy.impl.conformance_cache import GlobalConformanceCache
+
+        checker = ProtocolFactory().create_from(ProtoReturnB, DummyDefaultCreationContext())
+
+        class Base:
+            def meth(self) -> B:
+                return B()
+
+        def make():
+            class Dynamic:
+                def meth(self) -> B:
+                    return B()
+
+            class UsingSuper(Base):
+                def meth(self) -> B:
+                    return super().meth()
+
+            for clas in [Dynamic, UsingSuper]:
+                checker.check_and_wrap(clas(), DummyExecutionContext()).meth()
+            return [weakref.ref(Dynamic), weakref.ref(UsingSuper)]
+
+        gc.collect()
+        size = GlobalConformanceCache.info().size
+        refs = [ref for i in range(5) for ref in make()]
+        gc.collect()
+        self.assertEqual([ref() for ref in refs], [None] * 10)
+        self.assertEqual(GlobalConformanceCache.info().size, size)
+
+    def test_wrapper_types_limit(self):
+        class Impl:
+            def meth(self) -> B:
+                return B()
+
+        checkers = [ProtocolFactory().create_from(ProtoReturnB, DummyDefaultCreationContext()) for i in range(3)]
+        ProtocolChecker.wrapper_types_limit = 2
+        try:
+            for checker in checkers:
+                checker.check_and_wrap(Impl(), DummyExecutionContext())
+        finally:
+            ProtocolChecker.wrapper_types_limit = 256
+        self.assertEqual(list(vars(Impl)[WrapperTypesAttribute].keys()), checkers[1:])
+
+    def test_async_methods(self):
+        class AsyncProto(Protocol):
+            async def fetch(self, x: int) -> B:
+                pass
+
+        class Impl:
+            async def fetch(self, x: int) -> B:
+                await asyncio.sleep(0)
+                return B() if x > 0 else A()
+
+        checker = ProtocolFactory().create_from(AsyncProto, DummyDefaultCreationContext())
+        wrapped = checker.check_and_wrap(Impl(), DummyExecutionContext())
+
+        self.assertTrue(asyncio.iscoroutinefunction(wrapped.fetch))
+        self.assertIsInstance(asyncio.run(wrapped.fetch(1)), B)
+        with self.assertRaises(UntypyTypeError):
+            wrapped.fetch("1")
+        with self.assertRaises(UntypyTypeError) as cm:
+            asyncio.run(wrapped.fetch(0))
+        self.assertEqual(cm.exception.next_type_and_indicator()[0], "fetch(self: Self, x: int) -> B")
@@ -0,0 +1,70 @@
+import unittest
+from typing import Any, Optional, Union, Protocol, Generic, TypeVar
+
+from test.util import DummyDefaultCreationContext, DummyExecutionContext
+from untypy.error import UntypyTypeError
+from untypy.impl import register_factory, GlobalFactoryRegistry
+from untypy.impl.optional import OptionalChecker
+from untypy.impl.protocol import ProtocolChecker
+from untypy.impl.union import UnionChecker
+from untypy.interfaces import TypeCheckerFactory, CreationContext, TypeChecker, ExecutionContext
+
+T = TypeVar("T")
+
+
+class Even:
+    pass
+
+
+class EvenFactory(TypeCheckerFactory):
+
+    def create_from(self, annotation: Any, ctx: CreationContext) -> Optional[TypeChecker]:
+        if annotation is Even:
+            return EvenChecker()
+        else:
+            return None
+
+
+class EvenChecker(TypeChecker):
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if type(arg) is int and arg % 2 == 0:
+            return arg
+        raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+
+    def describe(self) -> str:
+        return "Even"
+
+    def base_type(self) -> list[Any]:
+        return [int]
+
+
+class GenericProto(Protocol[T]):
+    def meth(self) -> T:
+        pass
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_priorities_are_kept(self):
+        self.assertIsInstance(DummyDefaultCreationContext().find_checker(Optional[int]), OptionalChecker)
+        self.assertIsInstance(DummyDefaultCreationContext().find_checker(Union[int, str]), UnionChecker)
+        self.assertIsInstance(DummyDefaultCreationContext().find_checker(GenericProto[int]), ProtocolChecker)
+
+    def test_dispatch_narrows_candidates(self):
+        names = [type(f).__name__ for f in GlobalFactoryRegistry.factories_for(Optional[int])]
+        self.assertLess(names.index("OptionalFactory"), names.index("UnionFactory"))
+        self.assertNotIn("ListFactory", names)
+        self.assertNotIn("SimpleFactory", names)
+
+    def test_register_factory(self):
+        register_factory(EvenFactory(), types=[type])
+
+        checker = DummyDefaultCreationContext().find_checker(Even)
+        self.assertIsInstance(checker, EvenChecker)
+        self.assertEqual(checker.check_and_wrap(42, DummyExecutionContext()), 42)
+        with self.assertRaises(UntypyTypeError):
+            checker.check_and_wrap(43, DummyExecutionContext())
+
+        # other classes are still handled by the built-in factories
+        self.assertEqual(DummyDefaultCreationContext().find_checker(int).describe(), "int")
@@ -0,0 +1,81 @@
+import unittest
+
+from test.util import DummyExecutionContext, DummyDefaultCreationContext
+from untypy.error import UntypyTypeError
+from untypy.impl.dummy_delayed import DummyDelayedType
+from untypy.impl.collection_policy import set_collection_policy
+from untypy.impl.set import SetFactory, TypedSet
+
+
+class TestSet(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.checker = SetFactory().create_from(set[int], DummyDefaultCreationContext())
+        self.normal_set = {1, 2}
+        self.wrapped_set = self.checker.check_and_wrap(self.normal_set, DummyExecutionContext())
+
+    def test_side_effects(self):
+        self.assertIsInstance(self.wrapped_set, TypedSet)
+        self.assertEqual(self.wrapped_set, {1, 2})
+        self.wrapped_set.add(3)
+        self.wrapped_set |= {4}
+        self.wrapped_set.update([5], {6})
+        self.assertEqual(self.normal_set, {1, 2, 3, 4, 5, 6})
+        self.assertEqual(self.wrapped_set | {7}, {1, 2, 3, 4, 5, 6, 7})
+        self.assertEqual(self.wrapped_set & self.wrapped_set, self.normal_set)
+
+    def test_self_resp(self):
+        with self.assertRaises(UntypyTypeError) as cm:
+            self.wrapped_set.add("3")
+
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "set[int]")
+        self.assertEqual(i.rstrip(), "    ^^^")
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+
+        with self.assertRaises(UntypyTypeError):
+            self.wrapped_set.update([3, "4"])
+        self.assertEqual(self.normal_set, {1, 2})
+        with self.assertRaises(UntypyTypeError):
+            self.wrapped_set |= [3, "4"]
+        self.assertEqual(self.normal_set, {1, 2})
+
+    def test_wrapping_resp(self):
+        self.normal_set.add("3")
+        with self.assertRaises(UntypyTypeError) as cm:
+            list(self.wrapped_set)
+        self.assertEqual(cm.exception.last_responsable().file, "dummy")
+
+    def test_eager_policy(self):
+        set_collection_policy(eager_limit=4)
+        try:
+            with self.assertRaises(UntypyTypeError):
+                self.checker.check_and_wrap({1, "2"}, DummyExecutionContext())
+            small = {1, 2}
+            self.assertIs(self.checker.check_and_wrap(small, DummyExecutionContext()), small)
+        finally:
+            set_collection_policy()
+
+    def test_frozenset(self):
+        checker = SetFactory().create_from(frozenset[int], DummyDefaultCreationContext())
+        value = frozenset({1, 2})
+        self.assertIs(checker.check_and_wrap(value, DummyExecutionContext()), value)
+        with self.assertRaises(UntypyTypeError):
+            checker.check_and_wrap(frozenset({1, "2"}), DummyExecutionContext())
+        with self.assertRaises(UntypyTypeError):
+            checker.check_and_wrap({1, 2}, DummyExecutionContext())
+        self.assertEqual(checker.try_check(value), (True, value))
+        self.assertEqual(checker.try_check(frozenset({1, "2"})), (False, None))
+        self.assertEqual(checker.try_check({1, 2}), (False, None))
+
+        checker = SetFactory().create_from(frozenset[DummyDelayedType], DummyDefaultCreationContext())
+        wrapped = checker.check_and_wrap(frozenset({1}), DummyExecutionContext())
+        self.assertIsInstance(wrapped, frozenset)
+        self.assertEqual(hash(wrapped), hash(frozenset({1})))
+        for x in wrapped:
+            with self.assertRaises(UntypyTypeError):
+                x.use()
+
+    def test_wrappers_are_flat(self):
+        rewrapped = self.checker.check_and_wrap(self.wrapped_set, DummyExecutionContext())
+        self.assertIs(rewrapped.inner, self.normal_set)
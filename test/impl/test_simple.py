@@ -147,3 +147,15 @@ class TestSimple(unittest.TestCase):
             f("x")
         with self.assertRaises(UntypyTypeError):
             f(3.14)
+
+    def test_identity_preserving(self):
+        checker = SimpleFactory().create_from(int, DummyDefaultCreationContext())
+        self.assertTrue(checker.is_identity_preserving())
+        self.assertEqual(checker.exact_types(), [int])
+
+        checker = SimpleFactory().create_from(float, DummyDefaultCreationContext())
+        self.assertEqual(checker.exact_types(), [float, int])
+
+        checker = SimpleFactory().create_from(A, DummyDefaultCreationContext())
+        self.assertFalse(checker.is_identity_preserving())
+        self.assertIsNone(checker.exact_types())
@@ -1,5 +1,5 @@
 import unittest
-from typing import Tuple
+from typing import Tuple, Optional, NamedTuple
 
 from test.util import DummyExecutionContext, DummyDefaultCreationContext
 from untypy.error import UntypyTypeError
@@ -64,3 +64,48 @@ class TestTuple(unittest.TestCase):
 
         # This DummyExecutionContext is responsable
         self.assertEqual(cm.exception.last_responsable().file, "dummy")
+
+    def test_identity_is_kept(self):
+        checker = TupleFactory().create_from(tuple[int, Optional[str]], DummyDefaultCreationContext())
+        value = (1, None)
+        self.assertIs(checker.check_and_wrap(value, DummyExecutionContext()), value)
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            checker.check_and_wrap((1, 2), DummyExecutionContext())
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "Tuple[int, Optional[str]]")
+        self.assertEqual(i.rstrip(), "                    ^^^")
+
+    def test_named_tuple(self):
+        class Point(NamedTuple):
+            x: int
+            y: DummyDelayedType
+
+        checker = TupleFactory().create_from(tuple[int, DummyDelayedType], DummyDefaultCreationContext())
+        res = checker.check_and_wrap(Point(1, 2), DummyExecutionContext())
+        self.assertIsInstance(res, Point)
+        with self.assertRaises(UntypyTypeError):
+            res.y.use()
+
+    def test_variadic(self):
+        checker = TupleFactory().create_from(tuple[int, ...], DummyDefaultCreationContext())
+        value = tuple(range(100))
+        self.assertIs(checker.check_and_wrap(value, DummyExecutionContext()), value)
+        self.assertEqual(checker.check_and_wrap((), DummyExecutionContext()), ())
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            checker.check_and_wrap((1, "2", 3), DummyExecutionContext())
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "Tuple[int, ...]")
+        self.assertEqual(i.rstrip(), "      ^^^")
+        self.assertEqual(cm.exception.last_responsable().file, "dummy")
+
+        with self.assertRaises(UntypyTypeError):
+            checker.check_and_wrap([1], DummyExecutionContext())
+
+    def test_variadic_wrapping(self):
+        checker = TupleFactory().create_from(Tuple[DummyDelayedType, ...], DummyDefaultCreationContext())
+        res = checker.check_and_wrap((1, 2), DummyExecutionContext())
+        self.assertEqual(len(res), 2)
+        with self.assertRaises(UntypyTypeError):
+            res[1].use()
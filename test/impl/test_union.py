@@ -1,12 +1,22 @@
 import unittest
-from typing import Union, Callable
+from typing import Union, Callable, Generator, Iterator
 
 from test.util import DummyExecutionContext, DummyDefaultCreationContext
 from untypy.error import UntypyTypeError, UntypyAttributeError
 from untypy.impl.dummy_delayed import DummyDelayedType
 from untypy.impl.union import UnionFactory
+from untypy.impl.list import TypedList
 import untypy
 
+
+class CountingExecutionContext(DummyExecutionContext):
+    wraps = 0
+
+    def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        self.wraps += 1
+        return super().wrap(err)
+
+
 class TestUnion(unittest.TestCase):
 
     def test_wrap(self):
@@ -69,3 +79,55 @@ class TestUnion(unittest.TestCase):
             f(None)
         with self.assertRaises(UntypyTypeError):
             f([1])
+
+    def test_misses_do_not_raise(self):
+        checker = UnionFactory().create_from(Union[int, str, None], DummyDefaultCreationContext())
+        ctx = CountingExecutionContext()
+        self.assertEqual(checker.check_and_wrap("x", ctx), "x")
+        self.assertIsNone(checker.check_and_wrap(None, ctx))
+        self.assertEqual(ctx.wraps, 0)
+
+    def test_try_check(self):
+        checker = UnionFactory().create_from(Union[int, list[int]], DummyDefaultCreationContext())
+        self.assertEqual(checker.try_check(1), (True, 1))
+        self.assertEqual(checker.try_check("x"), (False, None))
+
+        # wrapping alternatives are only checked for their shape
+        (ok, value) = checker.try_check([1, "x"])
+        self.assertTrue(ok)
+        self.assertNotIsInstance(value, TypedList)
+        self.assertIsInstance(checker.check_and_wrap([1], DummyExecutionContext()), TypedList)
+
+    def test_dispatch_by_type(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        checker = UnionFactory().create_from(Union[int, str, Base, Callable[[], int]],
+                                             DummyDefaultCreationContext())
+        names = lambda ty: [c.describe() for (_, c) in checker.candidates(ty)]
+
+        self.assertEqual(names(str), ["str", "Callable[[], int]"])
+        self.assertEqual(names(Child), ["Base", "Callable[[], int]"])
+        self.assertEqual(names(bool), ["int", "Callable[[], int]"])
+        self.assertIsInstance(checker.check_and_wrap(Child(), DummyExecutionContext()), Base)
+        self.assertEqual(checker.check_and_wrap(lambda: 42, DummyExecutionContext())(), 42)
+
+    def test_generator_and_iterator_alternatives(self):
+        def gen():
+            yield 1
+
+        checker = UnionFactory().create_from(Union[Generator[int, None, None], str],
+                                             DummyDefaultCreationContext())
+        self.assertEqual(next(checker.check_and_wrap(gen(), DummyExecutionContext())), 1)
+        self.assertEqual(checker.check_and_wrap("x", DummyExecutionContext()), "x")
+        with self.assertRaises(UntypyTypeError):
+            checker.check_and_wrap(1, DummyExecutionContext())
+
+        checker = UnionFactory().create_from(Union[Iterator[int], str], DummyDefaultCreationContext())
+        self.assertEqual(list(checker.check_and_wrap(iter([1, 2]), DummyExecutionContext())), [1, 2])
+        self.assertEqual(checker.check_and_wrap("x", DummyExecutionContext()), "x")
+        with self.assertRaises(UntypyTypeError):
+            next(checker.check_and_wrap(iter(["x"]), DummyExecutionContext()))
@@ -0,0 +1,54 @@
+import unittest
+
+from untypy.error import UntypyTypeError, Frame, Location, ResponsibilityType
+
+
+def frame(name: str) -> Frame:
+    return Frame(name, None, declared=None, responsable=Location("dummy", 0, name))
+
+
+class TestUntypyTypeError(unittest.TestCase):
+
+    def test_frames_and_notes_keep_order(self):
+        base = UntypyTypeError(42, "str").with_frame(frame("a"))
+        err = base.with_frame(frame("b")).with_note("first").with_note("second")
+
+        self.assertEqual([f.type_declared for f in err.frames], ["a", "b"])
+        self.assertEqual(err.notes, ["first", "second"])
+        self.assertEqual(err.next_type_and_indicator(), ("b", "^"))
+
+        # the error derived from is unchanged
+        self.assertEqual([f.type_declared for f in base.frames], ["a"])
+        self.assertEqual(base.notes, [])
+
+    def test_constructor_frames(self):
+        err = UntypyTypeError(42, "str", frames=[frame("a"), frame("b")], notes=["note"])
+
+        self.assertEqual([f.type_declared for f in err.frames], ["a", "b"])
+        self.assertEqual(err.notes, ["note"])
+        self.assertIs(err.frames[0].responsibility_type, ResponsibilityType.IN)
+
+    def test_rendering_is_lazy(self):
+        class Given:
+            renders = 0
+
+            def __repr__(self):
+                Given.renders += 1
+                return "given"
+
+        err = UntypyTypeError(Given(), "str")
+        for i in range(10):
+            err = err.with_frame(frame(f"frame{i}"))
+        self.assertEqual(Given.renders, 0)
+
+        message = str(err)
+        self.assertIn("given: given", message)
+        self.assertIn("inside of frame9", message)
+        self.assertIs(str(err), message)
+        self.assertEqual(Given.renders, 1)
+
+    def test_inverted_responsibility(self):
+        err = UntypyTypeError(42, "str").with_frame(frame("a")).with_inverted_responsibility_type()
+        self.assertIs(err.responsibility_type, ResponsibilityType.OUT)
+        # frames added after the inversion are not blamed
+        self.assertEqual(err.with_frame(frame("b")).last_responsable().source_line, "a")
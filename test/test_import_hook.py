@@ -0,0 +1,82 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+
+from untypy.patching.ast_transformer import UntypyAstTransformer
+from untypy.patching.import_hook import UntypyLoader, module_digest
+
+
+class TestUntypyLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "cached_mod.py")
+        with open(self.path, "w") as f:
+            f.write("def f(x: int) -> int:\n    return x\n")
+        self.dont_write_bytecode = sys.dont_write_bytecode
+        sys.dont_write_bytecode = False
+
+    def tearDown(self):
+        sys.dont_write_bytecode = self.dont_write_bytecode
+        self.dir.cleanup()
+
+    def loader(self, cache_tag=None):
+        return UntypyLoader("cached_mod", self.path, lambda path: UntypyAstTransformer(), cache_tag)
+
+    def test_bytecode_is_cached_separately(self):
+        loader = self.loader()
+        cache = loader.cache_path(self.path)
+        self.assertIn("__pycache__", cache)
+        self.assertIn(".untypy-", cache)
+        self.assertNotEqual(cache, self.loader("other").cache_path(self.path))
+
+        loader.get_code("cached_mod")
+        self.assertTrue(os.path.exists(cache))
+
+        with open(cache, "rb") as f:
+            data = f.read()
+        transformed = []
+        loader.source_to_code = lambda *args, **kwargs: transformed.append(args)
+        code = loader.get_code("cached_mod")
+        self.assertEqual(transformed, [])
+        self.assertIn("untypy", code.co_names)
+
+        # the cache file is left unchanged
+        with open(cache, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_changed_source_is_transformed_again(self):
+        loader = self.loader()
+        loader.get_code("cached_mod")
+
+        with open(self.path, "w") as f:
+            f.write("def g(x: int) -> int:\n    return x\n")
+        os.utime(self.path, (0, 0))
+
+        code = loader.get_code("cached_mod")
+        self.assertIn("g", code.co_names)
+        self.assertNotIn("f", code.co_names)
+
+    def test_changed_transformer_invalidates_cache(self):
+        transformer_path = os.path.join(self.dir.name, "cached_transformer.py")
+
+        def cache_path(source):
+            with open(transformer_path, "w") as f:
+                f.write(source)
+            spec = importlib.util.spec_from_file_location("cached_transformer", transformer_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules["cached_transformer"] = module
+            spec.loader.exec_module(module)
+            module_digest.cache_clear()
+            loader = UntypyLoader("cached_mod", self.path, lambda path: module.Transformer(), None)
+            return loader.cache_path(self.path)
+
+        try:
+            old = cache_path("import ast\nclass Transformer(ast.NodeTransformer):\n    pass\n")
+            new = cache_path("import ast\nclass Transformer(ast.NodeTransformer):\n    x = 1\n")
+        finally:
+            sys.modules.pop("cached_transformer", None)
+            module_digest.cache_clear()
+        self.assertNotEqual(old, new)
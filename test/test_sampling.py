@@ -0,0 +1,61 @@
+import unittest
+
+from untypy.error import UntypyTypeError
+from untypy.patching import Config, DefaultConfig, wrap_function
+from untypy.patching.sampling import sampling_rate, sampling_stats
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+class TestSampling(unittest.TestCase):
+
+    def test_sampling_rate_lookup(self):
+        rates = {"app": 0.5, "app.api.handler": 0.1}
+        self.assertEqual(sampling_rate("app.api.handler", 1.0, rates), 0.1)
+        self.assertEqual(sampling_rate("app.api.other", 1.0, rates), 0.5)
+        self.assertEqual(sampling_rate("application.x", 1.0, rates), 1.0)
+
+    def test_full_rate_is_not_sampled(self):
+        fn = wrap_function(double, DefaultConfig)
+        with self.assertRaises(UntypyTypeError):
+            fn("x")
+
+    def test_unsampled_calls_are_not_checked(self):
+        fn = wrap_function(double, DefaultConfig._replace(sample_rate=0.0))
+        self.assertEqual(fn("x"), "xx")
+
+        stats = sampling_stats()[f"{__name__}.double"]
+        self.assertEqual(stats.calls, 1)
+        self.assertEqual(stats.sampled, 0)
+
+    def test_config_without_sampling_fields(self):
+        cfg = Config(False, [""])
+        self.assertEqual((cfg.sample_rate, dict(cfg.sample_rates), cfg.sample_seed), (1.0, {}, None))
+        with self.assertRaises(UntypyTypeError):
+            wrap_function(double, cfg)("x")
+
+    def test_rate_per_function(self):
+        cfg = DefaultConfig._replace(sample_rate=0.0, sample_rates={f"{__name__}.double": 1.0})
+        fn = wrap_function(double, cfg)
+        with self.assertRaises(UntypyTypeError):
+            fn("x")
+
+    def test_deterministic_seed(self):
+        def sampled_calls():
+            fn = wrap_function(double, DefaultConfig._replace(sample_rate=0.25, sample_seed=42))
+            for i in range(1000):
+                fn(i)
+            return sampling_stats()[f"{__name__}.double"]
+
+        first = sampled_calls()
+        self.assertEqual(first.calls, 1000)
+        self.assertTrue(150 < first.sampled < 350)
+        self.assertEqual(sampled_calls(), first)
+
+    def test_sampled_calls_blame_caller(self):
+        fn = wrap_function(double, DefaultConfig._replace(sample_rate=0.999999, sample_seed=1))
+        with self.assertRaises(UntypyTypeError) as cm:
+            fn("x")
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
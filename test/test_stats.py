@@ -0,0 +1,95 @@
+import io
+import unittest
+from typing import Callable, Protocol
+
+import untypy
+from untypy.error import UntypyTypeError
+from untypy.patching import DefaultConfig, wrap_function
+from untypy.util.stats import GlobalStats, StatsDumper
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+def apply(f: Callable[[int], int], x: int) -> list[int]:
+    return [f(x)]
+
+
+class Doubler(Protocol):
+    def double(self, x: int) -> int:
+        pass
+
+
+class Impl:
+    def double(self, x: int) -> int:
+        return x * 2
+
+
+def use(d: Doubler) -> int:
+    return d.double(2)
+
+
+class TestStats(unittest.TestCase):
+
+    def setUp(self):
+        untypy.enable_stats(timing=True)
+
+    def tearDown(self):
+        GlobalStats.enabled = False
+        GlobalStats.timing = False
+        GlobalStats.functions.clear()
+
+    def test_function(self):
+        fn = wrap_function(double, DefaultConfig)
+        self.assertEqual(fn(2), 4)
+        with self.assertRaises(UntypyTypeError):
+            fn("x")
+
+        stats = untypy.stats()[f"{__name__}.double"]
+        self.assertEqual((stats.calls, stats.checked, stats.wrapped, stats.violations), (2, 2, 0, 1))
+        self.assertGreater(stats.time, 0)
+
+    def test_callable_and_wrapped_values(self):
+        fn = wrap_function(apply, DefaultConfig)
+        self.assertEqual(fn(lambda x: x + 1, 1), [2])
+
+        stats = untypy.stats()
+        self.assertEqual(stats[f"{__name__}.apply"][:4], (1, 3, 2, 0))
+        self.assertEqual(stats[f"{__name__}.TestStats.test_callable_and_wrapped_values.<locals>.<lambda> "
+                               f"as Callable[[int], int]"][:4], (1, 2, 0, 0))
+
+    def test_protocol(self):
+        fn = wrap_function(use, DefaultConfig)
+        self.assertEqual(fn(Impl()), 4)
+        self.assertEqual(untypy.stats()[f"{__name__}.Impl.double as Doubler"][:4], (1, 3, 0, 0))
+
+    def test_dump(self):
+        wrap_function(double, DefaultConfig)(1)
+        out = io.StringIO()
+        StatsDumper(1, out).dump()
+        (header, line) = out.getvalue().splitlines()
+        self.assertIn("violations", header)
+        self.assertTrue(line.endswith(f"{__name__}.double"))
+
+        dumper = untypy.dump_stats(0.01, out)
+        dumper.stop()
+        dumper.join()
+        self.assertFalse(dumper.is_alive())
+
+    def test_wrapped_before_enabled(self):
+        GlobalStats.enabled = False
+        fn = wrap_function(double, DefaultConfig)
+        fn(1)
+        untypy.enable_stats()
+        self.assertTrue(fn.__code__.co_filename.startswith("<untypy wrapper"))
+        self.assertEqual(fn(2), 4)
+        with self.assertRaises(UntypyTypeError) as cm:
+            fn("x")
+        self.assertIn('fn("x")', cm.exception.last_responsable().source_line)
+        self.assertEqual(untypy.stats()[f"{__name__}.double"][:4], (2, 2, 0, 1))
+
+    def test_disabled(self):
+        GlobalStats.enabled = False
+        wrap_function(double, DefaultConfig)(1)
+        self.assertEqual(untypy.stats(), {})
@@ -0,0 +1,157 @@
+import asyncio
+import inspect
+import unittest
+from typing import Optional, Union, Literal, Any
+
+import untypy
+from untypy.error import UntypyTypeError
+from untypy.util.typedfunction import TypedFunctionBuilder
+
+
+@untypy.patch
+def add(a: int, b: int = 1) -> int:
+    return a + b
+
+
+@untypy.patch
+def positional(a: int, /, b: Optional[str] = None) -> str:
+    return str(a) + (b or "")
+
+
+@untypy.patch
+def wrong_return(a: int) -> str:
+    return a
+
+
+@untypy.patch
+def keyword_only(a: int, *, b: int) -> int:
+    return a + b
+
+
+@untypy.patch
+def trivial(a: int, b: Optional[float], c: Union[str, bytes], d: Literal["x", "y"], e: Any) -> float:
+    return b or 0.5
+
+
+kept = None
+
+
+@untypy.patch
+def keep(xs: list[int]) -> None:
+    global kept
+    kept = xs
+
+
+@untypy.patch
+async def async_add(a: int, b: int) -> int:
+    await asyncio.sleep(0)
+    return a + b
+
+
+@untypy.patch
+async def async_wrong_return(a: int) -> str:
+    await asyncio.sleep(0)
+    return a
+
+
+class TestTypedFunction(unittest.TestCase):
+
+    def test_defaults_and_keywords(self):
+        self.assertEqual(add(1), 2)
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(add(b=2, a=3), 5)
+
+    def test_positional_only(self):
+        self.assertEqual(positional(1), "1")
+        self.assertEqual(positional(1, b="x"), "1x")
+        with self.assertRaises(TypeError):
+            positional(a=1)
+
+    def test_signature_errors_are_kept(self):
+        with self.assertRaises(TypeError):
+            add()
+        with self.assertRaises(TypeError):
+            add(1, 2, 3)
+
+    def test_blames_caller(self):
+        with self.assertRaises(UntypyTypeError) as cm:
+            add("one")
+
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "add(a: int, b: int) -> int")
+        self.assertEqual(i, "       ^^^                ")
+        self.assertTrue(cm.exception.last_responsable().file.endswith("test_typedfunction.py"))
+
+    def test_blames_calling_line(self):
+        with self.assertRaises(UntypyTypeError) as cm:
+            line = inspect.currentframe().f_lineno + 1
+            add(1, "2")
+
+        self.assertEqual(cm.exception.last_responsable().line_no, line)
+
+    def test_blames_caller_of_kept_argument(self):
+        keep([1, "2"])
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            kept[1]
+
+        self.assertTrue(cm.exception.last_responsable().file.endswith("test_typedfunction.py"))
+
+    def test_return_is_checked(self):
+        with self.assertRaises(UntypyTypeError):
+            wrong_return(1)
+
+    def test_trivial_signature(self):
+        self.assertEqual(trivial(1, 2.5, "s", "x", object), 2.5)
+        self.assertEqual(trivial(True, None, b"s", "y", None), 0.5)
+        with self.assertRaises(UntypyTypeError):
+            trivial(1, "2.5", "s", "x", None)
+        with self.assertRaises(UntypyTypeError):
+            trivial(1, 2.5, 3, "x", None)
+        with self.assertRaises(UntypyTypeError):
+            trivial(1, 2.5, "s", "z", None)
+
+    def test_fallback_signatures(self):
+        self.assertEqual(keyword_only(1, b=2), 3)
+        with self.assertRaises(UntypyTypeError):
+            keyword_only(1, b="2")
+
+    def test_compiled_matches_generic(self):
+        def fn(a: int, b: str = "x") -> str:
+            return b * a
+
+        compiled = untypy.patch(fn)
+        TypedFunctionBuilder.compile_wrappers = False
+        try:
+            generic = untypy.patch(fn)
+        finally:
+            TypedFunctionBuilder.compile_wrappers = True
+
+        self.assertIsNot(compiled.__code__, generic.__code__)
+        for w in [compiled, generic]:
+            self.assertEqual(w(2), "xx")
+            with self.assertRaises(UntypyTypeError) as cm:
+                w(2, 3)
+            self.assertEqual(cm.exception.next_type_and_indicator()[1], "              ^^^        ")
+
+    def test_async_function(self):
+        self.assertTrue(asyncio.iscoroutinefunction(async_add))
+
+        async def main():
+            self.assertEqual(await async_add(1, 2), 3)
+            return await asyncio.gather(async_add(1, 1), asyncio.create_task(async_add(2, 2)))
+
+        self.assertEqual(asyncio.run(main()), [2, 4])
+
+    def test_async_arguments_are_checked_when_called(self):
+        with self.assertRaises(UntypyTypeError) as cm:
+            async_add(1, "2")
+        self.assertTrue(cm.exception.last_responsable().file.endswith("test_typedfunction.py"))
+
+    def test_async_result_is_checked_when_awaited(self):
+        awaitable = async_wrong_return(1)
+        with self.assertRaises(UntypyTypeError) as cm:
+            asyncio.run(awaitable)
+
+        (t, i) = cm.exception.next_type_and_indicator()
+        self.assertEqual(t, "async_wrong_return(a: int) -> str")
@@ -0,0 +1,46 @@
+import unittest
+
+import untypy
+from untypy.error import UntypyTypeError
+from untypy.impl.list import TypedList
+
+received = []
+
+
+@untypy.patch
+def outer(xs: list[int], depth: int) -> None:
+    received.append(xs)
+    if depth > 0:
+        outer(xs, depth - 1)
+
+
+@untypy.patch
+def callee(xs: list[int]) -> None:
+    xs.append("bad")
+
+
+@untypy.patch
+def caller(xs: list[int]) -> None:
+    callee(xs)
+
+
+class TestWrapperReuse(unittest.TestCase):
+
+    def test_no_proxy_towers(self):
+        received.clear()
+        outer([1, 2], 10)
+
+        self.assertEqual(len(received), 11)
+        self.assertIsInstance(received[-1], TypedList)
+        self.assertIs(received[-1].inner, received[0].inner)
+        self.assertIs(type(received[-1].inner), list)
+
+        with self.assertRaises(UntypyTypeError) as cm:
+            received[-1].append("3")
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
+
+    def test_write_in_callee_blames_callee(self):
+        with self.assertRaises(UntypyTypeError) as cm:
+            caller([1])
+        self.assertIn("def callee", cm.exception.last_declared().source_line)
+        self.assertEqual(cm.exception.last_responsable().file, __file__)
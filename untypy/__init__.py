@@ -4,11 +4,16 @@ import sys
 from types import ModuleType
 from typing import Optional, Any, Union
 
+from .impl import checker_cache_info, clear_checker_cache, register_factory, set_collection_policy, collection_stats, \
+    conformance_cache_info
 from .patching import wrap_function, patch_class, wrap_class, DefaultConfig
 from .patching.ast_transformer import UntypyAstTransformer, did_no_code_run_before_untypy_enable, \
     UntypyAstImportTransformer
 from .patching.import_hook import install_import_hook
+from .patching.sampling import sampling_stats
 from .util.condition import FunctionCondition
+from .util.stats import stats, enable_stats, dump_stats
+from .version import __version__
 
 GlobalConfig = DefaultConfig
 
@@ -34,7 +39,8 @@ def transform_tree(tree):
     UntypyAstTransformer().visit(tree)
     ast.fix_missing_locations(tree)
 
-def enable(*, recursive: bool = True, root: Union[ModuleType, str, None] = None, prefixes: list[str] = []) -> None:
+def enable(*, recursive: bool = True, root: Union[ModuleType, str, None] = None, prefixes: list[str] = [],
+           sample_rate: float = 1.0, sample_rates: dict[str, float] = {}, sample_seed: Optional[int] = None) -> None:
     global GlobalConfig
     caller = _find_calling_module()
     exit_after = False
@@ -49,7 +55,8 @@ def enable(*, recursive: bool = True, root: Union[ModuleType, str, None] = None,
     if hasattr(rootname, '__name__'):
         rootname = root.__name__
 
-    GlobalConfig = DefaultConfig._replace(checkedprefixes=[rootname])
+    GlobalConfig = DefaultConfig._replace(checkedprefixes=[rootname], sample_rate=sample_rate,
+                                          sample_rates=sample_rates, sample_seed=sample_seed)
 
     def predicate(module_name):
         if recursive:
@@ -89,7 +96,7 @@ def enable_on_imports(*prefixes):
                 return False
 
     transformer = lambda path: UntypyAstImportTransformer(predicate, path)
-    install_import_hook(predicate, transformer)
+    install_import_hook(predicate, transformer, cache_tag=",".join(prefixes))
     _exec_module_patched(caller, True, transformer(caller.__name__.split(".")))
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import sys
 from enum import Enum
 from typing import Any, Optional, Tuple
 
@@ -48,7 +49,12 @@ class Location:
             )
 
     @staticmethod
-    def from_stack(stack) -> Location:
+    def from_stack(stack) -> Optional[Location]:
+        if isinstance(stack, LazyCallerFrame):
+            stack = stack.resolve()
+            if stack is None:
+                return None
+
         if isinstance(stack, inspect.FrameInfo):
             try:
                 return Location(
@@ -63,6 +69,8 @@ class Location:
                     source_line="<Source Not Found>"
                 )
         else:  # assume sys._getframe(...)
+            while stack.f_code in LazyCallerFrame.transparent and stack.f_back is not None:
+                stack = stack.f_back
             try:
                 source_line = inspect.findsource(stack.f_code)[0][stack.f_lineno - 1]
                 return Location(
@@ -78,6 +86,36 @@ class Location:
                 )
 
 
+class LazyCallerFrame:
+    """
+    Stands in for sys._getframe(1) of a wrapper function. The frame is only looked up
+    when an error is reported, which must happen while the wrapper is still running.
+    """
+
+    # Code of functions which only forward calls to a wrapper, they are never blamed.
+    transparent = set()
+
+    def __init__(self, *codes):
+        self.codes = set(codes)
+
+    def add(self, code) -> None:
+        self.codes.add(code)
+
+    def wrapper_frame(self):
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_code in self.codes:
+                return frame
+            frame = frame.f_back
+        return None
+
+    def resolve(self):
+        frame = self.wrapper_frame()
+        if frame is None:
+            return None
+        return frame.f_back
+
+
 class Frame:
     type_declared: str
     indicator_line: str
@@ -140,38 +178,68 @@ class UntypyTypeError(TypeError):
             expected_indicator = "^" * len(expected)
 
         self.expected_indicator = expected_indicator
-        self.frames = frames.copy()
-        for frame in self.frames:
-            if frame.responsibility_type is None:
+        # frames and notes are kept as linked lists (newest first), which are shared
+        # between an error and the errors derived from it with the with_* methods.
+        self._frames = None
+        for frame in frames:
+            if getattr(frame, 'responsibility_type', None) is None:
                 frame.responsibility_type = responsibility_type
-        self.notes = notes.copy()
+            self._frames = (frame, self._frames)
+        self._notes = None
+        for note in notes:
+            self._notes = (note, self._notes)
         self.previous_chain = previous_chain
+        self._frame_list = None
+        self._message = None
+
+        super().__init__()
 
-        super().__init__('\n' + self.__str__())
+    def _derive(self, **changes) -> UntypyTypeError:
+        err = UntypyTypeError.__new__(UntypyTypeError)
+        err.__dict__.update(self.__dict__)
+        err.__dict__.update(changes)
+        err._frame_list = None
+        err._message = None
+        return err
+
+    @staticmethod
+    def _to_list(linked) -> list:
+        out = []
+        while linked is not None:
+            (head, linked) = linked
+            out.append(head)
+        out.reverse()
+        return out
+
+    @property
+    def frames(self) -> list[Frame]:
+        if self._frame_list is None:
+            self._frame_list = self._to_list(self._frames)
+        return self._frame_list
+
+    @property
+    def notes(self) -> list[str]:
+        return self._to_list(self._notes)
 
     def next_type_and_indicator(self) -> Tuple[str, str]:
-        if len(self.frames) >= 1:
-            frame = self.frames[-1]
+        if self._frames is not None:
+            frame = self._frames[0]
             return frame.type_declared, frame.indicator_line
         else:
             return self.expected, "^" * len(self.expected)
 
     def with_frame(self, frame: Frame) -> UntypyTypeError:
         frame.responsibility_type = self.responsibility_type
-        return UntypyTypeError(self.given, self.expected, self.expected_indicator, self.frames + [frame],
-                               self.notes, self.previous_chain, self.responsibility_type)
+        return self._derive(_frames=(frame, self._frames))
 
     def with_previous_chain(self, previous_chain: UntypyTypeError):
-        return UntypyTypeError(self.given, self.expected, self.expected_indicator, self.frames,
-                               self.notes, previous_chain, self.responsibility_type)
+        return self._derive(previous_chain=previous_chain)
 
     def with_note(self, note: str):
-        return UntypyTypeError(self.given, self.expected, self.expected_indicator, self.frames,
-                               self.notes + [note], self.previous_chain, self.responsibility_type)
+        return self._derive(_notes=(note, self._notes))
 
     def with_inverted_responsibility_type(self):
-        return UntypyTypeError(self.given, self.expected, self.expected_indicator, self.frames,
-                               self.notes, self.previous_chain, self.responsibility_type.invert())
+        return self._derive(responsibility_type=self.responsibility_type.invert())
 
     def last_responsable(self):
         for f in reversed(self.frames):
@@ -186,6 +254,11 @@ class UntypyTypeError(TypeError):
         return None
 
     def __str__(self):
+        if self._message is None:
+            self._message = self.render()
+        return self._message
+
+    def render(self) -> str:
         declared_locs = []
         responsable_locs = []
 
@@ -1,61 +1,135 @@
+from __future__ import annotations
+
+import abc
+import builtins
+import collections.abc
 import inspect
-from typing import Any, Optional, TypeVar, List, Dict
+from typing import Any, Optional, TypeVar, List, Dict, NoReturn, Annotated, Iterable
 
-from untypy.interfaces import CreationContext, TypeChecker
+from untypy.interfaces import CreationContext, TypeChecker, TypeCheckerFactory
 from .annotated import AnnotatedFactory
 from .any import AnyFactory
-from .callable import CallableFactory
+from .callable import CallableFactory, CallableTypeOne, CallableTypeTwo
+from .checker_cache import GlobalCheckerCache, checker_cache_info, clear_checker_cache
+from .collection_policy import set_collection_policy, collection_stats
+from .collections_abc import CollectionsAbcFactory, CollectionNames, MappingNames
+from .compiler import compile_checker
+from .conformance_cache import conformance_cache_info
+from .dict import DictFactory
 from .dummy_delayed import DummyDelayedFactory
-from .generator import GeneratorFactory
+from .generator import GeneratorFactory, AsyncGeneratorFactory
 from .generic import GenericFactory
-from .interface import InterfaceFactory
-from .iterator import IteratorFactory
+from .interface import InterfaceFactory, InterfaceMapping
+from .iterator import IteratorFactory, AsyncIteratorFactory
 from .list import ListFactory
-from .literal import LiteralFactory
+from .literal import LiteralFactory, LiteralType
 from .none import NoneFactory
 from .optional import OptionalFactory
 from .protocol import ProtocolFactory
+from .registry import FactoryRegistry
+from .set import SetFactory
 from .simple import SimpleFactory
 from .tuple import TupleFactory
-from .union import UnionFactory
+from .union import UnionFactory, UnionType
 from ..error import Location, UntypyAttributeError
 
+AnyType = type(Any)
+NoReturnType = type(NoReturn)
+AnnotatedType = type(Annotated[int, 0])
+GenericAliasType = type(List[int])
+
+GlobalFactoryRegistry = FactoryRegistry()
+
 # More Specific Ones First
-_FactoryList = [
-    AnyFactory(),
-    NoneFactory(),
-    AnnotatedFactory(),
-    ProtocolFactory(),  # must be higher then Generic
-    GenericFactory(),
-    CallableFactory(),
-    ListFactory(),
-    LiteralFactory(),
-    OptionalFactory(),  # must be higher then Union
-    UnionFactory(),
-    TupleFactory(),
-    DummyDelayedFactory(),
-    GeneratorFactory(),
-    IteratorFactory(),
-    InterfaceFactory(),
-    #
-    SimpleFactory()
-]
+# Note: 'list', 'tuple', 'dict' and 'set' refer to the submodules of this package here.
+GlobalFactoryRegistry.register(AnyFactory(), types=[AnyType])
+GlobalFactoryRegistry.register(NoneFactory(), types=[type(None), type, NoReturnType])
+GlobalFactoryRegistry.register(AnnotatedFactory(), types=[AnnotatedType])
+GlobalFactoryRegistry.register(ProtocolFactory(), types=[type, GenericAliasType])  # must be higher then Generic
+GlobalFactoryRegistry.register(GenericFactory(), types=[TypeVar, type, GenericAliasType])
+GlobalFactoryRegistry.register(CallableFactory(), types=[CallableTypeOne, CallableTypeTwo])
+GlobalFactoryRegistry.register(ListFactory(), origins=[builtins.list])
+GlobalFactoryRegistry.register(DictFactory(), origins=[builtins.dict])
+GlobalFactoryRegistry.register(SetFactory(), origins=[builtins.set, builtins.frozenset])
+GlobalFactoryRegistry.register(LiteralFactory(), types=[LiteralType])
+GlobalFactoryRegistry.register(OptionalFactory(), types=[UnionType])  # must be higher then Union
+GlobalFactoryRegistry.register(UnionFactory(), types=[UnionType])
+GlobalFactoryRegistry.register(TupleFactory(), origins=[builtins.tuple])
+GlobalFactoryRegistry.register(DummyDelayedFactory(), types=[type])
+GlobalFactoryRegistry.register(GeneratorFactory(), origins=[collections.abc.Generator])
+GlobalFactoryRegistry.register(IteratorFactory(), origins=[collections.abc.Iterator])
+GlobalFactoryRegistry.register(AsyncGeneratorFactory(), origins=[collections.abc.AsyncGenerator])
+GlobalFactoryRegistry.register(AsyncIteratorFactory(), origins=[collections.abc.AsyncIterator])
+GlobalFactoryRegistry.register(CollectionsAbcFactory(), origins=[*CollectionNames.keys(), *MappingNames.keys()])
+GlobalFactoryRegistry.register(InterfaceFactory(), origins=InterfaceMapping.keys())
+#
+GlobalFactoryRegistry.register(SimpleFactory(), types=[type, abc.ABCMeta])
+
+
+def register_factory(factory: TypeCheckerFactory, *, types: Iterable[type] = (),
+                     origins: Iterable[Any] = ()) -> None:
+    """
+    Adds a factory which is asked before all built-in ones for annotations whose
+    type (or one of its base classes) is in types or whose __origin__ is in origins.
+    Without types and origins, the factory is asked for every annotation.
+    """
+    GlobalFactoryRegistry.register(factory, types=types, origins=origins, first=True)
+    GlobalCheckerCache.clear()
 
 
 class DefaultCreationContext(CreationContext):
+    # Replace checkers of values checked completely at once by a generated function.
+    compile_checkers = True
 
-    def __init__(self, typevars: Dict[TypeVar, Any], declared_location: Location, checkedpkgprefixes: List[str]):
+    def __init__(self, typevars: Dict[TypeVar, Any], declared_location: Location, checkedpkgprefixes: List[str],
+                 parent: Optional[DefaultCreationContext] = None):
         self.typevars = typevars
         self.declared = declared_location
         self.checkedpkgprefixes = checkedpkgprefixes
+        self.parent = parent
+        # set, if the checker currently created depends on the declared location
+        self.location_used = False
 
     def declared_location(self) -> Location:
+        self.mark_location_used()
         return self.declared
 
+    def mark_location_used(self) -> None:
+        ctx = self
+        while ctx is not None:
+            ctx.location_used = True
+            ctx = ctx.parent
+
     def find_checker(self, annotation: Any) -> Optional[TypeChecker]:
-        for fac in _FactoryList:
+        key = GlobalCheckerCache.key_of(annotation, self.typevars, self.checkedpkgprefixes)
+        if key is None:
+            GlobalCheckerCache.uncacheable += 1
+            return self.create_checker(annotation)
+
+        (checker, uses_location) = GlobalCheckerCache.lookup(key, self.declared)
+        if checker is not None:
+            if uses_location:
+                self.mark_location_used()
+            return checker
+
+        outer_location_used = self.location_used
+        self.location_used = False
+        try:
+            checker = self.create_checker(annotation)
+            uses_location = self.location_used
+        finally:
+            self.location_used = outer_location_used or self.location_used
+
+        if checker is not None:
+            GlobalCheckerCache.store(key, self.declared, checker, uses_location)
+        return checker
+
+    def create_checker(self, annotation: Any) -> Optional[TypeChecker]:
+        for fac in GlobalFactoryRegistry.factories_for(annotation):
             res = fac.create_from(annotation=annotation, ctx=self)
             if res is not None:
+                if self.compile_checkers:
+                    return compile_checker(res)
                 return res
         return None
 
@@ -75,7 +149,7 @@ class DefaultCreationContext(CreationContext):
     def with_typevars(self, typevars: Dict[TypeVar, Any]) -> CreationContext:
         tv = self.typevars.copy()
         tv.update(typevars)
-        return DefaultCreationContext(tv, self.declared, self.checkedpkgprefixes)
+        return DefaultCreationContext(tv, self.declared, self.checkedpkgprefixes, parent=self)
 
     def should_be_inheritance_checked(self, annotation: type) -> bool:
         m = inspect.getmodule(annotation)
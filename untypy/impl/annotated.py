@@ -1,4 +1,4 @@
-from typing import Optional, Any, Iterator
+from typing import Optional, Any, Iterator, Tuple
 
 from untypy.error import UntypyTypeError, UntypyAttributeError, Frame
 from untypy.interfaces import TypeCheckerFactory, TypeChecker, ExecutionContext, CreationContext, WrappedFunction
@@ -8,12 +8,18 @@ class AnnotatedChecker:
     def check(self, arg: Any, ctx: ExecutionContext) -> None:
         pass
 
+    def accepts(self, arg: Any) -> bool:
+        return True
+
 
 class AnnotatedCheckerCallable(AnnotatedChecker):
     def __init__(self, annotated, callable):
         self.callable = callable
         self.annotated = annotated
 
+    def accepts(self, arg: Any) -> bool:
+        return bool(self.callable(arg))
+
     def check(self, arg: Any, ctx: ExecutionContext) -> None:
         res = self.callable(arg)
         if not res:
@@ -42,6 +48,9 @@ class AnnotatedCheckerContainer(AnnotatedChecker):
         self.cont = cont
         self.annotated = annotated
 
+    def accepts(self, arg: Any) -> bool:
+        return arg in self.cont
+
     def check(self, arg: Any, ctx: ExecutionContext) -> None:
         if arg not in self.cont:
             # raise error on falsy value
@@ -91,12 +100,30 @@ class AnnotatedChecker(TypeChecker):
         self.meta = meta
         self.info = info
 
+    def may_be_wrapped(self) -> bool:
+        return self.inner.may_be_wrapped()
+
+    def is_identity_preserving(self) -> bool:
+        return self.inner.is_identity_preserving()
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return self.inner.indexed_types()
+
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         wrapped = self.inner.check_and_wrap(arg, AnnotatedCheckerExecutionContext(self, ctx))
         for ck in self.meta:
             ck.check(wrapped, ctx)
         return wrapped
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        (ok, value) = self.inner.try_check(arg)
+        if not ok:
+            return False, None
+        for ck in self.meta:
+            if not ck.accepts(value):
+                return False, None
+        return True, value
+
     def describe(self) -> str:
         if len(self.info) > 0:
             text = ", ".join(map(lambda a: f"'{a}'", self.info))
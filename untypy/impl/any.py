@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
 
@@ -13,9 +13,15 @@ class AnyFactory(TypeCheckerFactory):
 
 
 class AnyChecker(TypeChecker):
+    def is_identity_preserving(self) -> bool:
+        return True
+
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         return arg
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return True, arg
+
     def describe(self) -> str:
         return "Any"
 
@@ -24,9 +30,15 @@ class AnyChecker(TypeChecker):
 
 
 class SelfChecker(TypeChecker):
+    def is_identity_preserving(self) -> bool:
+        return True
+
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         return arg
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return True, arg
+
     def describe(self) -> str:
         return "Self"
 
@@ -3,11 +3,12 @@ import sys
 from collections.abc import Callable as AbcCallable
 from typing import Any, Optional, Callable, Union, Tuple
 
-from untypy.error import UntypyTypeError, UntypyAttributeError, Frame, Location
+from untypy.error import UntypyTypeError, UntypyAttributeError, Frame, Location, LazyCallerFrame
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext, WrappedFunction, \
     WrappedFunctionContextProvider
 # These Types are prefixed with an underscore...
 from untypy.util import ArgumentExecutionContext, ReturnExecutionContext
+from untypy.util.stats import GlobalStats, counted, function_name
 
 CallableTypeOne = type(Callable[[], None])
 CallableTypeTwo = type(AbcCallable[[], None])
@@ -52,11 +53,19 @@ class CallableChecker(TypeChecker):
         return [Callable]
 
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if type(arg) is TypedCallable and arg.return_checker is self.return_checker \
+                and arg.argument_checker == self.argument_checker:
+            # Already checked the same way. A wrapper of the same callable keeps the checks flat
+            # and blames this boundary.
+            return TypedCallable(arg.inner, self.return_checker, self.argument_checker, ctx)
         if callable(arg):
             return TypedCallable(arg, self.return_checker, self.argument_checker, ctx)
         else:
             raise ctx.wrap(UntypyTypeError(arg, self.describe()))
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return callable(arg), arg
+
     def describe(self) -> str:
         arguments = ", ".join(map(lambda e: e.describe(), self.argument_checker))
         return f"Callable[[{arguments}], {self.return_checker.describe()}]"
@@ -80,35 +89,50 @@ class TypedCallable(Callable, WrappedFunction):
         self.argument_checker = argument_checker
         self.ctx = ctx
         self.fn = WrappedFunction.find_original(self.inner)
+        self.capture_caller = any(checker.may_be_wrapped() for checker in argument_checker)
+        self.contexts = None
         setattr(self, '__wf', self)
 
     def __call__(self, *args, **kwargs):
-        caller = sys._getframe(1)
+        contexts = self.contexts
+        if contexts is None:
+            contexts = self.contexts = TypedCallableContexts(self)
+
+        if self.capture_caller:
+            caller = sys._getframe(1)
+            argument_ctxs = [TypedCallableArgumentExecutionContext(self, caller, i, self.ctx)
+                             for i in range(len(self.argument_checker))]
+        else:
+            argument_ctxs = contexts.arguments
 
+        counters = GlobalStats.counters(self.stats_name()) if GlobalStats.enabled else None
         new_args = []
-        i = 0
-        for (arg, checker) in zip(args, self.argument_checker):
-            res = checker.check_and_wrap(arg, TypedCallableArgumentExecutionContext(self, caller, i, self.ctx))
-            new_args.append(res)
-            i += 1
+        if counters is None:
+            for (arg, checker, ctx) in zip(args, self.argument_checker, argument_ctxs):
+                new_args.append(checker.check_and_wrap(arg, ctx))
+        else:
+            counters.calls += 1
+            for (arg, checker, ctx) in zip(args, self.argument_checker, argument_ctxs):
+                new_args.append(counted(counters, checker, arg, ctx))
 
         if isinstance(self.inner, WrappedFunction):
-            (args, kwargs, bind2) = self.inner.wrap_arguments(lambda n:
-                                                              TypedCallableIncompatibleSingature(self, n,
-                                                                                                 caller,
-                                                                                                 self.ctx),
-                                                              args, kwargs)
+            (args, kwargs, bind2) = self.inner.wrap_arguments(contexts.incompatible.__getitem__, args, kwargs)
 
         ret = self.fn(*new_args, **kwargs)
         if isinstance(self.inner, WrappedFunction):
-            ret = self.inner.wrap_return(ret, bind2, TypedCallableReturnExecutionContext(self.ctx, self, True))
+            ret = self.inner.wrap_return(ret, bind2, contexts.inner_return)
 
-        ret = self.return_checker.check_and_wrap(ret, TypedCallableReturnExecutionContext(self.ctx, self, False))
+        if counters is not None:
+            return counted(counters, self.return_checker, ret, contexts.outer_return)
+        ret = self.return_checker.check_and_wrap(ret, contexts.outer_return)
         return ret
 
     def get_original(self):
         return self.inner
 
+    def stats_name(self) -> str:
+        return f"{function_name(self.fn)} as {self.describe()}"
+
     def wrap_arguments(self, ctxprv: WrappedFunctionContextProvider, args, kwargs):
         raise NotImplementedError
 
@@ -123,6 +147,33 @@ class TypedCallable(Callable, WrappedFunction):
         raise NotImplementedError
 
 
+class TypedCallableContexts:
+    """
+    Execution contexts of a TypedCallable, created on its first call and shared by all
+    later calls. The caller of the callable is looked up only when an error is reported.
+    """
+
+    def __init__(self, tc: TypedCallable):
+        caller = LazyCallerFrame(TypedCallable.__call__.__code__)
+        self.arguments = [TypedCallableArgumentExecutionContext(tc, caller, i, tc.ctx)
+                          for i in range(len(tc.argument_checker))]
+        self.incompatible = TypedCallableIncompatibleSingatures(tc, caller)
+        self.inner_return = TypedCallableReturnExecutionContext(tc.ctx, tc, True)
+        self.outer_return = TypedCallableReturnExecutionContext(tc.ctx, tc, False)
+
+
+class TypedCallableIncompatibleSingatures(dict):
+    def __init__(self, tc: TypedCallable, caller: LazyCallerFrame):
+        super().__init__()
+        self.tc = tc
+        self.caller = caller
+
+    def __missing__(self, arg_name):
+        ctx = TypedCallableIncompatibleSingature(self.tc, arg_name, self.caller, self.tc.ctx)
+        self[arg_name] = ctx
+        return ctx
+
+
 class TypedCallableIncompatibleSingature(ExecutionContext):
 
     def __init__(self, tc: TypedCallable, arg_name: str, caller, upper: ExecutionContext):
@@ -0,0 +1,100 @@
+import weakref
+from collections import namedtuple
+from typing import Any, Optional, Dict, TypeVar, List, Tuple, ForwardRef
+
+from untypy.error import Location
+from untypy.interfaces import TypeChecker
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'uncacheable', 'evictions', 'size'])
+
+
+class CheckerCache:
+    """
+    Remembers checkers created by DefaultCreationContext.find_checker, so functions
+    sharing an annotation also share one checker tree.
+
+    Checkers which asked their CreationContext for the declared location (e.g. to blame
+    callers of list.append) are only reused for the same declared location.
+    """
+
+    def __init__(self):
+        self.shared: Dict[Any, TypeChecker] = dict()
+        self.located: Dict[Any, TypeChecker] = dict()
+        self.known_classes: Dict[Tuple[str, str], weakref.ref] = dict()
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_of(annotation: Any, typevars: Dict[TypeVar, Any], checkedpkgprefixes: List[str]) -> Optional[Any]:
+        # Forward references are resolved relative to the module they are written in.
+        if isinstance(annotation, (str, ForwardRef)):
+            return None
+        try:
+            key = (annotation, frozenset(typevars.items()), tuple(checkedpkgprefixes))
+            hash(key)
+            return key
+        except TypeError:  # unhashable annotation or typevar binding
+            return None
+
+    @staticmethod
+    def location_key(location: Optional[Location]) -> Any:
+        if location is None:
+            return None
+        return location.file, location.line_no
+
+    def lookup(self, key: Any, location: Optional[Location]) -> Tuple[Optional[TypeChecker], bool]:
+        """
+        Returns the cached checker (or None) and if it depends on the declared location.
+        """
+        checker = self.shared.get(key)
+        if checker is not None:
+            self.hits += 1
+            return checker, False
+        checker = self.located.get((key, self.location_key(location)))
+        if checker is not None:
+            self.hits += 1
+            return checker, True
+        self.misses += 1
+        return None, False
+
+    def store(self, key: Any, location: Optional[Location], checker: TypeChecker, uses_location: bool) -> None:
+        if uses_location:
+            self.located[(key, self.location_key(location))] = checker
+        else:
+            self.shared[key] = checker
+
+    def class_defined(self, clas: type) -> None:
+        """
+        Drops all cached checkers when a class is redefined under the same name,
+        as checkers may refer to the previous definition.
+        """
+        name = (getattr(clas, '__module__', None), getattr(clas, '__qualname__', None))
+        previous = self.known_classes.get(name)
+        if previous is not None and previous() is not None and previous() is not clas:
+            self.clear()
+        try:
+            self.known_classes[name] = weakref.ref(clas)
+        except TypeError:
+            pass
+
+    def clear(self) -> None:
+        self.evictions += len(self.shared) + len(self.located)
+        self.shared.clear()
+        self.located.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.uncacheable, self.evictions,
+                         len(self.shared) + len(self.located))
+
+
+GlobalCheckerCache = CheckerCache()
+
+
+def checker_cache_info() -> CacheInfo:
+    return GlobalCheckerCache.info()
+
+
+def clear_checker_cache() -> None:
+    GlobalCheckerCache.clear()
@@ -0,0 +1,66 @@
+from collections import namedtuple
+from typing import Dict, Optional
+
+from untypy.interfaces import TypeChecker
+from untypy.util.stats import GlobalStats
+
+CollectionDecisions = namedtuple('CollectionDecisions', ['eager', 'lazy'])
+
+
+class CollectionPolicy:
+    """
+    Decides how collections (lists, dicts and sets) are checked when they are passed.
+
+    Collections with less than eager_limit elements are checked completely at once. If their
+    element checkers return the elements unchanged, the original collection is returned
+    instead of a proxy. Larger collections are wrapped in a proxy, which checks the elements
+    when they are used. limits overrides eager_limit for a kind of collection
+    ('list', 'dict', 'set', 'frozenset', 'collection', 'sequence', 'abstractset', 'mapping',
+    'mutablemapping').
+
+    The decisions are only counted while statistics are enabled (untypy.enable_stats()).
+
+    Note: Unwrapped collections are not checked anymore, when they are changed later.
+    """
+
+    def __init__(self, eager_limit: int = 0, limits: Optional[Dict[str, int]] = None):
+        self.eager_limit = eager_limit
+        self.limits: Dict[str, int] = dict() if limits is None else dict(limits)
+        self.decisions: Dict[str, list[int]] = dict()
+
+    def is_eager(self, kind: str, size: int) -> bool:
+        eager = size < self.limits.get(kind, self.eager_limit)
+        if GlobalStats.enabled:
+            counts = self.decisions.get(kind)
+            if counts is None:
+                counts = self.decisions[kind] = [0, 0]
+            counts[0 if eager else 1] += 1
+        return eager
+
+    def stats(self) -> Dict[str, CollectionDecisions]:
+        return {kind: CollectionDecisions(*counts) for (kind, counts) in self.decisions.items()}
+
+
+GlobalCollectionPolicy = CollectionPolicy()
+
+
+def scan(checker: TypeChecker, values, ctx) -> bool:
+    """
+    Checks all values, returns True if they are returned unchanged by the checker.
+    """
+    if checker.is_identity_preserving():
+        exact = checker.exact_types()
+        if exact is not None and frozenset(exact).issuperset(map(type, values)):
+            return True
+    for v in values:
+        checker.check_and_wrap(v, ctx)
+    return checker.is_identity_preserving()
+
+
+def set_collection_policy(eager_limit: int = 0, limits: Dict[str, int] = {}) -> None:
+    GlobalCollectionPolicy.eager_limit = eager_limit
+    GlobalCollectionPolicy.limits = dict(limits)
+
+
+def collection_stats() -> Dict[str, CollectionDecisions]:
+    return GlobalCollectionPolicy.stats()
@@ -0,0 +1,380 @@
+import collections.abc
+import sys
+from typing import Any, Optional, Tuple
+
+from untypy.error import UntypyTypeError, Location, LazyCallerFrame
+from untypy.impl.any import AnyChecker
+from untypy.impl.collection_policy import GlobalCollectionPolicy, scan
+from untypy.impl.dict import DictExecutionContext, DictCallerExecutionContext
+from untypy.impl.set import SetExecutionContext
+from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
+
+CollectionNames = {
+    collections.abc.Iterable: "Iterable",
+    collections.abc.Collection: "Collection",
+    collections.abc.Sequence: "Sequence",
+    collections.abc.Set: "AbstractSet",
+}
+
+MappingNames = {
+    collections.abc.Mapping: "Mapping",
+    collections.abc.MutableMapping: "MutableMapping",
+}
+
+
+class CollectionsAbcFactory(TypeCheckerFactory):
+
+    def create_from(self, annotation: Any, ctx: CreationContext) -> Optional[TypeChecker]:
+        origin = getattr(annotation, '__origin__', None)
+        args = getattr(annotation, '__args__', None)
+        if args is None:
+            return None
+        if origin in CollectionNames:
+            assert len(args) == 1
+            inner = ctx.find_checker(args[0])
+            if inner is None:
+                return None
+            return CollectionChecker(origin, inner, ctx.declared_location())
+        if origin in MappingNames:
+            assert len(args) == 2
+            key = ctx.find_checker(args[0])
+            value = ctx.find_checker(args[1])
+            if key is None or value is None:
+                return None
+            return MappingChecker(origin, key, value, ctx.declared_location())
+        return None
+
+
+def _checked(values, checker: TypeChecker, exact: Optional[frozenset], ctx: ExecutionContext):
+    if exact is None:
+        for x in values:
+            yield checker.check_and_wrap(x, ctx)
+    else:
+        for x in values:
+            if type(x) in exact:
+                yield x
+            else:
+                yield checker.check_and_wrap(x, ctx)
+
+
+def _exact(checker: TypeChecker) -> Optional[frozenset]:
+    exact = checker.exact_types() if checker.is_identity_preserving() else None
+    return None if exact is None else frozenset(exact)
+
+
+def _unwrap(other):
+    if isinstance(other, (TypedIterable, TypedMapping)):
+        return other.inner
+    return other
+
+
+class CollectionChecker(TypeChecker):
+    """
+    Checks Iterable[T], Collection[T], Sequence[T] and AbstractSet[T]. Values are wrapped
+    in a read-only proxy, which checks the elements it returns. Iterators passed as an
+    Iterable[T] are wrapped like Iterator[T].
+    """
+    inner: TypeChecker
+    declared: Location
+
+    def __init__(self, origin: type, inner: TypeChecker, declared: Location):
+        self.origin = origin
+        self.inner = inner
+        self.declared = declared
+        self.name = CollectionNames[origin]
+        self.kind = self.name.lower()
+        self.proxy = CollectionProxies[origin]
+        self.exact = _exact(inner)
+
+    def may_be_wrapped(self) -> bool:
+        return True
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if not isinstance(arg, self.origin):
+            raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        if type(arg) is self.proxy and arg.checker.inner is self.inner:
+            # Already checked the same way. A proxy over the same collection keeps the checks flat,
+            # values it reads are blamed as before, values written through it on this boundary.
+            return self.proxy(arg.inner, self, arg.ctx)
+        if type(self.inner) is AnyChecker:
+            return arg
+
+        ctx = SetExecutionContext(ctx, self.name)
+        if isinstance(arg, collections.abc.Iterator):
+            return _checked(arg, self.inner, self.exact, ctx)
+        if self.origin is not collections.abc.Iterable and GlobalCollectionPolicy.is_eager(self.kind, len(arg)) \
+                and scan(self.inner, arg, ctx):
+            return arg
+        return self.proxy(arg, self, ctx)
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return isinstance(arg, self.origin), arg
+
+    def base_type(self) -> list[Any]:
+        return [self.origin]
+
+    def describe(self) -> str:
+        return f"{self.name}[{self.inner.describe()}]"
+
+
+class TypedIterable(collections.abc.Iterable):
+    inner: Any
+    checker: CollectionChecker
+    ctx: ExecutionContext
+
+    def __init__(self, inner, checker: CollectionChecker, ctx: ExecutionContext):
+        self.inner = inner
+        self.checker = checker
+        self.ctx = ctx
+
+    def __iter__(self):
+        return _checked(self.inner, self.checker.inner, self.checker.exact, self.ctx)
+
+    def __eq__(self, other):
+        return self.inner.__eq__(_unwrap(other))
+
+    def __ne__(self, other):
+        return self.inner.__ne__(_unwrap(other))
+
+    def __hash__(self):
+        return hash(self.inner)
+
+    def __repr__(self):
+        return self.inner.__repr__()
+
+    def __str__(self):
+        return self.inner.__str__()
+
+
+class TypedCollection(TypedIterable, collections.abc.Collection):
+
+    def __len__(self):
+        return self.inner.__len__()
+
+    def __contains__(self, item):
+        return self.inner.__contains__(item)
+
+
+class TypedSequence(TypedCollection, collections.abc.Sequence):
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TypedSequence(self.inner[index], self.checker, self.ctx)
+        return self.checker.inner.check_and_wrap(self.inner[index], self.ctx)
+
+    def __reversed__(self):
+        return _checked(reversed(self.inner), self.checker.inner, self.checker.exact, self.ctx)
+
+    def index(self, *args):
+        return self.inner.index(*args)
+
+    def count(self, value):
+        return self.inner.count(value)
+
+
+class TypedAbstractSet(TypedCollection, collections.abc.Set):
+    # Set operations build plain sets.
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __eq__(self, other):
+        return collections.abc.Set.__eq__(self, _unwrap(other))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.inner)
+
+
+CollectionProxies = {
+    collections.abc.Iterable: TypedIterable,
+    collections.abc.Collection: TypedCollection,
+    collections.abc.Sequence: TypedSequence,
+    collections.abc.Set: TypedAbstractSet,
+}
+
+
+class MappingChecker(TypeChecker):
+    """
+    Checks Mapping[K, V] and MutableMapping[K, V]. Like dict[K, V], keys are only checked,
+    never wrapped, as wrapped keys would not be found again.
+    """
+    key: TypeChecker
+    value: TypeChecker
+    declared: Location
+
+    def __init__(self, origin: type, key: TypeChecker, value: TypeChecker, declared: Location):
+        self.origin = origin
+        self.key = key
+        self.value = value
+        self.declared = declared
+        self.name = MappingNames[origin]
+        self.kind = self.name.lower()
+        self.proxy = TypedMutableMapping if origin is collections.abc.MutableMapping else TypedMapping
+        self.key_exact = _exact(key)
+        self.value_exact = _exact(value)
+        self.key_prefix = f"{self.name}["
+        self.key_suffix = f", {value.describe()}]"
+        self.value_prefix = f"{self.name}[{key.describe()}, "
+        self.value_suffix = "]"
+
+        if key.may_be_wrapped():
+            self.caller_key_ctx = None
+        else:
+            self.caller_key_ctx = DictCallerExecutionContext(TypedMutableMapping.caller, declared, self.key_prefix,
+                                                             self.key_suffix)
+        if value.may_be_wrapped():
+            self.caller_value_ctx = None
+        else:
+            self.caller_value_ctx = DictCallerExecutionContext(TypedMutableMapping.caller, declared,
+                                                               self.value_prefix, self.value_suffix)
+
+    def may_be_wrapped(self) -> bool:
+        return True
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if not isinstance(arg, self.origin):
+            raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        if type(arg) is self.proxy and arg.checker.key is self.key and arg.checker.value is self.value:
+            # Already checked the same way. A proxy over the same mapping keeps the checks flat,
+            # values it reads are blamed as before, values written through it on this boundary.
+            return self.proxy(arg.inner, self, arg.key_ctx, arg.value_ctx)
+        if type(self.key) is AnyChecker and type(self.value) is AnyChecker:
+            return arg
+
+        key_ctx = DictExecutionContext(ctx, self.key_prefix, self.key_suffix)
+        value_ctx = DictExecutionContext(ctx, self.value_prefix, self.value_suffix)
+        if GlobalCollectionPolicy.is_eager(self.kind, len(arg)):
+            keys_unchanged = scan(self.key, arg.keys(), key_ctx)
+            if scan(self.value, arg.values(), value_ctx) and keys_unchanged:
+                return arg
+        return self.proxy(arg, self, key_ctx, value_ctx)
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return isinstance(arg, self.origin), arg
+
+    def base_type(self) -> list[Any]:
+        return [self.origin]
+
+    def describe(self) -> str:
+        return f"{self.name}[{self.key.describe()}, {self.value.describe()}]"
+
+
+class TypedMapping(collections.abc.Mapping):
+    inner: Any
+    checker: MappingChecker
+    key_ctx: ExecutionContext
+    value_ctx: ExecutionContext
+
+    def __init__(self, inner, checker: MappingChecker, key_ctx: ExecutionContext, value_ctx: ExecutionContext):
+        self.inner = inner
+        self.checker = checker
+        self.key_ctx = key_ctx
+        self.value_ctx = value_ctx
+
+    def __getitem__(self, key):
+        return self.checker.value.check_and_wrap(self.inner[key], self.value_ctx)
+
+    def __iter__(self):
+        return _checked(self.inner, self.checker.key, self.checker.key_exact, self.key_ctx)
+
+    def __len__(self):
+        return self.inner.__len__()
+
+    def __contains__(self, key):
+        return self.inner.__contains__(key)
+
+    def items(self):
+        return TypedItemsView(self)
+
+    def values(self):
+        return TypedValuesView(self)
+
+    def __eq__(self, other):
+        return self.inner.__eq__(_unwrap(other))
+
+    def __ne__(self, other):
+        return self.inner.__ne__(_unwrap(other))
+
+    def __hash__(self):
+        return hash(self.inner)
+
+    def __repr__(self):
+        return self.inner.__repr__()
+
+    def __str__(self):
+        return self.inner.__str__()
+
+
+class TypedMutableMapping(TypedMapping, collections.abc.MutableMapping):
+
+    def _caller_ctx(self):
+        checker = self.checker
+        key_ctx = checker.caller_key_ctx
+        value_ctx = checker.caller_value_ctx
+        if key_ctx is None or value_ctx is None:
+            # the caller of the proxy method is captured, as a wrapped value may keep the context
+            frame = sys._getframe(2)
+            if key_ctx is None:
+                key_ctx = DictCallerExecutionContext(frame, checker.declared, checker.key_prefix, checker.key_suffix)
+            if value_ctx is None:
+                value_ctx = DictCallerExecutionContext(frame, checker.declared, checker.value_prefix,
+                                                       checker.value_suffix)
+        return key_ctx, value_ctx
+
+    def _set(self, key, value, key_ctx, value_ctx) -> None:
+        self.checker.key.check_and_wrap(key, key_ctx)
+        self.inner[key] = self.checker.value.check_and_wrap(value, value_ctx)
+
+    def __setitem__(self, key, value):
+        self._set(key, value, *self._caller_ctx())
+
+    def __delitem__(self, key):
+        del self.inner[key]
+
+    def update(self, other=(), /, **kwargs):
+        (key_ctx, value_ctx) = self._caller_ctx()
+        other = _unwrap(other)
+        if hasattr(other, 'keys'):
+            for key in other.keys():
+                self._set(key, other[key], key_ctx, value_ctx)
+        else:
+            for (key, value) in other:
+                self._set(key, value, key_ctx, value_ctx)
+        for (key, value) in kwargs.items():
+            self._set(key, value, key_ctx, value_ctx)
+
+    def setdefault(self, key, default=None):
+        if key in self.inner:
+            return self[key]
+        self._set(key, default, *self._caller_ctx())
+        return self[key]
+
+    def clear(self):
+        self.inner.clear()
+
+    __hash__ = None
+
+
+TypedMutableMapping.caller = LazyCallerFrame(TypedMutableMapping.__setitem__.__code__,
+                                             TypedMutableMapping.update.__code__,
+                                             TypedMutableMapping.setdefault.__code__)
+
+
+class TypedItemsView(collections.abc.ItemsView):
+
+    def __iter__(self):
+        mapping = self._mapping
+        key = mapping.checker.key
+        value = mapping.checker.value
+        for (k, v) in mapping.inner.items():
+            yield key.check_and_wrap(k, mapping.key_ctx), value.check_and_wrap(v, mapping.value_ctx)
+
+
+class TypedValuesView(collections.abc.ValuesView):
+
+    def __iter__(self):
+        mapping = self._mapping
+        return _checked(mapping.inner.values(), mapping.checker.value, mapping.checker.value_exact, mapping.value_ctx)
@@ -0,0 +1,186 @@
+from typing import Any, Optional, Tuple, Callable
+
+from untypy.impl.any import AnyChecker
+from untypy.impl.annotated import AnnotatedChecker, AnnotatedCheckerCallable, AnnotatedCheckerContainer
+from untypy.impl.literal import LiteralChecker
+from untypy.impl.none import NoneChecker
+from untypy.impl.optional import OptionalChecker
+from untypy.impl.set import FrozenSetChecker
+from untypy.impl.simple import SimpleChecker
+from untypy.impl.tuple import TupleChecker, VariadicTupleChecker
+from untypy.impl.union import UnionChecker
+from untypy.interfaces import TypeChecker, ExecutionContext
+
+
+class CheckerCompiler:
+    """
+    Generates the source of a single function, which returns True if a value is accepted
+    unchanged by a tree of checkers, which check values completely at once.
+    """
+
+    def __init__(self):
+        self.closure = dict()
+        self.variables = 0
+
+    def constant(self, value: Any) -> str:
+        name = f'_untypy_c{len(self.closure)}'
+        self.closure[name] = value
+        return name
+
+    def variable(self) -> str:
+        self.variables += 1
+        return f'_untypy_v{self.variables}'
+
+    def all_of(self, checker: TypeChecker, var: str) -> Optional[str]:
+        item = self.variable()
+        check = self.expression(checker, item)
+        if check is None:
+            return None
+        exact = checker.exact_types() if checker.is_identity_preserving() else None
+        if exact is not None:
+            # vectorized scan first, element wise only if it fails
+            check = f'{self.constant(frozenset(exact))}.issuperset(map(type, {var})) or ' \
+                    f'all({check} for {item} in {var})'
+        else:
+            check = f'all({check} for {item} in {var})'
+        return check
+
+    def expression(self, checker: TypeChecker, var: str) -> Optional[str]:
+        """
+        An expression, which is true if the value in var is accepted unchanged by checker.
+        None if the checker cannot be compiled.
+        """
+        if type(checker) is CompiledChecker:
+            checker = checker.checker
+        if not checker.is_identity_preserving():
+            return None
+
+        ty = type(checker)
+        if ty is AnyChecker:
+            return 'True'
+        if ty is NoneChecker:
+            return f'{var} is None'
+        if ty is SimpleChecker:
+            annotation = self.constant(checker.annotation)
+            if checker.annotation is float:
+                return f'(type({var}) is int or isinstance({var}, {annotation}))'
+            return f'(type({var}) is {annotation} or isinstance({var}, {annotation}))'
+        if ty is LiteralChecker:
+            return f'{var} in {self.constant(checker.inner)}'
+        if ty is OptionalChecker:
+            inner = self.expression(checker.inner, var)
+            return None if inner is None else f'({var} is None or {inner})'
+        if ty is UnionChecker:
+            alternatives = [self.expression(c, var) for c in checker.inner]
+            if None in alternatives:
+                return None
+            return f"({' or '.join(alternatives)})"
+        if ty is TupleChecker:
+            checks = [f'isinstance({var}, tuple)', f'len({var}) == {len(checker.inner)}']
+            for (idx, inner) in enumerate(checker.inner):
+                check = self.expression(inner, f'{var}[{idx}]')
+                if check is None:
+                    return None
+                checks.append(check)
+            return f"({' and '.join(checks)})"
+        if ty is VariadicTupleChecker:
+            check = self.all_of(checker.inner, var)
+            return None if check is None else f'(isinstance({var}, tuple) and ({check}))'
+        if ty is FrozenSetChecker:
+            check = self.all_of(checker.inner, var)
+            return None if check is None else f'(isinstance({var}, frozenset) and ({check}))'
+        if ty is AnnotatedChecker:
+            checks = [self.expression(checker.inner, var)]
+            if checks[0] is None:
+                return None
+            for meta in checker.meta:
+                if type(meta) is AnnotatedCheckerCallable:
+                    checks.append(f'{self.constant(meta.callable)}({var})')
+                elif type(meta) is AnnotatedCheckerContainer:
+                    checks.append(f'{var} in {self.constant(meta.cont)}')
+                else:
+                    return None
+            return f"({' and '.join(checks)})"
+        return None
+
+    def function(self, checker: TypeChecker) -> Optional[Tuple[Callable[[Any], bool], str]]:
+        check = self.expression(checker, '_untypy_arg')
+        if check is None:
+            return None
+        source = '\n'.join([
+            f"def _untypy_create({', '.join(self.closure)}):",
+            f"  def validate(_untypy_arg):",
+            f"    return bool({check})",
+            f"  return validate",
+        ])
+        namespace = {}
+        exec(compile(source, f"<untypy validator of {checker.describe()}>", 'exec'), namespace)
+        return namespace['_untypy_create'](**self.closure), source
+
+
+class CompiledChecker(TypeChecker):
+    """
+    Checks values with a generated function first. Only if it rejects a value, the
+    original checkers are asked, so errors are reported with their contexts.
+    The generated code is in source.
+    """
+    checker: TypeChecker
+    source: str
+
+    def __init__(self, checker: TypeChecker, validate: Callable[[Any], bool], source: str):
+        self.checker = checker
+        self.validate = validate
+        self.source = source
+
+    def may_be_wrapped(self) -> bool:
+        return False
+
+    def is_identity_preserving(self) -> bool:
+        return True
+
+    def exact_types(self) -> Optional[list[type]]:
+        return self.checker.exact_types()
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return self.checker.indexed_types()
+
+    def base_type(self) -> list[Any]:
+        return self.checker.base_type()
+
+    def base_type_priority(self) -> int:
+        return self.checker.base_type_priority()
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if self.validate(arg):
+            return arg
+        return self.checker.check_and_wrap(arg, ctx)
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        if self.validate(arg):
+            return True, arg
+        return self.checker.try_check(arg)
+
+    def describe(self) -> str:
+        return self.checker.describe()
+
+
+# Only trees of these checkers are compiled, the others are checked quickly enough on their own.
+CompiledRoots = (TupleChecker, VariadicTupleChecker, UnionChecker, OptionalChecker, AnnotatedChecker,
+                 FrozenSetChecker)
+
+
+def compile_checker(checker: TypeChecker) -> TypeChecker:
+    """
+    Returns a CompiledChecker for checker, if it checks values completely at once
+    and all checkers in it can be compiled. Otherwise, checker is returned.
+    """
+    if type(checker) not in CompiledRoots or not checker.is_identity_preserving():
+        return checker
+    if checker.exact_types() is not None:
+        # the type of a value is enough, like for Optional[int]
+        return checker
+    compiled = CheckerCompiler().function(checker)
+    if compiled is None:
+        return checker
+    (validate, source) = compiled
+    return CompiledChecker(checker, validate, source)
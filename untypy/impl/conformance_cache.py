@@ -0,0 +1,97 @@
+import weakref
+from collections import namedtuple
+from typing import Any, Optional, Dict, TypeVar, Iterable, Callable, Tuple
+
+ConformanceInfo = namedtuple('ConformanceInfo', ['hits', 'misses', 'invalidations', 'uncacheable', 'size'])
+
+
+def _reference(value: Any) -> Any:
+    # A weak reference equals another one while both referents are alive and equal,
+    # a dead one only itself. So a replaced and collected attribute never matches.
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return id(value)
+
+
+class ConformanceCache:
+    """
+    Remembers whether a class conforms structurally to a protocol (with bound typevars),
+    so the signatures of its methods are only compared once per process.
+
+    Each entry remembers the attributes of the class it was computed from. If one of them
+    was replaced since (e.g. by monkey patching), the class is checked again. The attributes
+    are only referenced weakly, as they may refer to the class (e.g. by super()).
+
+    Results are kept for at most limit classes, the oldest ones are dropped first.
+    """
+    limit: int = 1024
+
+    def __init__(self):
+        self.entries = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.uncacheable = 0
+
+    @staticmethod
+    def fingerprint(clas: type, names: Iterable[str]) -> Tuple[Any, ...]:
+        out = []
+        for name in names:
+            for c in clas.__mro__:
+                if name in c.__dict__:
+                    out.append(_reference(c.__dict__[name]))
+                    break
+            else:
+                out.append(None)
+        return tuple(out)
+
+    def conformance(self, proto: type, clas: type, typevars: Dict[TypeVar, Any], names: Iterable[str],
+                    check: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Returns None if clas conforms to proto, otherwise a note why it does not.
+        check is only called, if the result is not known yet.
+        """
+        try:
+            key = (proto, frozenset(typevars.items()))
+            hash(key)
+            per_class = self.entries.get(clas)
+            if per_class is None:
+                per_class = dict()
+                if len(self.entries) >= self.limit:
+                    oldest = next(iter(self.entries.keys()), None)
+                    if oldest is not None:
+                        del self.entries[oldest]
+                self.entries[clas] = per_class
+        except TypeError:  # unhashable typevar binding or class without weak references
+            self.uncacheable += 1
+            return check()
+
+        names = list(names)
+        fingerprint = self.fingerprint(clas, names)
+        entry = per_class.get(key)
+        if entry is not None:
+            if entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+            self.invalidations += 1
+        else:
+            self.misses += 1
+
+        result = check()
+        per_class[key] = (fingerprint, result)
+        return result
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def info(self) -> ConformanceInfo:
+        size = sum(len(per_class) for per_class in self.entries.values())
+        return ConformanceInfo(self.hits, self.misses, self.invalidations, self.uncacheable, size)
+
+
+GlobalConformanceCache = ConformanceCache()
+
+
+def conformance_cache_info() -> ConformanceInfo:
+    return GlobalConformanceCache.info()
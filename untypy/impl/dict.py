@@ -0,0 +1,424 @@
+import sys
+from types import GenericAlias
+from typing import Any, Optional, Dict, Tuple
+
+from untypy.error import UntypyTypeError, Frame, Location, LazyCallerFrame
+from untypy.impl.collection_policy import GlobalCollectionPolicy, scan
+from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
+
+
+class DictFactory(TypeCheckerFactory):
+
+    def create_from(self, annotation: Any, ctx: CreationContext) -> Optional[TypeChecker]:
+        if (type(annotation) is GenericAlias or type(annotation) is type(Dict[int, int])) \
+                and annotation.__origin__ == dict:
+            assert len(annotation.__args__) == 2
+            key = ctx.find_checker(annotation.__args__[0])
+            value = ctx.find_checker(annotation.__args__[1])
+            if key is None or value is None:
+                return None
+            return DictChecker(key, value, ctx.declared_location())
+        else:
+            return None
+
+
+class DictChecker(TypeChecker):
+    key: TypeChecker
+    value: TypeChecker
+    declared: Location
+
+    def __init__(self, key: TypeChecker, value: TypeChecker, declared: Location):
+        self.key = key
+        self.value = value
+        self.declared = declared
+        self.name = f"dict[{key.describe()}, {value.describe()}]"
+        self.key_prefix = "dict["
+        self.key_suffix = f", {value.describe()}]"
+        self.value_prefix = f"dict[{key.describe()}, "
+        self.value_suffix = "]"
+
+        if key.may_be_wrapped():
+            self.caller_key_ctx = None
+        else:
+            self.caller_key_ctx = DictCallerExecutionContext(TypedDict.caller, declared, self.key_prefix,
+                                                             self.key_suffix)
+        if value.may_be_wrapped():
+            self.caller_value_ctx = None
+        else:
+            self.caller_value_ctx = DictCallerExecutionContext(TypedDict.caller, declared, self.value_prefix,
+                                                               self.value_suffix)
+
+    def may_be_wrapped(self) -> bool:
+        return True
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if not issubclass(type(arg), dict):
+            raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        if type(arg) is TypedDict and arg.checker.key is self.key and arg.checker.value is self.value:
+            # Already checked the same way. A proxy over the same dict keeps the checks flat,
+            # values it reads are blamed as before, values written through it on this boundary.
+            return TypedDict(arg.inner, self, arg.key_ctx, arg.value_ctx)
+
+        key_ctx = DictExecutionContext(ctx, self.key_prefix, self.key_suffix)
+        value_ctx = DictExecutionContext(ctx, self.value_prefix, self.value_suffix)
+        if GlobalCollectionPolicy.is_eager('dict', len(arg)):
+            keys_unchanged = scan(self.key, arg.keys(), key_ctx)
+            if scan(self.value, arg.values(), value_ctx) and keys_unchanged:
+                return arg
+
+        return TypedDict(arg, self, key_ctx, value_ctx)
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return issubclass(type(arg), dict), arg
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return [dict]
+
+    def base_type(self) -> list[Any]:
+        return [dict]
+
+    def describe(self) -> str:
+        return self.name
+
+
+class DictExecutionContext(ExecutionContext):
+    upper: ExecutionContext
+
+    def __init__(self, upper: ExecutionContext, prefix: str, suffix: str):
+        self.upper = upper
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        next_type, indicator = err.next_type_and_indicator()
+
+        err = err.with_frame(Frame(
+            f"{self.prefix}{next_type}{self.suffix}",
+            (" " * len(self.prefix) + indicator),
+            None,
+            None
+        ))
+        return self.upper.wrap(err)
+
+
+class DictCallerExecutionContext(ExecutionContext):
+    declared: Location
+
+    def __init__(self, stack, declared: Location, prefix: str, suffix: str):
+        self.stack = stack
+        self.declared = declared
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        next_type, indicator = err.next_type_and_indicator()
+        return err.with_frame(Frame(
+            f"{self.prefix}{next_type}{self.suffix}",
+            (" " * len(self.prefix) + indicator),
+            declared=self.declared,
+            responsable=Location.from_stack(self.stack)
+        ))
+
+
+def _unwrap(other):
+    if isinstance(other, TypedDict):
+        return other.inner
+    return other
+
+
+def _pairs(other):
+    # like dict.update, mappings are read by their keys, other iterables are key value pairs
+    other = _unwrap(other)
+    if hasattr(other, 'keys'):
+        return ((k, other[k]) for k in other.keys())
+    return other
+
+
+class TypedDict(dict):
+    inner: dict
+    checker: DictChecker
+    key_ctx: ExecutionContext
+    value_ctx: ExecutionContext
+
+    def __init__(self, inner, checker, key_ctx, value_ctx):
+        super().__init__()
+        self.inner = inner
+        self.checker = checker
+        self.key_ctx = key_ctx
+        self.value_ctx = value_ctx
+
+    def _caller_ctx(self):
+        checker = self.checker
+        key_ctx = checker.caller_key_ctx
+        value_ctx = checker.caller_value_ctx
+        if key_ctx is None or value_ctx is None:
+            # the caller of the proxy method is captured, as a wrapped value may keep the context
+            frame = sys._getframe(2)
+            if key_ctx is None:
+                key_ctx = DictCallerExecutionContext(frame, checker.declared, checker.key_prefix, checker.key_suffix)
+            if value_ctx is None:
+                value_ctx = DictCallerExecutionContext(frame, checker.declared, checker.value_prefix,
+                                                       checker.value_suffix)
+        return key_ctx, value_ctx
+
+    def _insert_all(self, pairs, key_ctx, value_ctx) -> None:
+        key = self.checker.key
+        value = self.checker.value
+        inner = self.inner
+        for (k, v) in pairs:
+            key.check_and_wrap(k, key_ctx)
+            inner[k] = value.check_and_wrap(v, value_ctx)
+
+    # Values and keys passed by the caller.
+    # Keys are only checked, as wrapped keys would not be found again.
+    def __setitem__(self, key, value):
+        (key_ctx, value_ctx) = self._caller_ctx()
+        self.checker.key.check_and_wrap(key, key_ctx)
+        self.inner[key] = self.checker.value.check_and_wrap(value, value_ctx)
+
+    def __getitem__(self, key):
+        (key_ctx, _) = self._caller_ctx()
+        self.checker.key.check_and_wrap(key, key_ctx)
+        return self.checker.value.check_and_wrap(self.inner[key], self.value_ctx)
+
+    def update(self, *args, **kwargs):
+        if len(args) > 1:
+            raise TypeError(f"update expected at most 1 argument, got {len(args)}")
+        (key_ctx, value_ctx) = self._caller_ctx()
+        if args:
+            self._insert_all(_pairs(args[0]), key_ctx, value_ctx)
+        self._insert_all(kwargs.items(), key_ctx, value_ctx)
+
+    def __ior__(self, other):
+        (key_ctx, value_ctx) = self._caller_ctx()
+        self._insert_all(_pairs(other), key_ctx, value_ctx)
+        return self
+
+    def setdefault(self, key, default=None):
+        (key_ctx, value_ctx) = self._caller_ctx()
+        self.checker.key.check_and_wrap(key, key_ctx)
+        if key in self.inner:
+            return self.checker.value.check_and_wrap(self.inner[key], self.value_ctx)
+        default = self.checker.value.check_and_wrap(default, value_ctx)
+        self.inner[key] = default
+        return default
+
+    # Values returned to the caller
+    def get(self, key, default=None):
+        if key in self.inner:
+            return self.checker.value.check_and_wrap(self.inner[key], self.value_ctx)
+        return default
+
+    def pop(self, key, *args):
+        if key in self.inner:
+            return self.checker.value.check_and_wrap(self.inner.pop(key), self.value_ctx)
+        return self.inner.pop(key, *args)
+
+    def popitem(self):
+        (k, v) = self.inner.popitem()
+        return self.checker.key.check_and_wrap(k, self.key_ctx), self.checker.value.check_and_wrap(v, self.value_ctx)
+
+    def __iter__(self):
+        key = self.checker.key
+        key_ctx = self.key_ctx
+        for k in self.inner:
+            yield key.check_and_wrap(k, key_ctx)
+
+    def __reversed__(self):
+        key = self.checker.key
+        key_ctx = self.key_ctx
+        for k in reversed(self.inner):
+            yield key.check_and_wrap(k, key_ctx)
+
+    def keys(self):
+        return TypedDictKeys(self)
+
+    def values(self):
+        return TypedDictValues(self)
+
+    def items(self):
+        return TypedDictItems(self)
+
+    # Delete, Copy, ...
+    def __contains__(self, key):
+        return self.inner.__contains__(key)
+
+    def __delitem__(self, key):
+        return self.inner.__delitem__(key)
+
+    def __len__(self):
+        return self.inner.__len__()
+
+    def clear(self):
+        return self.inner.clear()
+
+    def copy(self):
+        return self.inner.copy()
+
+    def __copy__(self):
+        return self.inner.copy()
+
+    def __or__(self, other):
+        return self.inner.__or__(_unwrap(other))
+
+    def __ror__(self, other):
+        return self.inner.__ror__(_unwrap(other))
+
+    def __eq__(self, other):
+        return self.inner.__eq__(_unwrap(other))
+
+    def __ne__(self, other):
+        return self.inner.__ne__(_unwrap(other))
+
+    def __repr__(self):
+        return self.inner.__repr__()
+
+    def __str__(self):
+        return self.inner.__str__()
+
+    def __sizeof__(self):
+        return self.inner.__sizeof__()
+
+
+TypedDict.caller = LazyCallerFrame(TypedDict.__setitem__.__code__, TypedDict.__getitem__.__code__,
+                                   TypedDict.update.__code__, TypedDict.__ior__.__code__,
+                                   TypedDict.setdefault.__code__)
+
+
+class TypedDictKeys:
+    def __init__(self, typed: TypedDict):
+        self.typed = typed
+        self.view = typed.inner.keys()
+
+    def __iter__(self):
+        return self.typed.__iter__()
+
+    def __reversed__(self):
+        return self.typed.__reversed__()
+
+    def __len__(self):
+        return self.view.__len__()
+
+    def __contains__(self, key):
+        return self.view.__contains__(key)
+
+    def __eq__(self, other):
+        return self.view == other
+
+    def __and__(self, other):
+        return self.view & other
+
+    def __or__(self, other):
+        return self.view | other
+
+    def __sub__(self, other):
+        return self.view - other
+
+    def __xor__(self, other):
+        return self.view ^ other
+
+    def __rand__(self, other):
+        return other & self.view
+
+    def __ror__(self, other):
+        return other | self.view
+
+    def __rsub__(self, other):
+        return other - self.view
+
+    def __rxor__(self, other):
+        return other ^ self.view
+
+    def isdisjoint(self, other):
+        return self.view.isdisjoint(other)
+
+    def __repr__(self):
+        return self.view.__repr__()
+
+
+class TypedDictValues:
+    def __init__(self, typed: TypedDict):
+        self.typed = typed
+        self.view = typed.inner.values()
+
+    def __iter__(self):
+        value = self.typed.checker.value
+        value_ctx = self.typed.value_ctx
+        for v in self.view:
+            yield value.check_and_wrap(v, value_ctx)
+
+    def __reversed__(self):
+        value = self.typed.checker.value
+        value_ctx = self.typed.value_ctx
+        for v in reversed(self.view):
+            yield value.check_and_wrap(v, value_ctx)
+
+    def __len__(self):
+        return self.view.__len__()
+
+    def __contains__(self, value):
+        return self.view.__contains__(value)
+
+    def __repr__(self):
+        return self.view.__repr__()
+
+
+class TypedDictItems:
+    def __init__(self, typed: TypedDict):
+        self.typed = typed
+        self.view = typed.inner.items()
+
+    def __iter__(self):
+        key = self.typed.checker.key
+        value = self.typed.checker.value
+        key_ctx = self.typed.key_ctx
+        value_ctx = self.typed.value_ctx
+        for (k, v) in self.view:
+            yield key.check_and_wrap(k, key_ctx), value.check_and_wrap(v, value_ctx)
+
+    def __reversed__(self):
+        key = self.typed.checker.key
+        value = self.typed.checker.value
+        key_ctx = self.typed.key_ctx
+        value_ctx = self.typed.value_ctx
+        for (k, v) in reversed(self.view):
+            yield key.check_and_wrap(k, key_ctx), value.check_and_wrap(v, value_ctx)
+
+    def __len__(self):
+        return self.view.__len__()
+
+    def __contains__(self, item):
+        return self.view.__contains__(item)
+
+    def __eq__(self, other):
+        return self.view == other
+
+    def __and__(self, other):
+        return self.view & other
+
+    def __or__(self, other):
+        return self.view | other
+
+    def __sub__(self, other):
+        return self.view - other
+
+    def __xor__(self, other):
+        return self.view ^ other
+
+    def __rand__(self, other):
+        return other & self.view
+
+    def __ror__(self, other):
+        return other | self.view
+
+    def __rsub__(self, other):
+        return other - self.view
+
+    def __rxor__(self, other):
+        return other ^ self.view
+
+    def isdisjoint(self, other):
+        return self.view.isdisjoint(other)
+
+    def __repr__(self):
+        return self.view.__repr__()
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from untypy.error import UntypyTypeError
 from untypy.interfaces import TypeChecker, CreationContext, TypeCheckerFactory, ExecutionContext
@@ -20,9 +20,15 @@ class DummyDelayedFactory(TypeCheckerFactory):
 
 
 class DummyDelayedChecker(TypeChecker):
+    def may_be_wrapped(self) -> bool:
+        return True
+
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         return DummyDelayedWrapper(ctx)
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return True, arg
+
     def describe(self) -> str:
         return "DummyDelayedType"
 
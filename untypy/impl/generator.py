@@ -2,15 +2,19 @@ import collections.abc
 import inspect
 import sys
 from collections import Generator
-from typing import Any, Optional
-from typing import Generator as OtherGenerator
+from types import GeneratorType, AsyncGeneratorType
+from typing import Any, Optional, Tuple
+from typing import Generator as OtherGenerator, AsyncGenerator as OtherAsyncGenerator
 
-from untypy.error import UntypyTypeError, UntypyAttributeError, Location
+from untypy.error import UntypyTypeError, UntypyAttributeError, Location, LazyCallerFrame
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
 from untypy.util import CompoundTypeExecutionContext, NoResponsabilityWrapper
+from untypy.util.awaitable import TypedAwaitable
 
 GeneratorTypeA = type(Generator[None, None, None])
 GeneratorTypeB = type(OtherGenerator[None, None, None])
+AsyncGeneratorTypeA = type(collections.abc.AsyncGenerator[None, None])
+AsyncGeneratorTypeB = type(OtherAsyncGenerator[None, None])
 
 
 class GeneratorFactory(TypeCheckerFactory):
@@ -43,45 +47,134 @@ class GeneratorChecker(TypeChecker):
         self.yield_checker = yield_checker
         self.send_checker = send_checker
         self.return_checker = return_checker
+        # next() sends None, which needs no check for send types like None or Optional[T].
+        self.none_sent_ok = send_checker.is_identity_preserving() and send_checker.try_check(None)[0]
 
     def may_be_wrapped(self) -> bool:
         return True
 
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
-        if not inspect.isgenerator(arg):
+        if type(arg) is TypedGenerator:
+            if arg.checker.yield_checker is self.yield_checker and arg.checker.send_checker is self.send_checker \
+                    and arg.checker.return_checker is self.return_checker:
+                # Already checked the same way. A proxy over the same generator keeps the checks
+                # flat, values it yields are blamed as before, values sent through it on this boundary.
+                proxy = TypedGenerator(arg.inner, self, ctx)
+                proxy.yield_ctx = arg.yield_ctx
+                proxy.return_ctx = arg.return_ctx
+                proxy.started = arg.started
+                proxy.done = arg.done
+                return proxy
+        elif not inspect.isgenerator(arg):
             raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        return TypedGenerator(arg, self, ctx)
 
-        me = self
-        yield_ctx = TypedGeneratorYieldReturnContext(arg, self, True, ctx)
-        return_ctx = TypedGeneratorYieldReturnContext(arg, self, False, ctx)
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return inspect.isgenerator(arg) or type(arg) is TypedGenerator, arg
 
-        def wrapped():
-            try:
-                sent = None
-                while True:
-                    value_yield = arg.send(sent)
-                    # check value_yield (arg is responsable)
-                    value_yield = me.yield_checker.check_and_wrap(value_yield, yield_ctx)
+    def indexed_types(self) -> Optional[list[type]]:
+        return [GeneratorType, TypedGenerator]
 
-                    sent = yield value_yield
+    def describe(self) -> str:
+        return f"Generator[{self.yield_checker.describe()}, {self.send_checker.describe()}, {self.return_checker.describe()}]"
 
-                    caller = sys._getframe(1)
+    def base_type(self) -> Any:
+        return [GeneratorType]
 
-                    # check sent value (caller is responsable)
-                    sent = me.send_checker.check_and_wrap(sent, TypedGeneratorSendContext(caller, me, ctx))
 
-            except StopIteration as e:
-                # check value_returned (arg is responsable)
-                ret = me.return_checker.check_and_wrap(e.value, return_ctx)
-                return ret
+class TypedGenerator:
+    """
+    Checks the values yielded and returned by a generator and the values sent to it.
+    Implements the generator protocol itself, so stepping it adds no generator frame,
+    and throw(), close() and yield from are forwarded to the wrapped generator.
+    """
+    inner: Generator[Any, Any, Any]
+    checker: GeneratorChecker
 
-        return wrapped()
+    def __init__(self, inner: Generator[Any, Any, Any], checker: GeneratorChecker, ctx: ExecutionContext):
+        self.inner = inner
+        self.checker = checker
+        self.ctx = ctx
+        self.yield_ctx = TypedGeneratorYieldReturnContext(inner, checker, True, ctx)
+        self.return_ctx = TypedGeneratorYieldReturnContext(inner, checker, False, ctx)
+        if checker.send_checker.may_be_wrapped():
+            self.send_ctx = None
+        else:
+            self.send_ctx = TypedGeneratorSendContext(TypedGenerator.caller, checker, ctx)
+        # The value starting the generator is not checked, it must be None.
+        self.started = False
+        self.done = False
 
-    def describe(self) -> str:
-        return f"Generator[{self.yield_checker.describe()}, {self.send_checker.describe()}, {self.return_checker.describe()}]"
+    def _check_sent(self, value, frame):
+        ctx = self.send_ctx
+        if ctx is None:
+            ctx = TypedGeneratorSendContext(frame, self.checker, self.ctx)
+        return self.checker.send_checker.check_and_wrap(value, ctx)
 
-    def base_type(self) -> Any:
-        return [GeneratorType]
+    def _check_returned(self, value):
+        if self.done:
+            # a finished generator only stops again
+            return value
+        self.done = True
+        return self.checker.return_checker.check_and_wrap(value, self.return_ctx)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.started:
+            if not self.checker.none_sent_ok:
+                self._check_sent(None, sys._getframe(1))
+        else:
+            self.started = True
+        try:
+            value = self.inner.__next__()
+        except StopIteration as e:
+            raise StopIteration(self._check_returned(e.value)) from None
+        return self.checker.yield_checker.check_and_wrap(value, self.yield_ctx)
+
+    def send(self, value):
+        if self.started:
+            if value is not None or not self.checker.none_sent_ok:
+                value = self._check_sent(value, sys._getframe(1))
+        else:
+            self.started = True
+        try:
+            value = self.inner.send(value)
+        except StopIteration as e:
+            raise StopIteration(self._check_returned(e.value)) from None
+        return self.checker.yield_checker.check_and_wrap(value, self.yield_ctx)
+
+    def throw(self, *args):
+        self.started = True
+        try:
+            value = self.inner.throw(*args)
+        except StopIteration as e:
+            raise StopIteration(self._check_returned(e.value)) from None
+        return self.checker.yield_checker.check_and_wrap(value, self.yield_ctx)
+
+    def close(self):
+        self.done = True
+        return self.inner.close()
+
+    @property
+    def gi_frame(self):
+        return self.inner.gi_frame
+
+    @property
+    def gi_running(self):
+        return self.inner.gi_running
+
+    @property
+    def gi_code(self):
+        return self.inner.gi_code
+
+    @property
+    def gi_yieldfrom(self):
+        return self.inner.gi_yieldfrom
+
+
+TypedGenerator.caller = LazyCallerFrame(TypedGenerator.__next__.__code__, TypedGenerator.send.__code__)
 
 
 class TypedGeneratorYieldReturnContext(CompoundTypeExecutionContext):
@@ -126,3 +219,123 @@ class TypedGeneratorSendContext(CompoundTypeExecutionContext):
 
     def responsable(self) -> Optional[Location]:
         return Location.from_stack(self.stack)
+
+
+class AsyncGeneratorFactory(TypeCheckerFactory):
+    def create_from(self, annotation: Any, ctx: CreationContext) -> Optional[TypeChecker]:
+        if type(annotation) in [AsyncGeneratorTypeA, AsyncGeneratorTypeB] \
+                and annotation.__origin__ == collections.abc.AsyncGenerator:
+            if len(annotation.__args__) != 2:
+                raise ctx.wrap(UntypyAttributeError(f"Expected 2 type arguments for AsyncGenerator."))
+
+            (yield_checker, send_checker) = list(map(lambda a: ctx.find_checker(a), annotation.__args__))
+
+            if yield_checker is None:
+                raise ctx.wrap(
+                    UntypyAttributeError(f"The Yield Annotation of the AsyncGenerator could not be resolved."))
+            if send_checker is None:
+                raise ctx.wrap(
+                    UntypyAttributeError(f"The Send Annotation of the AsyncGenerator could not be resolved."))
+
+            return AsyncGeneratorChecker(yield_checker, send_checker)
+        else:
+            return None
+
+
+class AsyncGeneratorChecker(TypeChecker):
+    yield_checker: TypeChecker
+    send_checker: TypeChecker
+
+    def __init__(self, yield_checker: TypeChecker, send_checker: TypeChecker):
+        self.yield_checker = yield_checker
+        self.send_checker = send_checker
+
+    def may_be_wrapped(self) -> bool:
+        return True
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if not inspect.isasyncgen(arg):
+            raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        return TypedAsyncGenerator(arg, self, ctx)
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return inspect.isasyncgen(arg), arg
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return [AsyncGeneratorType]
+
+    def describe(self) -> str:
+        return f"AsyncGenerator[{self.yield_checker.describe()}, {self.send_checker.describe()}]"
+
+    def base_type(self) -> Any:
+        return [AsyncGeneratorType]
+
+
+class TypedAsyncGenerator:
+    """
+    Checks the yielded values when they are awaited and the sent values when they are sent.
+    The first value sent to start the generator is not checked, like in GeneratorChecker.
+    """
+
+    def __init__(self, inner, checker: AsyncGeneratorChecker, ctx: ExecutionContext):
+        self.inner = inner
+        self.checker = checker
+        self.ctx = ctx
+        self.yield_ctx = TypedAsyncGeneratorYieldContext(inner, checker, ctx)
+        self.started = False
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        self.started = True
+        return TypedAwaitable(self.inner.__anext__(), self.checker.yield_checker.check_and_wrap, self.yield_ctx)
+
+    def asend(self, value):
+        if self.started:
+            value = self.checker.send_checker.check_and_wrap(
+                value, TypedAsyncGeneratorSendContext(sys._getframe(1), self.checker, self.ctx))
+        self.started = True
+        return TypedAwaitable(self.inner.asend(value), self.checker.yield_checker.check_and_wrap, self.yield_ctx)
+
+    def athrow(self, *args):
+        return TypedAwaitable(self.inner.athrow(*args), self.checker.yield_checker.check_and_wrap, self.yield_ctx)
+
+    def aclose(self):
+        return self.inner.aclose()
+
+
+class TypedAsyncGeneratorYieldContext(CompoundTypeExecutionContext):
+
+    def __init__(self, generator, checker: AsyncGeneratorChecker, upper: ExecutionContext):
+        self.generator = generator
+        super().__init__(upper, [checker.yield_checker, checker.send_checker], 0)
+
+    def name(self) -> str:
+        return "AsyncGenerator"
+
+    def responsable(self) -> Optional[Location]:
+        try:
+            if self.generator.ag_frame is not None:
+                return Location(
+                    file=inspect.getfile(self.generator.ag_frame),
+                    line_no=inspect.getsourcelines(self.generator.ag_frame)[1],
+                    source_line="\n".join(inspect.getsourcelines(self.generator.ag_frame)[0]),
+                )
+        except OSError:  # this call does not work all the time
+            pass
+        except TypeError:
+            pass
+        return None
+
+
+class TypedAsyncGeneratorSendContext(CompoundTypeExecutionContext):
+    def __init__(self, stack: inspect.FrameInfo, checker: AsyncGeneratorChecker, upper: ExecutionContext):
+        self.stack = stack
+        super().__init__(NoResponsabilityWrapper(upper), [checker.yield_checker, checker.send_checker], 1)
+
+    def name(self) -> str:
+        return "AsyncGenerator"
+
+    def responsable(self) -> Optional[Location]:
+        return Location.from_stack(self.stack)
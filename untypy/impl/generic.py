@@ -1,5 +1,5 @@
 import typing
-from typing import Optional, TypeVar, Any
+from typing import Optional, TypeVar, Any, Tuple
 
 from untypy.error import UntypyTypeError
 from untypy.impl.protocol import ProtocolChecker
@@ -51,6 +51,15 @@ class BoundTypeVar(TypeChecker):
     def may_be_wrapped(self) -> bool:
         return self.inner.may_be_wrapped()
 
+    def is_identity_preserving(self) -> bool:
+        return self.inner.is_identity_preserving()
+
+    def exact_types(self) -> Optional[list[type]]:
+        return self.inner.exact_types()
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return self.inner.indexed_types()
+
     def base_type(self) -> list[Any]:
         return self.inner.base_type()
 
@@ -60,6 +69,9 @@ class BoundTypeVar(TypeChecker):
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         return self.inner.check_and_wrap(arg, BoundTypeVarCtx(self, ctx))
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return self.inner.try_check(arg)
+
 
 class BoundTypeVarCtx(ExecutionContext):
 
@@ -82,9 +94,15 @@ class UnboundTypeVar(TypeChecker):
     def __init__(self, typevar: TypeVar):
         self.typevar = typevar
 
+    def is_identity_preserving(self) -> bool:
+        return True
+
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         return arg
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return True, arg
+
     def describe(self) -> str:
         return str(self.typevar)
 
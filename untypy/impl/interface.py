@@ -1,23 +1,10 @@
-from collections import Iterator, Iterable
-from typing import TypeVar, Optional, Any, Generic, Dict, List, Set
+from typing import TypeVar, Optional, Any, Generic, List, Tuple
 
 from untypy.error import UntypyAttributeError, UntypyTypeError
 from untypy.impl.wrappedclass import WrappedType
 from untypy.interfaces import TypeCheckerFactory, TypeChecker, CreationContext, ExecutionContext
 from untypy.util import ReplaceTypeExecutionContext
 
-K = TypeVar("K")
-V = TypeVar("V")
-
-
-class WDict(Generic[K, V], dict):
-    def __getitem__(self, item: K) -> V:
-        pass
-
-    def __setitem__(self, key: K, value: V) -> None:
-        pass
-
-
 I = TypeVar("I")
 
 
@@ -29,33 +16,9 @@ class WList(Generic[I], list):
         pass
 
 
-I = TypeVar("I")
-
-
-class WSet(Generic[I], set):
-    def __contains__(self, item: I) -> bool:
-        pass
-
-    def add(self, elem: I) -> None:
-        pass
-
-
-I = TypeVar("I")
-
-
-class WIterable(Generic[I]):
-    def __iter__(self) -> Iterator[I]:
-        pass
-
-
 InterfaceMapping = {
-    dict: (WDict,),
-    Dict: (WDict,),
     list: (WList,),
     List: (WList,),
-    set: (WSet,),
-    Set: (WSet,),
-    Iterable: (WIterable),
 }
 
 
@@ -96,7 +59,7 @@ class InterfaceChecker(TypeChecker):
         self.name = name
         pass
 
-    def may_change_identity(self) -> bool:
+    def may_be_wrapped(self) -> bool:
         return True
 
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
@@ -108,5 +71,13 @@ class InterfaceChecker(TypeChecker):
         instance._WrappedClassFunction__return_ctx = ReplaceTypeExecutionContext(ctx, self.name)
         return instance
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return issubclass(type(arg), self.origin), arg
+
+    def indexed_types(self) -> Optional[list[type]]:
+        if type(self.origin) is not type:
+            return None
+        return [self.origin]
+
     def describe(self) -> str:
         return self.name
@@ -1,15 +1,19 @@
 import collections.abc
 import inspect
 from collections import Iterator
-from typing import Any, Optional
-from typing import Iterator as OtherIterator
+from itertools import islice
+from typing import Any, Optional, Tuple
+from typing import Iterator as OtherIterator, AsyncIterator as OtherAsyncIterator
 
 from untypy.error import UntypyTypeError, UntypyAttributeError, Location
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
 from untypy.util import CompoundTypeExecutionContext
+from untypy.util.awaitable import TypedAwaitable
 
 IteratorTypeA = type(Iterator[int])
 IteratorTypeB = type(OtherIterator[int])
+AsyncIteratorTypeA = type(collections.abc.AsyncIterator[int])
+AsyncIteratorTypeB = type(OtherAsyncIterator[int])
 
 
 class IteratorFactory(TypeCheckerFactory):
@@ -28,9 +32,15 @@ class IteratorFactory(TypeCheckerFactory):
 
 class IteratorChecker(TypeChecker):
     inner: TypeChecker
+    # If greater than 1, items are read ahead from the iterator in batches of this size.
+    # A batch whose items are all of a type accepted unchanged is passed on without further
+    # checks, otherwise its items are checked one by one when they are returned.
+    batch_size: int = 1
 
     def __init__(self, inner: TypeChecker):
         self.inner = inner
+        exact = inner.exact_types() if inner.is_identity_preserving() else None
+        self.exact = None if exact is None else frozenset(exact)
 
     def may_be_wrapped(self) -> bool:
         return True
@@ -42,17 +52,101 @@ class IteratorChecker(TypeChecker):
         me = self
         ctx = TypedIteratorExecutionContext(self.inner, arg, ctx)
 
+        if self.batch_size > 1 and self.exact is not None:
+            return self.batched(arg, ctx)
+
         def wrapper():
             for item in arg:
                 yield me.inner.check_and_wrap(item, ctx)
 
         return wrapper()
 
+    def batched(self, arg: Any, ctx: ExecutionContext):
+        checker = self.inner
+        exact = self.exact
+        size = self.batch_size
+        while True:
+            batch = []
+            failure = None
+            try:
+                batch.extend(islice(arg, size))
+            except Exception as e:
+                # the items read before are still returned first
+                failure = e
+            if exact.issuperset(map(type, batch)):
+                yield from batch
+            else:
+                for item in batch:
+                    yield checker.check_and_wrap(item, ctx)
+            if failure is not None:
+                raise failure
+            if len(batch) < size:
+                return
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return hasattr(arg, '__next__') and hasattr(arg, '__iter__'), arg
+
     def describe(self) -> str:
         return f"Iterator[{self.inner.describe()}]"
 
     def base_type(self) -> list[Any]:
-        return [IteratorType]
+        return [collections.abc.Iterator]
+
+
+class AsyncIteratorFactory(TypeCheckerFactory):
+    def create_from(self, annotation: Any, ctx: CreationContext) -> Optional[TypeChecker]:
+        if type(annotation) in [AsyncIteratorTypeA, AsyncIteratorTypeB] \
+                and annotation.__origin__ == collections.abc.AsyncIterator:
+            if len(annotation.__args__) != 1:
+                raise ctx.wrap(UntypyAttributeError(f"Expected 1 type arguments for async iterator."))
+
+            inner = ctx.find_checker(annotation.__args__[0])
+            if inner is None:
+                raise ctx.wrap(UntypyAttributeError(f"The inner type of the async iterator could not be resolved."))
+            return AsyncIteratorChecker(inner)
+        else:
+            return None
+
+
+class AsyncIteratorChecker(TypeChecker):
+    inner: TypeChecker
+
+    def __init__(self, inner: TypeChecker):
+        self.inner = inner
+
+    def may_be_wrapped(self) -> bool:
+        return True
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if not hasattr(arg, '__anext__') or not hasattr(arg, '__aiter__'):
+            raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        return TypedAsyncIterator(arg, self.inner, TypedAsyncIteratorExecutionContext(self.inner, arg, ctx))
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return hasattr(arg, '__anext__') and hasattr(arg, '__aiter__'), arg
+
+    def describe(self) -> str:
+        return f"AsyncIterator[{self.inner.describe()}]"
+
+    def base_type(self) -> list[Any]:
+        return [collections.abc.AsyncIterator]
+
+
+class TypedAsyncIterator:
+    """
+    Checks every item, when the awaitable returned by __anext__ is awaited.
+    """
+
+    def __init__(self, inner, checker: TypeChecker, ctx: ExecutionContext):
+        self.inner = inner
+        self.checker = checker
+        self.ctx = ctx
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return TypedAwaitable(self.inner.__anext__(), self.checker.check_and_wrap, self.ctx)
 
 
 class TypedIteratorExecutionContext(CompoundTypeExecutionContext):
@@ -67,14 +161,21 @@ class TypedIteratorExecutionContext(CompoundTypeExecutionContext):
 
     def responsable(self) -> Optional[Location]:
         try:
-            if hasattr(self.iter, 'gi_frame'):
+            frame = getattr(self.iter, 'gi_frame', None) or getattr(self.iter, 'ag_frame', None)
+            if frame is not None:
                 return Location(
-                    file=inspect.getfile(self.iter.gi_frame),
-                    line_no=inspect.getsourcelines(self.iter.gi_frame)[1],
-                    source_line="\n".join(inspect.getsourcelines(self.iter.gi_frame)[0]),
+                    file=inspect.getfile(frame),
+                    line_no=inspect.getsourcelines(frame)[1],
+                    source_line="\n".join(inspect.getsourcelines(frame)[0]),
                 )
         except OSError:  # this call does not work all the time
             pass
         except TypeError:
             pass
         return None
+
+
+class TypedAsyncIteratorExecutionContext(TypedIteratorExecutionContext):
+
+    def name(self) -> str:
+        return "AsyncIterator"
@@ -1,9 +1,11 @@
 import inspect
 import sys
+from itertools import islice
 from types import GenericAlias
-from typing import Any, Optional, List
+from typing import Any, Optional, List, Tuple
 
-from untypy.error import UntypyTypeError, Frame, Location
+from untypy.error import UntypyTypeError, Frame, Location, LazyCallerFrame
+from untypy.impl.collection_policy import GlobalCollectionPolicy, scan
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
 
 
@@ -25,18 +27,40 @@ class ListChecker(TypeChecker):
     inner: TypeChecker
     declared: Location
 
+    # Remember which elements were already checked and skip checking them again.
+    # Only safe as long as the underlying list is mutated through the TypedList alone.
+    track_validated: bool = False
+
     def __init__(self, inner: TypeChecker, declared: Location):
         self.inner = inner
         self.declared = declared
+        if inner.may_be_wrapped():
+            # the context is kept by the wrapped elements, so the caller is captured on each call
+            self.caller_ctx = None
+        else:
+            self.caller_ctx = ListCallerExecutionContext(TypedList.caller, declared)
 
-    def may_change_identity(self) -> bool:
+    def may_be_wrapped(self) -> bool:
         return True
 
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         if not issubclass(type(arg), list):
             raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        if type(arg) is TypedList and arg.checker is self.inner:
+            # Already checked the same way. A proxy over the same list keeps the checks flat,
+            # values it reads are blamed as before, values written through it on this boundary.
+            return TypedList(arg.inner, self.inner, arg.ctx, self.declared, self.caller_ctx, self.track_validated)
+
+        ctx = ListExecutionContext(ctx)
+        if GlobalCollectionPolicy.is_eager('list', len(arg)) and scan(self.inner, arg, ctx):
+            return arg
+        return TypedList(arg, self.inner, ctx, self.declared, self.caller_ctx, self.track_validated)
 
-        return TypedList(arg, self.inner, ListExecutionContext(ctx), self.declared)
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return issubclass(type(arg), list), arg
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return [list]
 
     def base_type(self) -> list[Any]:
         return [list]
@@ -86,63 +110,174 @@ class TypedList(list):
     checker: TypeChecker
     ctx: ExecutionContext
     declared: Location
+    track: bool
+    verified: int  # inner[:verified] is known to be well typed, if track is set
+    chunk_size: int = 256
 
-    def __init__(self, lst, checker, ctx, declared):
+    def __init__(self, lst, checker, ctx, declared, caller_ctx=None, track_validated=False):
         super().__init__()
         self.checker = checker
         self.inner = lst
         self.ctx = ctx
         self.declared = declared
+        self.caller_ctx = caller_ctx
+        # Wrapped elements must be returned wrapped every time, so only elements
+        # which are returned unchanged may be remembered.
+        self.track = track_validated and checker.is_identity_preserving()
+        self.verified = 0
+        exact = checker.exact_types() if checker.is_identity_preserving() else None
+        self.exact = None if exact is None else frozenset(exact)
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            return max(0, index + len(self.inner))
+        return min(index, len(self.inner))
+
+    def _invalidate(self, index: int) -> None:
+        if index < self.verified:
+            self.verified = index
 
     # Perform type check
     def __getitem__(self, index):
         if type(index) is int:
             # list[1], flat get
             ret = self.inner.__getitem__(index)
-            return self.checker.check_and_wrap(ret, self.ctx)
+            if not self.track:
+                return self.checker.check_and_wrap(ret, self.ctx)
+
+            if index < 0:
+                index += len(self.inner)
+            if index < self.verified:
+                return ret
+            ret = self.checker.check_and_wrap(ret, self.ctx)
+            if index == self.verified:
+                self.verified += 1
+            return ret
         else:
             # returned structure is an list itself.
             # e.g. list[1:3, ...]
-            return list(map(lambda x: self.checker.check_and_wrap(x, self.ctx), self.inner.__getitem__(index)))
+            # The elements are checked lazily, when they are accessed.
+            view = TypedList(self.inner.__getitem__(index), self.checker, self.ctx, self.declared,
+                             self.caller_ctx, self.track)
+            if self.track and type(index) is slice:
+                (start, stop, step) = index.indices(len(self.inner))
+                if step == 1:
+                    view.verified = max(0, min(stop, self.verified) - start)
+            return view
 
     def __iter__(self):
-        return TypedListIterator(self)
+        checker = self.checker
+        ctx = self.ctx
+        if self.exact is None and not self.track:
+            for x in self.inner:
+                yield checker.check_and_wrap(x, ctx)
+            return
+
+        # Each element is checked when the native iterator returns it, so mutations
+        # while iterating behave as for a plain list and never skip a check.
+        exact = self.exact
+        track = self.track
+        for (index, x) in enumerate(self.inner):
+            if index >= self.verified:
+                if exact is None or type(x) not in exact:
+                    x = checker.check_and_wrap(x, ctx)
+                if track and index == self.verified:
+                    self.verified += 1
+            yield x
 
     def append(self, x) -> None:
-        caller = sys._getframe(1)
-        ctx = ListCallerExecutionContext(caller, self.declared)
+        ctx = self.caller_ctx
+        if ctx is None:
+            ctx = ListCallerExecutionContext(sys._getframe(1), self.declared)
         self.inner.append(self.checker.check_and_wrap(x, ctx))
+        if self.track and self.verified == len(self.inner) - 1:
+            self.verified += 1
 
     def extend(self, iterable) -> None:
-        caller = sys._getframe(1)
-        ctx = ListCallerExecutionContext(caller, self.declared)
-        return self.inner.extend(list(map(lambda x: self.checker.check_and_wrap(x, ctx), iterable)))
+        ctx = self.caller_ctx
+        if ctx is None:
+            ctx = ListCallerExecutionContext(sys._getframe(1), self.declared)
+        self._ingest(iterable, ctx)
 
     def insert(self, index, obj) -> None:
-        caller = sys._getframe(1)
-        ctx = ListCallerExecutionContext(caller, self.declared)
+        ctx = self.caller_ctx
+        if ctx is None:
+            ctx = ListCallerExecutionContext(sys._getframe(1), self.declared)
 
-        return self.inner.insert(index, self.checker.check_and_wrap(obj, ctx))
+        self.inner.insert(index, self.checker.check_and_wrap(obj, ctx))
+        if self.track and self._normalize(index) <= self.verified:
+            # the new element is checked, the following ones are just moved
+            self.verified += 1
 
     def __iadd__(self, other):
-        caller = sys._getframe(1)
-        ctx = ListCallerExecutionContext(caller, self.declared)
+        ctx = self.caller_ctx
+        if ctx is None:
+            ctx = ListCallerExecutionContext(sys._getframe(1), self.declared)
 
-        self.inner.extend(list(map(lambda x: self.checker.check_and_wrap(x, ctx), other)))
+        self._ingest(other, ctx)
         return self
 
+    def _ingest(self, iterable, ctx: ExecutionContext) -> None:
+        """
+        Checks and appends the values in a single pass. When a value is rejected,
+        the values appended before are removed again, so the list is left unchanged.
+        """
+        inner = self.inner
+        if iterable is inner or (isinstance(iterable, TypedList) and iterable.inner is inner):
+            iterable = list(iterable)
+
+        checker = self.checker
+        exact = self.exact
+        start = len(inner)
+        try:
+            if exact is None:
+                for x in iterable:
+                    inner.append(checker.check_and_wrap(x, ctx))
+            elif type(iterable) is list or type(iterable) is tuple:
+                if exact.issuperset(map(type, iterable)):
+                    inner.extend(iterable)
+                else:
+                    for x in iterable:
+                        inner.append(checker.check_and_wrap(x, ctx))
+            else:
+                it = iter(iterable)
+                while chunk := list(islice(it, TypedList.chunk_size)):
+                    if exact.issuperset(map(type, chunk)):
+                        inner.extend(chunk)
+                    else:
+                        for x in chunk:
+                            inner.append(checker.check_and_wrap(x, ctx))
+        except UntypyTypeError as e:
+            index = len(inner) - start
+            del inner[start:]
+            raise e.with_note(f"The value at index {index} of the added values has the wrong type.")
+        except BaseException:
+            del inner[start:]
+            raise
+
+        if self.track and self.verified == start:
+            self.verified = len(inner)
+
     def __setitem__(self, idx, value):
-        caller = sys._getframe(1)
-        ctx = ListCallerExecutionContext(caller, self.declared)
+        ctx = self.caller_ctx
+        if ctx is None:
+            ctx = ListCallerExecutionContext(sys._getframe(1), self.declared)
 
-        return self.inner.__setitem__(idx, self.checker.check_and_wrap(value, ctx))
+        self.inner.__setitem__(idx, self.checker.check_and_wrap(value, ctx))
+        if type(idx) is not int:
+            self.verified = 0
 
     def __add__(self, *args, **kwargs):
         # Caller Context
         return self.inner.__add__(*args, **kwargs)
 
-    def pop(self, *args, **kwargs):
-        ret = self.inner.pop(*args, **kwargs)
+    def pop(self, index=-1):
+        ret = self.inner.pop(index)
+        if index < 0:
+            index += len(self.inner) + 1
+        if index < self.verified:
+            self.verified = index
+            return ret
         return self.checker.check_and_wrap(ret, self.ctx)
 
     # Delete, Copy, ...
@@ -150,6 +285,7 @@ class TypedList(list):
         return self.inner.index(*args, **kwargs)
 
     def clear(self, *args, **kwargs):
+        self.verified = 0
         return self.inner.clear(*args, **kwargs)
 
     def copy(self, *args, **kwargs):
@@ -159,12 +295,17 @@ class TypedList(list):
         return self.inner.count(*args, **kwargs)
 
     def remove(self, *args, **kwargs):
+        self.verified = 0
         return self.inner.remove(*args, **kwargs)
 
     def reverse(self, *args, **kwargs):
+        if self.verified < len(self.inner):
+            self.verified = 0
         return self.inner.reverse(*args, **kwargs)
 
     def sort(self, *args, **kwargs):
+        if self.verified < len(self.inner):
+            self.verified = 0
         return self.inner.sort(*args, **kwargs)
 
     def __class_getitem__(self, *args, **kwargs):
@@ -173,8 +314,12 @@ class TypedList(list):
     def __contains__(self, *args, **kwargs):
         return self.inner.__contains__(*args, **kwargs)
 
-    def __delitem__(self, *args, **kwargs):
-        return self.inner.__delitem__(*args, **kwargs)
+    def __delitem__(self, idx):
+        if type(idx) is int:
+            self._invalidate(self._normalize(idx))
+        else:
+            self.verified = 0
+        return self.inner.__delitem__(idx)
 
     def __eq__(self, *args, **kwargs):
         return self.inner.__eq__(*args, **kwargs)
@@ -186,7 +331,10 @@ class TypedList(list):
         return self.inner.__gt__(*args, **kwargs)
 
     def __imul__(self, *args, **kwargs):
-        return self.inner.__imul__(*args, **kwargs)
+        verified_all = self.verified == len(self.inner)
+        ret = self.inner.__imul__(*args, **kwargs)
+        self.verified = len(self.inner) if verified_all else min(self.verified, len(self.inner))
+        return ret
 
     def __len__(self, *args, **kwargs):
         return self.inner.__len__(*args, **kwargs)
@@ -222,22 +370,6 @@ class TypedList(list):
         return self.inner.copy()
 
 
-class TypedListIterator:
-    inner: TypedList
-    index: int
-
-    def __init__(self, inner):
-        super().__init__()
-        self.inner = inner
-        self.index = 0
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self.index >= len(self.inner):
-            raise StopIteration
-
-        ret = self.inner[self.index]
-        self.index += 1
-        return ret
+TypedList.caller = LazyCallerFrame(TypedList.append.__code__, TypedList.extend.__code__,
+                                   TypedList.insert.__code__, TypedList.__iadd__.__code__,
+                                   TypedList.__setitem__.__code__)
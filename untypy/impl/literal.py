@@ -1,4 +1,4 @@
-from typing import Any, Optional, Literal
+from typing import Any, Optional, Literal, Tuple
 
 from untypy.error import UntypyTypeError
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
@@ -21,6 +21,9 @@ class LiteralChecker(TypeChecker):
     def __init__(self, inner: list[Any]):
         self.inner = inner
 
+    def is_identity_preserving(self) -> bool:
+        return True
+
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         if arg in self.inner:
             return arg
@@ -30,6 +33,17 @@ class LiteralChecker(TypeChecker):
                 self.describe()
             ))
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        if arg in self.inner:
+            return True, arg
+        return False, None
+
+    def indexed_types(self) -> Optional[list[type]]:
+        # other values may be equal to values of other types, like 1 == 1.0 == True
+        if all(type(v) is str or v is None for v in self.inner):
+            return list(set(map(type, self.inner)))
+        return None
+
     def base_type(self) -> list[Any]:
         return self.inner[:]
 
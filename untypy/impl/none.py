@@ -1,4 +1,4 @@
-from typing import Any, Optional, NoReturn
+from typing import Any, Optional, NoReturn, Tuple
 
 from untypy.error import UntypyTypeError
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
@@ -14,12 +14,24 @@ class NoneFactory(TypeCheckerFactory):
 
 
 class NoneChecker(TypeChecker):
+    def is_identity_preserving(self) -> bool:
+        return True
+
+    def exact_types(self) -> Optional[list[type]]:
+        return [type(None)]
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return [type(None)]
+
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         if arg is None:
             return arg
         else:
             raise ctx.wrap(UntypyTypeError(arg, self.describe()))
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return arg is None, arg
+
     def describe(self) -> str:
         return "None"
 
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, Tuple
 
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
 from untypy.util import CompoundTypeExecutionContext
@@ -25,12 +25,39 @@ class OptionalChecker(TypeChecker):
     def __init__(self, inner: TypeChecker):
         self.inner = inner
 
+    def may_be_wrapped(self) -> bool:
+        return self.inner.may_be_wrapped()
+
+    def is_identity_preserving(self) -> bool:
+        return self.inner.is_identity_preserving()
+
+    def exact_types(self) -> Optional[list[type]]:
+        inner = self.inner.exact_types()
+        if inner is None:
+            return None
+        return [type(None), *inner]
+
+    def indexed_types(self) -> Optional[list[type]]:
+        inner = self.inner.indexed_types()
+        if inner is None:
+            return None
+        return [type(None), *inner]
+
     def check_and_wrap(self, arg: Any, upper: ExecutionContext) -> Any:
         if arg is None:
             return arg
-        else:
-            ctx = OptionalExecutionContext(upper, [self.inner], 0)
-            return self.inner.check_and_wrap(arg, ctx)
+        if not self.inner.may_be_wrapped():
+            (ok, value) = self.inner.try_check(arg)
+            if ok:
+                return value
+        # reports the error or creates the wrapper
+        ctx = OptionalExecutionContext(upper, [self.inner], 0)
+        return self.inner.check_and_wrap(arg, ctx)
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        if arg is None:
+            return True, arg
+        return self.inner.try_check(arg)
 
     def describe(self) -> str:
         return f"Optional[{self.inner.describe()}]"
@@ -1,14 +1,21 @@
 import inspect
 import sys
 import typing
+import weakref
+from operator import attrgetter
 from typing import Protocol, Any, Optional, Callable, Union, TypeVar, Dict, Tuple
 
-from untypy.error import UntypyTypeError, UntypyAttributeError, Frame, Location, ResponsibilityType
+from untypy.error import UntypyTypeError, UntypyAttributeError, Frame, Location, ResponsibilityType, \
+    LazyCallerFrame
 from untypy.impl.any import SelfChecker
+from untypy.impl.conformance_cache import GlobalConformanceCache
 from untypy.interfaces import TypeCheckerFactory, CreationContext, TypeChecker, ExecutionContext, \
     WrappedFunctionContextProvider
-from untypy.util import WrappedFunction, ArgumentExecutionContext, ReturnExecutionContext
+from untypy.util import WrappedFunction, ArgumentExecutionContext, ReturnExecutionContext, \
+    ArgumentExecutionContexts, wrapping_arguments
+from untypy.util.awaitable import TypedAwaitable, is_coroutine_function, mark_coroutine_function
 from untypy.util.condition import FunctionCondition
+from untypy.util.stats import GlobalStats, counted, function_name
 
 
 class ProtocolFactory(TypeCheckerFactory):
@@ -98,7 +105,34 @@ def get_proto_members(proto: type, ctx: CreationContext) -> Dict[
     return member_dict
 
 
+# Wrapper types are stored in this attribute of the wrapped class. Their methods refer to the
+# methods of the class and so may refer to the class (e.g. by super()). Kept by the class itself,
+# they only form a reference cycle, which is collected together with the class.
+WrapperTypesAttribute = '__untypy_protocol_wrappers__'
+
+# Wrapper types of classes, which do not allow setting attributes, like builtins.
+FallbackWrapperTypes = weakref.WeakKeyDictionary()
+
+
+def _wrapper_types_of(clas: type) -> dict:
+    wrappers = clas.__dict__.get(WrapperTypesAttribute)
+    if wrappers is not None:
+        return wrappers
+    wrappers = FallbackWrapperTypes.get(clas)
+    if wrappers is not None:
+        return wrappers
+    wrappers = dict()
+    try:
+        setattr(clas, WrapperTypesAttribute, wrappers)
+    except (TypeError, AttributeError):
+        FallbackWrapperTypes[clas] = wrappers
+    return wrappers
+
+
 class ProtocolChecker(TypeChecker):
+    # Wrapper types are kept for at most this many checkers per class, the oldest ones are dropped first.
+    wrapper_types_limit: int = 256
+
     def __init__(self, annotation: type, ctx: CreationContext):
         (proto, typevars) = _find_bound_typevars(annotation)
         ctx = ctx.with_typevars(typevars)
@@ -106,9 +140,8 @@ class ProtocolChecker(TypeChecker):
         self.proto = proto
         self.members = members
         self.typevars = typevars
-        self.wrapper_types = dict()
 
-    def may_change_identity(self) -> bool:
+    def may_be_wrapped(self) -> bool:
         return True
 
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
@@ -116,12 +149,17 @@ class ProtocolChecker(TypeChecker):
             # no double wrapping
             arg = getattr(arg, '_ProtocolWrappedFunction__inner')
 
-        if type(arg) in self.wrapper_types:
-            return self.wrapper_types[type(arg)](arg, ctx)
-        else:
-            wrapped_type = ProtocolWrapper(self, type(arg), self.members, ctx)
-            self.wrapper_types[type(arg)] = wrapped_type
-            return wrapped_type(arg, ctx)
+        clas = type(arg)
+        wrapper_types = clas.__dict__.get(WrapperTypesAttribute)
+        if wrapper_types is None:
+            wrapper_types = _wrapper_types_of(clas)
+        wrapped_type = wrapper_types.get(self)
+        if wrapped_type is None:
+            wrapped_type = ProtocolWrapper(self, clas, self.members, ctx)
+            if len(wrapper_types) >= self.wrapper_types_limit:
+                del wrapper_types[next(iter(wrapper_types))]
+            wrapper_types[self] = wrapped_type
+        return wrapped_type(arg, ctx)
 
     def base_type(self) -> list[Any]:
         # Prevent Classes implementing multiple Protocols in one Union by accident.
@@ -151,54 +189,91 @@ class ProtocolChecker(TypeChecker):
 def ProtocolWrapper(protocolchecker: ProtocolChecker, original: type,
                     members: Dict[str, Tuple[inspect.Signature, dict[str, TypeChecker], FunctionCondition]],
                     ctx: ExecutionContext):
+    note = GlobalConformanceCache.conformance(protocolchecker.proto, original, protocolchecker.typevars,
+                                              members.keys(),
+                                              lambda: _check_conformance(protocolchecker, original, members))
+    if note is not None:
+        raise ctx.wrap(UntypyTypeError(
+            expected=protocolchecker.describe(),
+            given=original.__name__
+        )).with_note(note)
+
     list_of_attr = dict()
     for fnname in members:
-        if not hasattr(original, fnname):
-            raise ctx.wrap(UntypyTypeError(
-                expected=protocolchecker.describe(),
-                given=original.__name__
-            )).with_note(
-                f"Type {original.__name__} does not meet the requirements of protocol {protocolchecker.proto.__name__}. It is missing the function '{fnname}'")
-
         original_fn = getattr(original, fnname)
-        try:
-            # fails on built ins - YEAH
-            original_fn_signature = inspect.signature(original_fn)
-        except:
-            original_fn_signature = None
-
         if hasattr(original_fn, '__wf'):
             original_fn = getattr(original_fn, '__wf')
         (sig, argdict, fc) = members[fnname]
-
-        for param in sig.parameters:
-            if original_fn_signature is not None and param not in original_fn_signature.parameters:
-                raise ctx.wrap(UntypyTypeError(
-                    expected=protocolchecker.describe(),
-                    given=original.__name__
-                )).with_note(
-                    f"Type {original.__name__} does not meet the requirements of protocol {protocolchecker.proto.__name__}. The signature of '{fnname}' does not match. Missing required parameter {param}")
-
         list_of_attr[fnname] = ProtocolWrappedFunction(original_fn, sig, argdict, protocolchecker, fc).build()
 
+    # Attributes known from the class are forwarded by descriptors,
+    # others (e.g. set in __init__) by __getattr__.
+    for attr in _known_attributes(original):
+        if attr not in list_of_attr:
+            list_of_attr[attr] = _forwarded_attribute(attr)
+
     def constructor(me, inner, ctx):
-        me._ProtocolWrappedFunction__inner = inner
-        me._ProtocolWrappedFunction__ctx = ctx
+        set_inner(me, inner)
+        set_ctx(me, ctx)
 
     def __getattr__(me, name):
         return getattr(me._ProtocolWrappedFunction__inner, name)
 
     def __setattr__(me, name, value):
-        if name == '_ProtocolWrappedFunction__inner':
-            super(type(me), me).__setattr__('_ProtocolWrappedFunction__inner', value)
-        else:
-            return setattr(me._ProtocolWrappedFunction__inner, name, value)
+        return setattr(me._ProtocolWrappedFunction__inner, name, value)
 
+    list_of_attr['__slots__'] = ('_ProtocolWrappedFunction__inner', '_ProtocolWrappedFunction__ctx')
     list_of_attr['__init__'] = constructor
     list_of_attr['__getattr__'] = __getattr__  # allow access of attributes
     list_of_attr['__setattr__'] = __setattr__  # allow access of attributes
     name = f"{protocolchecker.proto.__name__}For{original.__name__}"
-    return type(name, (), list_of_attr)
+    wrapper_type = type(name, (), list_of_attr)
+    set_inner = wrapper_type._ProtocolWrappedFunction__inner.__set__
+    set_ctx = wrapper_type._ProtocolWrappedFunction__ctx.__set__
+    return wrapper_type
+
+
+def _check_conformance(protocolchecker: ProtocolChecker, original: type,
+                       members: Dict[str, Tuple[inspect.Signature, dict[str, TypeChecker], FunctionCondition]]) \
+        -> Optional[str]:
+    for fnname in members:
+        if not hasattr(original, fnname):
+            return f"Type {original.__name__} does not meet the requirements of protocol {protocolchecker.proto.__name__}. It is missing the function '{fnname}'"
+
+        original_fn = getattr(original, fnname)
+        try:
+            # fails on built ins - YEAH
+            original_fn_signature = inspect.signature(original_fn)
+        except:
+            original_fn_signature = None
+
+        (sig, argdict, fc) = members[fnname]
+        for param in sig.parameters:
+            if original_fn_signature is not None and param not in original_fn_signature.parameters:
+                return f"Type {original.__name__} does not meet the requirements of protocol {protocolchecker.proto.__name__}. The signature of '{fnname}' does not match. Missing required parameter {param}"
+    return None
+
+
+def _known_attributes(clas: type) -> set[str]:
+    names = set()
+    for c in clas.__mro__:
+        if c is object:
+            continue
+        names.update(getattr(c, '__annotations__', {}).keys())
+        names.update(vars(c).keys())
+        slots = vars(c).get('__slots__', ())
+        names.update([slots] if isinstance(slots, str) else slots)
+    return set(n for n in names if not (n.startswith('__') and n.endswith('__')))
+
+
+def _forwarded_attribute(name: str) -> property:
+    def fset(me, value):
+        setattr(me._ProtocolWrappedFunction__inner, name, value)
+
+    def fdel(me):
+        delattr(me._ProtocolWrappedFunction__inner, name)
+
+    return property(attrgetter(f"_ProtocolWrappedFunction__inner.{name}"), fset, fdel)
 
 
 class ProtocolWrappedFunction(WrappedFunction):
@@ -212,6 +287,7 @@ class ProtocolWrappedFunction(WrappedFunction):
         self.checker = checker
         self.protocol = protocol
         self.fc = fc
+        self.stats_name = f"{function_name(inner)} as {protocol.proto.__qualname__}"
 
     def build(self):
         fn = WrappedFunction.find_original(self.inner)
@@ -220,36 +296,73 @@ class ProtocolWrappedFunction(WrappedFunction):
         if hasattr(fn_of_protocol, '__wf'):
             fn_of_protocol = getattr(fn_of_protocol, '__wf')
 
+        caller = ProtocolWrapperFrame()
+        contexts = ArgumentExecutionContexts(fn_of_protocol, caller)
+        capture = wrapping_arguments(self.checker)
+        capture_receiver = self.may_keep_receiver()
+        if not capture_receiver:
+            inner_contexts = ProtocolArgumentExecutionContexts(self, caller.receiver)
+            inner_return_ctx = ProtocolReturnExecutionContext(self, ResponsibilityType.IN, caller.receiver)
+            return_ctx = ProtocolReturnExecutionContext(self, ResponsibilityType.OUT, caller.receiver)
+
         def wrapper(me, *args, **kwargs):
             inner_object = me.__inner
             inner_ctx = me.__ctx
 
-            caller = sys._getframe(1)
-            (args, kwargs, bind1) = self.wrap_arguments(lambda n: ArgumentExecutionContext(fn_of_protocol, caller, n),
-                                                        (inner_object, *args), kwargs)
+            if capture:
+                ctxprv = contexts.capturing(sys._getframe(1), capture)
+            else:
+                ctxprv = contexts.__getitem__
+            (args, kwargs, bind1) = self.wrap_arguments(ctxprv, (inner_object, *args), kwargs)
+            if capture_receiver:
+                receiver = lambda: (inner_object, inner_ctx)
+                inner_ctxprv = lambda n: ProtocolArgumentExecutionContext(self, n, receiver)
+            else:
+                inner_ctxprv = inner_contexts.__getitem__
             if isinstance(self.inner, WrappedFunction):
-                (args, kwargs, bind2) = self.inner.wrap_arguments(lambda n:
-                                                                  ProtocolArgumentExecutionContext(self, n,
-                                                                                                   inner_object,
-                                                                                                   inner_ctx),
-                                                                  args, kwargs)
+                (args, kwargs, bind2) = self.inner.wrap_arguments(inner_ctxprv, args, kwargs)
             ret = fn(*args, **kwargs)
             if isinstance(self.inner, WrappedFunction):
-                ret = self.inner.wrap_return(ret, bind2, ProtocolReturnExecutionContext(self,
-                                                                                        ResponsibilityType.IN,
-                                                                                        inner_object,
-                                                                                        inner_ctx))
-            return self.wrap_return(ret, bind1, ProtocolReturnExecutionContext(self,
-                                                                               ResponsibilityType.OUT, inner_object,
-                                                                               inner_ctx))
-
-        async def async_wrapper(*args, **kwargs):
-            raise AssertionError("Not correctly implemented see wrapper")
-
-        if inspect.iscoroutine(self.inner):
+                if capture_receiver:
+                    ctx = ProtocolReturnExecutionContext(self, ResponsibilityType.IN, receiver)
+                else:
+                    ctx = inner_return_ctx
+                ret = self.inner.wrap_return(ret, bind2, ctx)
+            if capture_receiver:
+                ctx = ProtocolReturnExecutionContext(self, ResponsibilityType.OUT, receiver)
+            else:
+                ctx = return_ctx
+            return self.wrap_return(ret, bind1, ctx)
+
+        def check_awaited(ret, bind1, bind2, receiver):
+            if isinstance(self.inner, WrappedFunction):
+                ret = self.inner.wrap_return(ret, bind2,
+                                             ProtocolReturnExecutionContext(self, ResponsibilityType.IN, receiver))
+            return self.wrap_return(ret, bind1, ProtocolReturnExecutionContext(self, ResponsibilityType.OUT, receiver))
+
+        def async_wrapper(me, *args, **kwargs):
+            inner_object = me.__inner
+            inner_ctx = me.__ctx
+
+            if capture:
+                ctxprv = contexts.capturing(sys._getframe(1), capture)
+            else:
+                ctxprv = contexts.__getitem__
+            (args, kwargs, bind1) = self.wrap_arguments(ctxprv, (inner_object, *args), kwargs)
+            # The result is checked after this call returned, so the receiver is always kept.
+            receiver = lambda: (inner_object, inner_ctx)
+            bind2 = None
+            if isinstance(self.inner, WrappedFunction):
+                inner_ctxprv = lambda n: ProtocolArgumentExecutionContext(self, n, receiver)
+                (args, kwargs, bind2) = self.inner.wrap_arguments(inner_ctxprv, args, kwargs)
+            return TypedAwaitable(fn(*args, **kwargs), lambda ret, _: check_awaited(ret, bind1, bind2, receiver), None)
+
+        if is_coroutine_function(fn):
             w = async_wrapper
+            mark_coroutine_function(w)
         else:
             w = wrapper
+        caller.add(w.__code__)
 
         setattr(w, '__wrapped__', fn)
         setattr(w, '__name__', fn.__name__)
@@ -257,6 +370,23 @@ class ProtocolWrappedFunction(WrappedFunction):
         setattr(w, '__wf', self)
         return w
 
+    def may_keep_receiver(self) -> bool:
+        """
+        If a context referring to the wrapped object may outlive the call,
+        as a checker of the protocol or the implementation may wrap a value.
+        """
+        if self.checker['return'].may_be_wrapped():
+            return True
+        if not isinstance(self.inner, WrappedFunction):
+            return False
+        try:
+            for name in [*self.signature.parameters, 'return']:
+                if self.inner.checker_for(name).may_be_wrapped():
+                    return True
+        except (KeyError, NotImplementedError):
+            return True
+        return False
+
     def get_original(self):
         return self.inner
 
@@ -265,16 +395,24 @@ class ProtocolWrappedFunction(WrappedFunction):
         bindings.apply_defaults()
         if self.fc is not None:
             self.fc.prehook(bindings, ctxprv)
+        counters = GlobalStats.counters(self.stats_name) if GlobalStats.enabled else None
+        if counters is not None:
+            counters.calls += 1
         for name in bindings.arguments:
             check = self.checker[name]
             ctx = ctxprv(name)
-            bindings.arguments[name] = check.check_and_wrap(bindings.arguments[name], ctx)
+            if counters is None:
+                bindings.arguments[name] = check.check_and_wrap(bindings.arguments[name], ctx)
+            else:
+                bindings.arguments[name] = counted(counters, check, bindings.arguments[name], ctx)
         return bindings.args, bindings.kwargs, bindings
 
     def wrap_return(self, ret, bindings, ctx: ExecutionContext):
         check = self.checker['return']
         if self.fc is not None:
             self.fc.posthook(ret, bindings, ctx)
+        if GlobalStats.enabled:
+            return counted(GlobalStats.counters(self.stats_name), check, ret, ctx)
         return check.check_and_wrap(ret, ctx)
 
     def describe(self) -> str:
@@ -289,14 +427,27 @@ class ProtocolWrappedFunction(WrappedFunction):
         return WrappedFunction.find_location(getattr(self.protocol.proto, fn.__name__))
 
 
+class ProtocolWrapperFrame(LazyCallerFrame):
+
+    def receiver(self) -> Tuple[Any, ExecutionContext]:
+        """
+        The wrapped object and the context of the protocol check in the running wrapper.
+        """
+        frame = self.wrapper_frame()
+        return frame.f_locals['inner_object'], frame.f_locals['inner_ctx']
+
+
+ProtocolReceiver = Callable[[], Tuple[Any, ExecutionContext]]
+
+
 class ProtocolReturnExecutionContext(ExecutionContext):
-    def __init__(self, wf: ProtocolWrappedFunction, invert: ResponsibilityType, me: Any, ctx: ExecutionContext):
+    def __init__(self, wf: ProtocolWrappedFunction, invert: ResponsibilityType, receiver: ProtocolReceiver):
         self.wf = wf
         self.invert = invert
-        self.me = me
-        self.ctx = ctx
+        self.receiver = receiver
 
     def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        (me, ctx) = self.receiver()
         err = ReturnExecutionContext(self.wf).wrap(err)
 
         if err.responsibility_type is self.invert:
@@ -320,23 +471,35 @@ class ProtocolReturnExecutionContext(ExecutionContext):
                 f"The annotation '{inner.checker_for('return').describe()}' is incompatible with the {self.wf.protocol.protocol_type()}'s annotation '{self.wf.checker_for('return').describe()}'\nwhen checking against the following value:")
 
         previous_chain = UntypyTypeError(
-            self.me,
+            me,
             f"{self.wf.protocol.protoname()}"
         ).with_note(
-            f"Type '{type(self.me).__name__}' does not implement {self.wf.protocol.protocol_type()} '{self.wf.protocol.protoname()}' correctly.")
+            f"Type '{type(me).__name__}' does not implement {self.wf.protocol.protocol_type()} '{self.wf.protocol.protoname()}' correctly.")
 
-        previous_chain = self.ctx.wrap(previous_chain)
+        previous_chain = ctx.wrap(previous_chain)
         return err.with_previous_chain(previous_chain)
 
 
+class ProtocolArgumentExecutionContexts(dict):
+    def __init__(self, wf: ProtocolWrappedFunction, receiver: ProtocolReceiver):
+        super().__init__()
+        self.wf = wf
+        self.receiver = receiver
+
+    def __missing__(self, arg_name):
+        ctx = ProtocolArgumentExecutionContext(self.wf, arg_name, self.receiver)
+        self[arg_name] = ctx
+        return ctx
+
+
 class ProtocolArgumentExecutionContext(ExecutionContext):
-    def __init__(self, wf: ProtocolWrappedFunction, arg_name: str, me: Any, ctx: ExecutionContext):
+    def __init__(self, wf: ProtocolWrappedFunction, arg_name: str, receiver: ProtocolReceiver):
         self.wf = wf
         self.arg_name = arg_name
-        self.me = me
-        self.ctx = ctx
+        self.receiver = receiver
 
     def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        (me, ctx) = self.receiver()
         (original_expected, _ind) = err.next_type_and_indicator()
         err = ArgumentExecutionContext(self.wf, None, self.arg_name).wrap(err)
 
@@ -356,12 +519,12 @@ class ProtocolArgumentExecutionContext(ExecutionContext):
             f"The annotation '{original_expected}' is incompatible with the {self.wf.protocol.protocol_type()}'s annotation '{self.wf.checker_for(self.arg_name).describe()}'\nwhen checking against the following value:")
 
         previous_chain = UntypyTypeError(
-            self.me,
+            me,
             f"{self.wf.protocol.protoname()}"
         ).with_note(
-            f"Type '{type(self.me).__name__}' does not implement {self.wf.protocol.protocol_type()} '{self.wf.protocol.protoname()}' correctly.")
+            f"Type '{type(me).__name__}' does not implement {self.wf.protocol.protocol_type()} '{self.wf.protocol.protoname()}' correctly.")
 
-        previous_chain = self.ctx.wrap(previous_chain)
+        previous_chain = ctx.wrap(previous_chain)
         # err = err.with_inverted_responsibility_type()
 
         return err.with_previous_chain(previous_chain)
@@ -377,6 +540,9 @@ class SimpleInstanceOfChecker(TypeChecker):
         else:
             raise ctx.wrap(UntypyTypeError(arg, self.describe()))
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return isinstance(arg, self.annotation), arg
+
     def describe(self) -> str:
         return self.annotation.__name__
 
@@ -0,0 +1,64 @@
+from typing import Any, Dict, List, Tuple, Iterable
+
+from untypy.interfaces import TypeCheckerFactory
+
+
+class FactoryRegistry:
+    """
+    Selects the factories which may handle an annotation by the type of the annotation
+    (including its base classes) and its __origin__. Candidates keep the order in
+    which they were registered, so more specific factories can still go first.
+    """
+
+    def __init__(self):
+        self.by_type: Dict[type, List[Tuple[int, TypeCheckerFactory]]] = dict()
+        self.by_origin: Dict[Any, List[Tuple[int, TypeCheckerFactory]]] = dict()
+        self.dispatch: Dict[Tuple[type, Any], Tuple[TypeCheckerFactory, ...]] = dict()
+        self.lowest = 0
+        self.highest = 0
+
+    def register(self, factory: TypeCheckerFactory, *, types: Iterable[type] = (), origins: Iterable[Any] = (),
+                 first: bool = False) -> None:
+        if first:
+            self.lowest -= 1
+            priority = self.lowest
+        else:
+            self.highest += 1
+            priority = self.highest
+
+        types = list(types)
+        origins = list(origins)
+        if len(types) == 0 and len(origins) == 0:
+            types = [object]  # responsible for everything
+
+        for t in types:
+            self.by_type.setdefault(t, []).append((priority, factory))
+        for o in origins:
+            self.by_origin.setdefault(o, []).append((priority, factory))
+        self.dispatch.clear()
+
+    def factories_for(self, annotation: Any) -> Tuple[TypeCheckerFactory, ...]:
+        ty = type(annotation)
+        origin = getattr(annotation, '__origin__', None)
+        key = (ty, origin)
+        try:
+            return self.dispatch[key]
+        except KeyError:
+            factories = self.collect(ty, origin)
+            self.dispatch[key] = factories
+            return factories
+        except TypeError:  # unhashable __origin__
+            return self.collect(ty, None)
+
+    def collect(self, ty: type, origin: Any) -> Tuple[TypeCheckerFactory, ...]:
+        candidates = []
+        for t in ty.__mro__:
+            candidates.extend(self.by_type.get(t, []))
+        if origin is not None:
+            candidates.extend(self.by_origin.get(origin, []))
+
+        out = []
+        for (_, factory) in sorted(candidates, key=lambda c: c[0]):
+            if factory not in out:
+                out.append(factory)
+        return tuple(out)
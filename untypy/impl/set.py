@@ -0,0 +1,339 @@
+import sys
+from types import GenericAlias
+from typing import Any, Optional, Set, FrozenSet, Tuple
+
+from untypy.error import UntypyTypeError, Frame, Location, LazyCallerFrame
+from untypy.impl.collection_policy import GlobalCollectionPolicy, scan
+from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
+
+
+class SetFactory(TypeCheckerFactory):
+
+    def create_from(self, annotation: Any, ctx: CreationContext) -> Optional[TypeChecker]:
+        if (type(annotation) is GenericAlias or type(annotation) is type(Set[int])) \
+                and annotation.__origin__ in (set, frozenset):
+            assert len(annotation.__args__) == 1
+            inner = ctx.find_checker(annotation.__args__[0])
+            if inner is None:
+                return None
+            if annotation.__origin__ is set:
+                return SetChecker(inner, ctx.declared_location())
+            else:
+                return FrozenSetChecker(inner, ctx.declared_location())
+        else:
+            return None
+
+
+class SetChecker(TypeChecker):
+    inner: TypeChecker
+    declared: Location
+    origin = set
+    name = "set"
+
+    def __init__(self, inner: TypeChecker, declared: Location):
+        self.inner = inner
+        self.declared = declared
+        if inner.may_be_wrapped():
+            self.caller_ctx = None
+        else:
+            self.caller_ctx = SetCallerExecutionContext(TypedSet.caller, declared, self.name)
+
+    def may_be_wrapped(self) -> bool:
+        return True
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if not issubclass(type(arg), self.origin):
+            raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        if type(arg) is self.proxy and arg.checker.inner is self.inner:
+            # Already checked the same way. A proxy over the same set keeps the checks flat,
+            # values it reads are blamed as before, values written through it on this boundary.
+            return self.proxy(arg.inner, self, arg.ctx)
+
+        ctx = SetExecutionContext(ctx, self.name)
+        if GlobalCollectionPolicy.is_eager(self.name, len(arg)) and scan(self.inner, arg, ctx):
+            return arg
+        return self.proxy(arg, self, ctx)
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        return issubclass(type(arg), self.origin), arg
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return [self.origin]
+
+    def base_type(self) -> list[Any]:
+        return [self.origin]
+
+    def describe(self) -> str:
+        return f"{self.name}[{self.inner.describe()}]"
+
+
+class FrozenSetChecker(SetChecker):
+    origin = frozenset
+    name = "frozenset"
+
+    def may_be_wrapped(self) -> bool:
+        return not self.inner.is_identity_preserving()
+
+    def is_identity_preserving(self) -> bool:
+        return self.inner.is_identity_preserving()
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if not self.inner.is_identity_preserving():
+            return super().check_and_wrap(arg, ctx)
+
+        # frozensets cannot change, so they are checked completely, but never wrapped
+        if not issubclass(type(arg), frozenset):
+            raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+        scan(self.inner, arg, SetExecutionContext(ctx, self.name))
+        return arg
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        if not issubclass(type(arg), frozenset):
+            return False, None
+        if self.inner.is_identity_preserving():
+            for x in arg:
+                if not self.inner.try_check(x)[0]:
+                    return False, None
+        return True, arg
+
+
+class SetExecutionContext(ExecutionContext):
+    upper: ExecutionContext
+
+    def __init__(self, upper: ExecutionContext, name: str):
+        self.upper = upper
+        self.name = name
+
+    def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        next_type, indicator = err.next_type_and_indicator()
+
+        err = err.with_frame(Frame(
+            f"{self.name}[{next_type}]",
+            (" " * len(self.name + "[") + indicator),
+            None,
+            None
+        ))
+        return self.upper.wrap(err)
+
+
+class SetCallerExecutionContext(ExecutionContext):
+    declared: Location
+
+    def __init__(self, stack, declared: Location, name: str):
+        self.stack = stack
+        self.declared = declared
+        self.name = name
+
+    def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        next_type, indicator = err.next_type_and_indicator()
+        return err.with_frame(Frame(
+            f"{self.name}[{next_type}]",
+            (" " * len(self.name + "[") + indicator),
+            declared=self.declared,
+            responsable=Location.from_stack(self.stack)
+        ))
+
+
+def _unwrap(other):
+    if isinstance(other, TypedSetBase):
+        return other.inner
+    return other
+
+
+class TypedSetBase:
+    """
+    The operations of sets and frozensets. Operations which build a new set
+    return a plain one, like TypedList.copy.
+    """
+    inner: frozenset
+    checker: SetChecker
+    ctx: ExecutionContext
+
+    def _caller_ctx(self):
+        ctx = self.checker.caller_ctx
+        if ctx is None:
+            # the caller of the proxy method is captured, as a wrapped element may keep the context
+            ctx = SetCallerExecutionContext(sys._getframe(2), self.checker.declared, self.checker.name)
+        return ctx
+
+    def __contains__(self, item):
+        self.checker.inner.check_and_wrap(item, self._caller_ctx())
+        return self.inner.__contains__(item)
+
+    def __iter__(self):
+        checker = self.checker.inner
+        ctx = self.ctx
+        for x in self.inner:
+            yield checker.check_and_wrap(x, ctx)
+
+    def __len__(self):
+        return self.inner.__len__()
+
+    def copy(self):
+        return self.inner.copy()
+
+    def __copy__(self):
+        return self.inner.copy()
+
+    def union(self, *others):
+        return self.inner.union(*map(_unwrap, others))
+
+    def intersection(self, *others):
+        return self.inner.intersection(*map(_unwrap, others))
+
+    def difference(self, *others):
+        return self.inner.difference(*map(_unwrap, others))
+
+    def symmetric_difference(self, other):
+        return self.inner.symmetric_difference(_unwrap(other))
+
+    def issubset(self, other):
+        return self.inner.issubset(_unwrap(other))
+
+    def issuperset(self, other):
+        return self.inner.issuperset(_unwrap(other))
+
+    def isdisjoint(self, other):
+        return self.inner.isdisjoint(_unwrap(other))
+
+    def __or__(self, other):
+        return self.inner.__or__(_unwrap(other))
+
+    def __ror__(self, other):
+        return self.inner.__ror__(_unwrap(other))
+
+    def __and__(self, other):
+        return self.inner.__and__(_unwrap(other))
+
+    def __rand__(self, other):
+        return self.inner.__rand__(_unwrap(other))
+
+    def __sub__(self, other):
+        return self.inner.__sub__(_unwrap(other))
+
+    def __rsub__(self, other):
+        return self.inner.__rsub__(_unwrap(other))
+
+    def __xor__(self, other):
+        return self.inner.__xor__(_unwrap(other))
+
+    def __rxor__(self, other):
+        return self.inner.__rxor__(_unwrap(other))
+
+    def __eq__(self, other):
+        return self.inner.__eq__(_unwrap(other))
+
+    def __ne__(self, other):
+        return self.inner.__ne__(_unwrap(other))
+
+    def __le__(self, other):
+        return self.inner.__le__(_unwrap(other))
+
+    def __lt__(self, other):
+        return self.inner.__lt__(_unwrap(other))
+
+    def __ge__(self, other):
+        return self.inner.__ge__(_unwrap(other))
+
+    def __gt__(self, other):
+        return self.inner.__gt__(_unwrap(other))
+
+    def __repr__(self):
+        return self.inner.__repr__()
+
+    def __str__(self):
+        return self.inner.__str__()
+
+    def __sizeof__(self):
+        return self.inner.__sizeof__()
+
+
+class TypedSet(TypedSetBase, set):
+    inner: set
+
+    def __init__(self, inner, checker, ctx):
+        super().__init__()
+        self.inner = inner
+        self.checker = checker
+        self.ctx = ctx
+
+    # Perform type check
+    def add(self, elem) -> None:
+        self.inner.add(self.checker.inner.check_and_wrap(elem, self._caller_ctx()))
+
+    def update(self, *others) -> None:
+        checker = self.checker.inner
+        ctx = self._caller_ctx()
+        # all elements are checked first, so the set is unchanged if one is rejected
+        self.inner.update([checker.check_and_wrap(x, ctx) for other in others for x in _unwrap(other)])
+
+    def __ior__(self, other):
+        checker = self.checker.inner
+        ctx = self._caller_ctx()
+        self.inner.update([checker.check_and_wrap(x, ctx) for x in _unwrap(other)])
+        return self
+
+    def symmetric_difference_update(self, other) -> None:
+        checker = self.checker.inner
+        ctx = self._caller_ctx()
+        self.inner.symmetric_difference_update({checker.check_and_wrap(x, ctx) for x in _unwrap(other)})
+
+    def __ixor__(self, other):
+        checker = self.checker.inner
+        ctx = self._caller_ctx()
+        self.inner.symmetric_difference_update({checker.check_and_wrap(x, ctx) for x in _unwrap(other)})
+        return self
+
+    def pop(self):
+        return self.checker.inner.check_and_wrap(self.inner.pop(), self.ctx)
+
+    # Delete, ...
+    def remove(self, elem) -> None:
+        return self.inner.remove(elem)
+
+    def discard(self, elem) -> None:
+        return self.inner.discard(elem)
+
+    def clear(self) -> None:
+        return self.inner.clear()
+
+    def difference_update(self, *others) -> None:
+        return self.inner.difference_update(*map(_unwrap, others))
+
+    def intersection_update(self, *others) -> None:
+        return self.inner.intersection_update(*map(_unwrap, others))
+
+    def __isub__(self, other):
+        self.inner.__isub__(_unwrap(other))
+        return self
+
+    def __iand__(self, other):
+        self.inner.__iand__(_unwrap(other))
+        return self
+
+    __hash__ = None
+
+
+TypedSet.caller = LazyCallerFrame(TypedSet.__contains__.__code__, TypedSet.add.__code__, TypedSet.update.__code__,
+                                  TypedSet.__ior__.__code__, TypedSet.symmetric_difference_update.__code__,
+                                  TypedSet.__ixor__.__code__)
+
+
+class TypedFrozenSet(TypedSetBase, frozenset):
+    inner: frozenset
+
+    def __new__(cls, inner, checker, ctx):
+        return super().__new__(cls)
+
+    def __init__(self, inner, checker, ctx):
+        super().__init__()
+        self.inner = inner
+        self.checker = checker
+        self.ctx = ctx
+
+    def __hash__(self):
+        return self.inner.__hash__()
+
+
+SetChecker.proxy = TypedSet
+FrozenSetChecker.proxy = TypedFrozenSet
@@ -1,5 +1,5 @@
 import abc
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Tuple
 
 from untypy.error import UntypyTypeError
 from untypy.impl.protocol import ProtocolChecker
@@ -56,7 +56,25 @@ class SimpleChecker(TypeChecker):
 
 
     def may_be_wrapped(self) -> bool:
-        return True
+        return self.parent_checker is not None
+
+    def is_identity_preserving(self) -> bool:
+        return self.parent_checker is None and not self.always_wrap
+
+    def indexed_types(self) -> Optional[list[type]]:
+        # isinstance of abstract base classes does not depend on the __mro__
+        if type(self.annotation) is not type:
+            return None
+        if self.annotation is float:
+            return [float, int]
+        return [self.annotation]
+
+    def exact_types(self) -> Optional[list[type]]:
+        if not self.is_identity_preserving():
+            return None
+        if self.annotation is float:
+            return [float, int]
+        return [self.annotation]
 
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         if simpleTypeCompat(arg, self.annotation) and not self.always_wrap:
@@ -69,6 +87,15 @@ class SimpleChecker(TypeChecker):
         else:
             raise ctx.wrap(UntypyTypeError(arg, self.describe()))
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        if simpleTypeCompat(arg, self.annotation) and not self.always_wrap:
+            return True, arg
+        if self.parent_checker is not None:
+            return super().try_check(arg)
+        if isinstance(arg, self.annotation):
+            return True, arg
+        return False, None
+
     def describe(self) -> str:
         return self.annotation.__name__
 
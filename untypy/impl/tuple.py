@@ -1,6 +1,6 @@
 from typing import Any, Optional, Tuple
 
-from untypy.error import UntypyTypeError
+from untypy.error import UntypyTypeError, Frame
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
 from untypy.util import CompoundTypeExecutionContext
 
@@ -12,6 +12,12 @@ class TupleFactory(TypeCheckerFactory):
 
     def create_from(self, annotation: Any, ctx: CreationContext) -> Optional[TypeChecker]:
         if (type(annotation) is TupleType or type(annotation) is TupleTypeB) and annotation.__origin__ == tuple:
+            if len(annotation.__args__) == 2 and annotation.__args__[1] is Ellipsis:
+                checker = ctx.find_checker(annotation.__args__[0])
+                if checker is None:
+                    return None
+                return VariadicTupleChecker(checker)
+
             inner = []
             for arg in annotation.__args__:
                 checker = ctx.find_checker(arg)
@@ -30,18 +36,54 @@ class TupleChecker(TypeChecker):
 
     def __init__(self, inner: list[TypeChecker]):
         self.inner = inner
+        self.identity = all(checker.is_identity_preserving() for checker in inner)
+        # per element: the types which are accepted without asking the checker
+        self.exact = []
+        for checker in inner:
+            exact = checker.exact_types()
+            self.exact.append(frozenset() if exact is None else frozenset(exact))
+
+    def may_be_wrapped(self) -> bool:
+        return any(checker.may_be_wrapped() for checker in self.inner)
+
+    def is_identity_preserving(self) -> bool:
+        return self.identity
 
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
-        if not type(arg) is tuple or len(arg) != len(self.inner):
+        if not isinstance(arg, tuple) or len(arg) != len(self.inner):
             raise ctx.wrap(UntypyTypeError(arg, self.describe()))
 
+        if self.identity:
+            # The original tuple is returned, contexts are only needed for errors.
+            for idx, (elm, checker, exact) in enumerate(zip(arg, self.inner, self.exact)):
+                if type(elm) not in exact and not checker.try_check(elm)[0]:
+                    checker.check_and_wrap(elm, TupleExecutionContext(ctx, self.inner, idx))
+            return arg
+
         out = []
         idx = 0
         for elm, checker in zip(arg, self.inner):
             out.append(checker.check_and_wrap(elm, TupleExecutionContext(ctx, self.inner, idx)))
             idx += 1
 
-        return tuple(out)
+        return rebuild(arg, out)
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return [tuple]
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        if not isinstance(arg, tuple) or len(arg) != len(self.inner):
+            return False, None
+
+        out = []
+        for elm, checker in zip(arg, self.inner):
+            (ok, value) = checker.try_check(elm)
+            if not ok:
+                return False, None
+            out.append(value)
+        if self.identity:
+            return True, arg
+        return True, rebuild(arg, out)
 
     def base_type(self) -> Any:
         out = []
@@ -57,3 +99,84 @@ class TupleChecker(TypeChecker):
 class TupleExecutionContext(CompoundTypeExecutionContext):
     def name(self):
         return "Tuple"
+
+
+class VariadicTupleChecker(TypeChecker):
+    inner: TypeChecker
+
+    def __init__(self, inner: TypeChecker):
+        self.inner = inner
+        exact = inner.exact_types() if inner.is_identity_preserving() else None
+        self.exact = None if exact is None else frozenset(exact)
+
+    def may_be_wrapped(self) -> bool:
+        return self.inner.may_be_wrapped()
+
+    def is_identity_preserving(self) -> bool:
+        return self.inner.is_identity_preserving()
+
+    def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
+        if not isinstance(arg, tuple):
+            raise ctx.wrap(UntypyTypeError(arg, self.describe()))
+
+        checker = self.inner
+        if self.exact is not None and self.exact.issuperset(map(type, arg)):
+            return arg
+        if checker.is_identity_preserving():
+            for elm in arg:
+                if not checker.try_check(elm)[0]:
+                    checker.check_and_wrap(elm, VariadicTupleExecutionContext(ctx))
+            return arg
+
+        ctx = VariadicTupleExecutionContext(ctx)
+        return rebuild(arg, [checker.check_and_wrap(elm, ctx) for elm in arg])
+
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        if not isinstance(arg, tuple):
+            return False, None
+        if self.exact is not None and self.exact.issuperset(map(type, arg)):
+            return True, arg
+
+        out = []
+        for elm in arg:
+            (ok, value) = self.inner.try_check(elm)
+            if not ok:
+                return False, None
+            out.append(value)
+        if self.inner.is_identity_preserving():
+            return True, arg
+        return True, rebuild(arg, out)
+
+    def indexed_types(self) -> Optional[list[type]]:
+        return [tuple]
+
+    def base_type(self) -> Any:
+        return [tuple]
+
+    def describe(self) -> str:
+        return f"Tuple[{self.inner.describe()}, ...]"
+
+
+class VariadicTupleExecutionContext(ExecutionContext):
+    upper: ExecutionContext
+
+    def __init__(self, upper: ExecutionContext):
+        self.upper = upper
+
+    def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        next_type, indicator = err.next_type_and_indicator()
+
+        err = err.with_frame(Frame(
+            f"Tuple[{next_type}, ...]",
+            (" " * len("Tuple[") + indicator),
+            None,
+            None
+        ))
+        return self.upper.wrap(err)
+
+
+def rebuild(arg: tuple, values: list) -> tuple:
+    # keeps the class of named tuples
+    if type(arg) is not tuple and hasattr(arg, '_make'):
+        return arg._make(values)
+    return tuple(values)
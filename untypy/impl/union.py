@@ -1,4 +1,4 @@
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, Tuple
 
 from untypy.error import UntypyTypeError, UntypyAttributeError
 from untypy.interfaces import TypeChecker, TypeCheckerFactory, CreationContext, ExecutionContext
@@ -27,6 +27,9 @@ class UnionFactory(TypeCheckerFactory):
 class UnionChecker(TypeChecker):
     inner: list[TypeChecker]
 
+    # at most this many concrete types are remembered
+    dispatch_limit = 256
+
     def __init__(self, inner: list[TypeChecker], ctx: CreationContext):
         # especially Protocols must be checked in a specific order.
         self.inner = sorted(inner, key=lambda t: -t.base_type_priority())
@@ -44,21 +47,73 @@ class UnionChecker(TypeChecker):
                 else:
                     dups[base_type] = checker
 
-    def check_and_wrap(self, arg: Any, upper: ExecutionContext) -> Any:
-        idx = 0
+        self.indexed = [checker.indexed_types() for checker in self.inner]
+        self.dispatch = dict()
+
+    def may_be_wrapped(self) -> bool:
+        return any(checker.may_be_wrapped() for checker in self.inner)
+
+    def is_identity_preserving(self) -> bool:
+        return all(checker.is_identity_preserving() for checker in self.inner)
+
+    def indexed_types(self) -> Optional[list[type]]:
+        out = []
+        for types in self.indexed:
+            if types is None:
+                return None
+            out.extend(types)
+        return out
+
+    def exact_types(self) -> Optional[list[type]]:
+        out = []
         for checker in self.inner:
-            ctx = UnionExecutionContext(upper, self.inner, idx)
-            idx += 1
-            try:
-                return checker.check_and_wrap(arg, ctx)
-            except UntypyTypeError as _e:
-                pass
+            types = checker.exact_types()
+            if types is None:
+                return None
+            out.extend(types)
+        return out
+
+    def candidates(self, ty: type) -> Tuple[Tuple[int, TypeChecker], ...]:
+        """
+        The alternatives which may accept a value of type ty, with their index.
+        """
+        try:
+            return self.dispatch[ty]
+        except KeyError:
+            mro = ty.__mro__
+            out = tuple((idx, checker) for (idx, checker) in enumerate(self.inner)
+                        if self.indexed[idx] is None or any(t in mro for t in self.indexed[idx]))
+            if len(self.dispatch) >= self.dispatch_limit:
+                self.dispatch.clear()
+            self.dispatch[ty] = out
+            return out
+
+    def check_and_wrap(self, arg: Any, upper: ExecutionContext) -> Any:
+        for (idx, checker) in self.candidates(type(arg)):
+            if checker.may_be_wrapped():
+                # the wrapper needs a context
+                ctx = UnionExecutionContext(upper, self.inner, idx)
+                try:
+                    return checker.check_and_wrap(arg, ctx)
+                except UntypyTypeError as _e:
+                    pass
+            else:
+                (ok, value) = checker.try_check(arg)
+                if ok:
+                    return value
 
         raise upper.wrap(UntypyTypeError(
             arg,
             self.describe()
         ))
 
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        for (_, checker) in self.candidates(type(arg)):
+            (ok, value) = checker.try_check(arg)
+            if ok:
+                return True, value
+        return False, None
+
     def describe(self) -> str:
         desc = lambda s: s.describe()
         return f"Union[{', '.join(map(desc, self.inner))}]"
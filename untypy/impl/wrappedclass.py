@@ -3,11 +3,13 @@ import sys
 from types import ModuleType
 from typing import Any, Callable, Union, Optional
 
-from untypy.error import Location, UntypyAttributeError
+from untypy.error import Location, UntypyAttributeError, LazyCallerFrame
 from untypy.impl.any import SelfChecker, AnyChecker
 from untypy.interfaces import TypeChecker, CreationContext, ExecutionContext, WrappedFunction, \
     WrappedFunctionContextProvider
-from untypy.util import ArgumentExecutionContext, ReturnExecutionContext
+from untypy.util import ReturnExecutionContext, ArgumentExecutionContexts, wrapping_arguments
+from untypy.util.awaitable import await_checked, is_coroutine_function, mark_coroutine_function
+from untypy.util.stats import GlobalStats, counted, function_name
 
 
 def find_signature(member, ctx: CreationContext):
@@ -124,45 +126,59 @@ class WrappedClassFunction(WrappedFunction):
         self.fc = None
         if hasattr(self.inner, "__fc"):
             self.fc = getattr(self.inner, "__fc")
+        self.stats_name = function_name(inner)
 
     def build(self):
         fn = self.inner
         name = fn.__name__
 
+        caller = LazyCallerFrame()
+        contexts = ArgumentExecutionContexts(self, caller, declared=self._declared)
+        shared = contexts.__getitem__
+        return_ctx = ReturnExecutionContext(self)
+        capture = wrapping_arguments(self.checker)
+        is_async = is_coroutine_function(fn)
+        if is_async:
+            wrap_return = await_checked(self.wrap_return)
+        else:
+            wrap_return = self.wrap_return
+
         def wrapper_cls(*args, **kwargs):
-            caller = sys._getframe(1)
-            (args, kwargs, bindings) = self.wrap_arguments(
-                lambda n: ArgumentExecutionContext(self, caller, n, declared=self.declared()),
-                args, kwargs)
+            if capture:
+                ctxprv = contexts.capturing(sys._getframe(1), capture)
+            else:
+                ctxprv = shared
+            (args, kwargs, bindings) = self.wrap_arguments(ctxprv, args, kwargs)
             ret = fn(*args, **kwargs)
-            return self.wrap_return(ret, bindings, ReturnExecutionContext(self))
+            return wrap_return(ret, bindings, return_ctx)
 
         def wrapper_self(me, *args, **kwargs):
             if name == '__init__':
                 me.__return_ctx = None
                 me.__inner = self.create_fn()
-            caller = sys._getframe(1)
-            (args, kwargs, bindings) = self.wrap_arguments(
-                lambda n: ArgumentExecutionContext(self, caller, n, declared=self.declared()),
-                (me.__inner, *args), kwargs)
+            if capture:
+                ctxprv = contexts.capturing(sys._getframe(1), capture)
+            else:
+                ctxprv = shared
+            (args, kwargs, bindings) = self.wrap_arguments(ctxprv, (me.__inner, *args), kwargs)
             ret = fn(*args, **kwargs)
             if me.__return_ctx is None:
-                return self.wrap_return(ret, bindings, ReturnExecutionContext(self))
+                return wrap_return(ret, bindings, return_ctx)
             else:
-                return self.wrap_return(ret, bindings, me.__return_ctx)
+                return wrap_return(ret, bindings, me.__return_ctx)
 
-        if inspect.iscoroutine(self.inner):
-            raise UntypyAttributeError("Async Functions are currently not supported.")
+        if 'self' in self.checker:
+            w = wrapper_self
         else:
-            if 'self' in self.checker:
-                w = wrapper_self
-            else:
-                w = wrapper_cls
+            w = wrapper_cls
+        caller.add(w.__code__)
 
         setattr(w, '__wrapped__', fn)
         setattr(w, '__name__', fn.__name__)
         setattr(w, '__signature__', self.signature)
         setattr(w, '__wf', self)
+        if is_async:
+            mark_coroutine_function(w)
         return w
 
     def get_original(self):
@@ -173,16 +189,24 @@ class WrappedClassFunction(WrappedFunction):
         bindings.apply_defaults()
         if self.fc is not None:
             self.fc.prehook(bindings, ctxprv)
+        counters = GlobalStats.counters(self.stats_name) if GlobalStats.enabled else None
+        if counters is not None:
+            counters.calls += 1
         for name in bindings.arguments:
             check = self.checker[name]
             ctx = ctxprv(name)
-            bindings.arguments[name] = check.check_and_wrap(bindings.arguments[name], ctx)
+            if counters is None:
+                bindings.arguments[name] = check.check_and_wrap(bindings.arguments[name], ctx)
+            else:
+                bindings.arguments[name] = counted(counters, check, bindings.arguments[name], ctx)
         return bindings.args, bindings.kwargs, bindings
 
     def wrap_return(self, ret, bindings, ctx: ExecutionContext):
         check = self.checker['return']
         if self.fc is not None:
             self.fc.posthook(ret, bindings, ctx)
+        if GlobalStats.enabled:
+            return counted(GlobalStats.counters(self.stats_name), check, ret, ctx)
         return check.check_and_wrap(ret, ctx)
 
     def describe(self) -> str:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import Optional, Any, Callable, TypeVar, List
+from typing import Optional, Any, Callable, TypeVar, List, Tuple
 
 from untypy.error import UntypyTypeError, Location, UntypyAttributeError
 
@@ -34,6 +34,15 @@ class ExecutionContext:
         raise NotImplementedError
 
 
+class ProbeExecutionContext(ExecutionContext):
+    """
+    Used to find out if a value would be accepted, the error is discarded anyway.
+    """
+
+    def wrap(self, err: UntypyTypeError) -> UntypyTypeError:
+        return err
+
+
 class TypeChecker:
 
     def describe(self) -> str:
@@ -42,6 +51,19 @@ class TypeChecker:
     def may_be_wrapped(self) -> bool:
         return False
 
+    # check_and_wrap returns either the argument itself or raises.
+    def is_identity_preserving(self) -> bool:
+        return False
+
+    # Types for which check_and_wrap accepts every value unchanged, if known.
+    def exact_types(self) -> Optional[list[type]]:
+        return None
+
+    # Classes of which every accepted value is an instance (by its __mro__), if known.
+    # Used to select the alternatives of a Union by the type of the value.
+    def indexed_types(self) -> Optional[list[type]]:
+        return None
+
     def base_type(self) -> list[Any]:
         raise NotImplementedError
 
@@ -52,6 +74,18 @@ class TypeChecker:
     def check_and_wrap(self, arg: Any, ctx: ExecutionContext) -> Any:
         raise NotImplementedError
 
+    # Returns (True, checked value) if arg is accepted and (False, None) otherwise, without raising.
+    # If the checker may wrap, only the shape of arg is checked and arg is returned unwrapped,
+    # call check_and_wrap with a proper context to get the wrapper.
+    def try_check(self, arg: Any) -> Tuple[bool, Any]:
+        try:
+            value = self.check_and_wrap(arg, ProbeExecutionContext())
+        except UntypyTypeError:
+            return False, None
+        if self.may_be_wrapped():
+            return True, arg
+        return True, value
+
 
 class TypeCheckerFactory:
 
@@ -1,15 +1,20 @@
 import inspect
 from collections import namedtuple
-from types import FunctionType
+from types import FunctionType, MappingProxyType
 from typing import Callable, Protocol, Optional
 
-from untypy.error import Location
-from untypy.impl import DefaultCreationContext
+from untypy.error import Location, LazyCallerFrame
+from untypy.impl import DefaultCreationContext, GlobalCheckerCache
 from untypy.impl.bound_generic import WrappedGenericAlias
 from untypy.impl.wrappedclass import WrappedType
+from untypy.patching.sampling import sample
+from untypy.util.awaitable import is_coroutine_function, mark_coroutine_function
 from untypy.util.typedfunction import TypedFunctionBuilder
 
-Config = namedtuple('PatchConfig', ['verbose', 'checkedprefixes'])
+# sample_rate is the fraction of calls which are checked, sample_rates overrides it
+# for modules, classes or functions given by their qualified name.
+Config = namedtuple('PatchConfig', ['verbose', 'checkedprefixes', 'sample_rate', 'sample_rates', 'sample_seed'],
+                    defaults=(1.0, MappingProxyType({}), None))
 DefaultConfig = Config(verbose=False, checkedprefixes=[""])
 not_patching = ['__class__']
 
@@ -20,6 +25,7 @@ def patch_class(clas: type, cfg: Config):
     if clas in GlobalPatchedList:
         return clas
     GlobalPatchedList.add(clas)
+    GlobalCheckerCache.class_defined(clas)
 
     try:
         ctx = DefaultCreationContext(
@@ -52,10 +58,10 @@ def wrap_function(fn: FunctionType, cfg: Config) -> Callable:
         if cfg.verbose:
             print(f"Patching Function: {fn.__name__}")
         try:
-            return TypedFunctionBuilder(fn, DefaultCreationContext(
+            return sample(fn, TypedFunctionBuilder(fn, DefaultCreationContext(
                 typevars=dict(),
                 declared_location=Location.from_code(fn),
-                checkedpkgprefixes=cfg.checkedprefixes)).build()
+                checkedpkgprefixes=cfg.checkedprefixes)).build(), cfg)
         except NameError:  # Argument Typ was not defined yet.
             class CallableContainer:
                 inner: Optional[Callable]
@@ -74,12 +80,15 @@ def wrap_function(fn: FunctionType, cfg: Config) -> Callable:
                 return lazy_typechecked
 
             w = lazy_typechecked_outer(CallableContainer())
+            LazyCallerFrame.transparent.add(w.__code__)
             setattr(w, '__wrapped__', fn)
             setattr(w, '__original', fn)
             setattr(w, '__name__', fn.__name__)
             setattr(w, '__signature__', inspect.signature(fn))
+            if is_coroutine_function(fn):
+                mark_coroutine_function(w)
 
-            return w
+            return sample(fn, w, cfg)
     else:
         return fn
 
@@ -23,6 +23,11 @@ class UntypyAstTransformer(ast.NodeTransformer):
         self.generic_visit(node)
         return node
 
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        node.decorator_list.insert(0, ast.Attribute(ast.Name("untypy", ast.Load()), "patch", ast.Load()))
+        self.generic_visit(node)
+        return node
+
     def visit_ClassDef(self, node: ast.FunctionDef):
         node.decorator_list.insert(0, ast.Attribute(ast.Name("untypy", ast.Load()), "patch", ast.Load()))
         self.generic_visit(node)
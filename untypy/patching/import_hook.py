@@ -1,30 +1,41 @@
 import ast
-import importlib
+import functools
+import hashlib
+import marshal
+import sys
 from collections import Callable
 from importlib.abc import MetaPathFinder
 from importlib.machinery import SourceFileLoader
-from importlib.util import decode_source
+from importlib.util import decode_source, cache_from_source, MAGIC_NUMBER
+from typing import Optional
 
+from untypy.version import __version__
 
-def install_import_hook(should_patch_predicate: Callable[[str], bool],
-                        transformer: Callable[[str], ast.NodeTransformer]):
-    import sys
 
+def install_import_hook(should_patch_predicate: Callable[[str], bool],
+                        transformer: Callable[[str], ast.NodeTransformer],
+                        cache_tag: Optional[str] = None):
+    """
+    cache_tag has to be changed, whenever the transformer produces different code
+    for the same source without a change of its own source, e.g. for another
+    configuration, as it is part of the name of cached bytecode files.
+    """
     already_patched = next((f for f in sys.meta_path if isinstance(f, UntypyFinder)), None)
     if already_patched is not None:
         return
 
     original_finder = next(f for f in sys.meta_path if f.__name__ == 'PathFinder' and hasattr(f, 'find_spec'))
-    sys.meta_path.insert(0, UntypyFinder(original_finder, should_patch_predicate, transformer))
+    sys.meta_path.insert(0, UntypyFinder(original_finder, should_patch_predicate, transformer, cache_tag))
 
 
 class UntypyFinder(MetaPathFinder):
 
     def __init__(self, inner_finder: MetaPathFinder, should_patch_predicate: Callable[[str], bool],
-                 transformer: Callable[[str], ast.NodeTransformer]):
+                 transformer: Callable[[str], ast.NodeTransformer], cache_tag: Optional[str] = None):
         self.inner_finder = inner_finder
         self.should_patch_predicate = should_patch_predicate
         self.transformer = transformer
+        self.cache_tag = cache_tag
 
     def find_spec(self, fullname, path=None, target=None):
         if not self.should_instrument(fullname):
@@ -32,18 +43,35 @@ class UntypyFinder(MetaPathFinder):
 
         inner_spec = self.inner_finder.find_spec(fullname, path, target)
         if inner_spec is not None and isinstance(inner_spec.loader, SourceFileLoader):
-            inner_spec.loader = UntypyLoader(inner_spec.loader.name, inner_spec.loader.path, self.transformer)
+            inner_spec.loader = UntypyLoader(inner_spec.loader.name, inner_spec.loader.path, self.transformer,
+                                             self.cache_tag)
         return inner_spec
 
     def should_instrument(self, module_name: str) -> bool:
         return self.should_patch_predicate(module_name)
 
 
+@functools.lru_cache(maxsize=None)
+def module_digest(module_name: str) -> str:
+    """
+    Digest of the source file of a loaded module, empty if it has none.
+    """
+    path = getattr(sys.modules.get(module_name), '__file__', None)
+    if path is None:
+        return ""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()[:16]
+    except OSError:
+        return ""
+
 class UntypyLoader(SourceFileLoader):
 
-    def __init__(self, fullname, path, transformer: Callable[[str], ast.NodeTransformer]):
+    def __init__(self, fullname, path, transformer: Callable[[str], ast.NodeTransformer],
+                 cache_tag: Optional[str] = None):
         super().__init__(fullname, path)
         self.transformer = transformer
+        self.cache_tag = cache_tag
 
     def source_to_code(self, data, path, *, _optimize=-1):
         source = decode_source(data)
@@ -53,13 +81,49 @@ class UntypyLoader(SourceFileLoader):
         ast.fix_missing_locations(tree)
         return compile(tree, path, 'exec', dont_inherit=True, optimize=_optimize)
 
-    def exec_module(self, module) -> None:
-        # cache_from_source has to be patched to prevent load from cache
-        # this enables patching of AST
-        # See https://github.com/agronholm/typeguard/blob/89c1478bd33bcf9a7cccc2c962ebeaa034e51908/src/typeguard/importhook.py#L12
-        original = getattr(importlib._bootstrap_external, 'cache_from_source')
+    def cache_path(self, source_path: str) -> Optional[str]:
+        """
+        Transformed bytecode is cached next to the regular bytecode, e.g. in
+        __pycache__/mod.cpython-39.untypy-0.0.1-<digest>.pyc. The digest covers the
+        untypy version, the transformer, the source of the modules defining it and its
+        base classes, and the cache_tag. So changing the transformer invalidates the cache.
+        """
         try:
-            setattr(importlib._bootstrap_external, 'cache_from_source', lambda *args: None)
-            return super().exec_module(module)
-        finally:
-            setattr(importlib._bootstrap_external, 'cache_from_source', original)
+            regular = cache_from_source(source_path)
+        except NotImplementedError:  # no cache_tag for this interpreter
+            return None
+        transformer = type(self.transformer(self.name.split('.')))
+        sources = ",".join(module_digest(m) for m in sorted({c.__module__ for c in transformer.__mro__}))
+        config = f"{__version__}:{transformer.__module__}.{transformer.__qualname__}:{sources}:{self.cache_tag}"
+        digest = hashlib.sha1(config.encode('utf-8')).hexdigest()[:16]
+        return regular[:-len('.pyc')] + f".untypy-{__version__}-{digest}.pyc"
+
+    @staticmethod
+    def bytecode_header(source_stats) -> bytes:
+        mtime = int(source_stats['mtime']) & 0xFFFFFFFF
+        size = int(source_stats['size']) & 0xFFFFFFFF
+        return MAGIC_NUMBER + (0).to_bytes(4, 'little') + mtime.to_bytes(4, 'little') + size.to_bytes(4, 'little')
+
+    def get_code(self, fullname):
+        # The regular bytecode cache would bypass the transformer, so a separate one is used.
+        source_path = self.get_filename(fullname)
+        bytecode_path = self.cache_path(source_path)
+        source_stats = self.path_stats(source_path)
+        header = self.bytecode_header(source_stats)
+
+        if bytecode_path is not None:
+            try:
+                data = self.get_data(bytecode_path)
+            except OSError:
+                pass
+            else:
+                if data[:len(header)] == header:
+                    try:
+                        return marshal.loads(data[len(header):])
+                    except (EOFError, ValueError, TypeError):
+                        pass  # broken cache file, recompile
+
+        code = self.source_to_code(self.get_data(source_path), source_path)
+        if bytecode_path is not None and not sys.dont_write_bytecode:
+            self.set_data(bytecode_path, header + marshal.dumps(code))
+        return code
@@ -0,0 +1,95 @@
+import inspect
+import math
+import random
+import sys
+from collections import namedtuple
+from typing import Callable, Optional, Dict
+
+from untypy.error import LazyCallerFrame
+from untypy.util.awaitable import is_coroutine_function, mark_coroutine_function
+
+SamplingStats = namedtuple('SamplingStats', ['calls', 'sampled', 'rate'])
+
+
+class Sampler:
+    """
+    Decides which calls of one function are checked. Instead of drawing a random
+    number on every call, the number of calls to skip until the next checked call
+    is drawn from a geometric distribution, so unchecked calls only count down.
+    """
+
+    def __init__(self, name: str, rate: float, seed: Optional[int]):
+        self.name = name
+        self.rate = rate
+        if seed is None:
+            self.random = random.Random()
+        else:
+            self.random = random.Random(f"{seed}:{name}")
+        self.calls = 0
+        self.sampled = 0
+        self.skip = self.next_skip()
+
+    def next_skip(self) -> int:
+        if self.rate >= 1.0:
+            return 0
+        if self.rate <= 0.0:
+            return sys.maxsize
+        return int(math.log(1.0 - self.random.random()) / math.log(1.0 - self.rate))
+
+    def stats(self) -> SamplingStats:
+        return SamplingStats(self.calls, self.sampled, self.rate)
+
+
+GlobalSamplers: Dict[str, Sampler] = dict()
+
+
+def sampling_rate(name: str, rate: float, rates: Dict[str, float]) -> float:
+    """
+    The rate of the most specific entry in rates, which names the function itself
+    or one of its enclosing modules or classes. Falls back to rate.
+    """
+    while True:
+        if name in rates:
+            return rates[name]
+        if '.' not in name:
+            return rate
+        name = name.rsplit('.', 1)[0]
+
+
+def sample(fn: Callable, checked: Callable, cfg) -> Callable:
+    """
+    Returns a function, which calls checked for the sampled calls and fn for all others.
+    """
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    rate = sampling_rate(name, cfg.sample_rate, cfg.sample_rates)
+    if rate >= 1.0:
+        return checked
+
+    sampler = Sampler(name, rate, cfg.sample_seed)
+    GlobalSamplers[name] = sampler
+
+    def sampled(*args, **kwargs):
+        sampler.calls += 1
+        if sampler.skip:
+            sampler.skip -= 1
+            return fn(*args, **kwargs)
+        sampler.sampled += 1
+        sampler.skip = sampler.next_skip()
+        return checked(*args, **kwargs)
+
+    LazyCallerFrame.transparent.add(sampled.__code__)
+    setattr(sampled, '__wrapped__', fn)
+    setattr(sampled, '__name__', fn.__name__)
+    setattr(sampled, '__qualname__', fn.__qualname__)
+    setattr(sampled, '__signature__', inspect.signature(fn))
+    if hasattr(checked, '__wf'):
+        setattr(sampled, '__wf', getattr(checked, '__wf'))
+    else:
+        setattr(sampled, '__original', fn)
+    if is_coroutine_function(fn):
+        mark_coroutine_function(sampled)
+    return sampled
+
+
+def sampling_stats() -> Dict[str, SamplingStats]:
+    return {name: sampler.stats() for (name, sampler) in GlobalSamplers.items()}
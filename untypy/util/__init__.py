@@ -3,8 +3,8 @@ import types
 from typing import Optional, Union, List
 
 from untypy.display import IndicatorStr
-from untypy.error import UntypyTypeError, Frame, Location
-from untypy.interfaces import ExecutionContext, TypeChecker, WrappedFunction
+from untypy.error import UntypyTypeError, Frame, Location, LazyCallerFrame
+from untypy.interfaces import ExecutionContext, TypeChecker, WrappedFunction, WrappedFunctionContextProvider
 
 
 class ReplaceTypeExecutionContext(ExecutionContext):
@@ -161,7 +161,7 @@ class ArgumentExecutionContext(ExecutionContext):
 
         arglist = []
         for name in signature.parameters:
-            if name is self.argument_name:
+            if name == self.argument_name:
                 arglist.append(IndicatorStr(f"{name}: ") + error_id)
             else:
                 if wf is not None:
@@ -195,6 +195,39 @@ class ArgumentExecutionContext(ExecutionContext):
         return err.with_frame(frame)
 
 
+def wrapping_arguments(checkers: dict[str, TypeChecker]) -> frozenset:
+    return frozenset(name for (name, checker) in checkers.items() if name != 'return' and checker.may_be_wrapped())
+
+
+class ArgumentExecutionContexts(dict):
+    """
+    ArgumentExecutionContexts of a wrapped function, shared between all calls.
+    They find the caller only when an error is reported. Arguments whose checker may
+    keep the context for later (see TypeChecker.may_be_wrapped) get a context with
+    the caller frame captured eagerly instead.
+    """
+
+    def __init__(self, fn: Union[WrappedFunction, types.FunctionType], caller: LazyCallerFrame,
+                 declared: Optional[Location] = None):
+        super().__init__()
+        self.fn = fn
+        self.caller = caller
+        self.declared = declared
+
+    def __missing__(self, name):
+        ctx = ArgumentExecutionContext(self.fn, self.caller, name, self.declared)
+        self[name] = ctx
+        return ctx
+
+    def capturing(self, caller, names: frozenset) -> WrappedFunctionContextProvider:
+        def ctxprv(name):
+            if name in names:
+                return ArgumentExecutionContext(self.fn, caller, name, self.declared)
+            return self[name]
+
+        return ctxprv
+
+
 class GenericExecutionContext(ExecutionContext):
     def __init__(self, *, declared: Union[None, Location, List[Location]] = None,
                  responsable: Union[None, Location, List[Location]] = None,
@@ -0,0 +1,73 @@
+import asyncio.coroutines
+import inspect
+from typing import Any, Awaitable, Callable
+
+from untypy.interfaces import ExecutionContext
+
+
+class TypedAwaitable:
+    """
+    Checks the result of an awaitable, when it is awaited.
+
+    send, throw and close are forwarded to the inner coroutine, so awaiting adds
+    no coroutine frame (and no Task) to the ones of the inner coroutine.
+    """
+    __slots__ = ('coroutine', 'check', 'ctx')
+
+    def __init__(self, awaitable: Awaitable[Any], check: Callable[[Any, ExecutionContext], Any],
+                 ctx: ExecutionContext):
+        if not hasattr(awaitable, 'send'):
+            awaitable = awaitable.__await__()
+        self.coroutine = awaitable
+        self.check = check
+        self.ctx = ctx
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+    def send(self, value):
+        try:
+            return self.coroutine.send(value)
+        except StopIteration as e:
+            raise StopIteration(self.check(e.value, self.ctx)) from None
+
+    def throw(self, *args):
+        try:
+            return self.coroutine.throw(*args)
+        except StopIteration as e:
+            raise StopIteration(self.check(e.value, self.ctx)) from None
+
+    def close(self):
+        return self.coroutine.close()
+
+
+def await_checked(wrap_return: Callable[[Any, Any, ExecutionContext], Any]) -> Callable:
+    """
+    Turns wrap_return(ret, bindings, ctx) of a WrappedFunction into the one of a coroutine function,
+    which checks the awaited value instead of the returned coroutine.
+    """
+
+    def wrap_awaited(ret, bindings, ctx: ExecutionContext):
+        return TypedAwaitable(ret, lambda value, c: wrap_return(value, bindings, c), ctx)
+
+    return wrap_awaited
+
+
+if hasattr(inspect, 'markcoroutinefunction'):
+    is_coroutine_function = inspect.iscoroutinefunction
+    mark_coroutine_function = inspect.markcoroutinefunction
+else:
+    def is_coroutine_function(fn: Any) -> bool:
+        return inspect.iscoroutinefunction(fn) or \
+            getattr(fn, '_is_coroutine', None) is asyncio.coroutines._is_coroutine
+
+    def mark_coroutine_function(fn: Callable) -> Callable:
+        # recognized by asyncio.iscoroutinefunction before Python 3.12
+        fn._is_coroutine = asyncio.coroutines._is_coroutine
+        return fn
@@ -0,0 +1,130 @@
+import sys
+import threading
+import time
+from collections import namedtuple
+from typing import Any, Dict, Optional, TextIO
+
+from untypy.error import UntypyTypeError
+from untypy.interfaces import TypeChecker, ExecutionContext, WrappedFunction
+
+# time is the cumulative time spent in checks in seconds, if timing is enabled.
+FunctionStats = namedtuple('FunctionStats', ['calls', 'checked', 'wrapped', 'violations', 'time'])
+
+
+class FunctionCounters:
+    __slots__ = ('calls', 'checked', 'wrapped', 'violations', 'time')
+
+    def __init__(self):
+        self.calls = 0
+        self.checked = 0
+        self.wrapped = 0
+        self.violations = 0
+        self.time = 0
+
+    def stats(self) -> FunctionStats:
+        return FunctionStats(self.calls, self.checked, self.wrapped, self.violations, self.time / 1e9)
+
+
+class StatsCollector:
+    """
+    Counts per wrapped function how often it was called, how many values were checked,
+    how many of them were returned wrapped and how many were rejected.
+
+    Wrappers look up their counters when they are called, so functions wrapped before
+    enable() are counted as well. While disabled, this costs a check of enabled per call.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.timing = False
+        self.functions: Dict[str, FunctionCounters] = dict()
+
+    def enable(self, timing: bool = False) -> None:
+        self.enabled = True
+        self.timing = timing
+
+    def counters(self, name: str) -> Optional[FunctionCounters]:
+        """
+        The counters of the function name, None if statistics are not collected.
+        """
+        if not self.enabled:
+            return None
+        counters = self.functions.get(name)
+        if counters is None:
+            counters = self.functions[name] = FunctionCounters()
+        return counters
+
+    def snapshot(self) -> Dict[str, FunctionStats]:
+        return {name: counters.stats() for (name, counters) in list(self.functions.items())}
+
+    def clear(self) -> None:
+        for counters in self.functions.values():
+            counters.__init__()
+
+
+GlobalStats = StatsCollector()
+
+
+def function_name(fn: Any) -> str:
+    fn = WrappedFunction.find_original(fn)
+    return f"{getattr(fn, '__module__', None)}.{getattr(fn, '__qualname__', repr(fn))}"
+
+
+def counted(counters: FunctionCounters, checker: TypeChecker, arg: Any, ctx: ExecutionContext) -> Any:
+    start = time.perf_counter_ns() if GlobalStats.timing else 0
+    try:
+        value = checker.check_and_wrap(arg, ctx)
+    except UntypyTypeError:
+        counters.violations += 1
+        raise
+    finally:
+        if start:
+            counters.time += time.perf_counter_ns() - start
+    counters.checked += 1
+    if value is not arg:
+        counters.wrapped += 1
+    return value
+
+
+def format_stats(stats: Dict[str, FunctionStats]) -> str:
+    lines = [f"{'calls':>10} {'checked':>10} {'wrapped':>10} {'violations':>10} {'time [s]':>10}  function"]
+    for (name, s) in sorted(stats.items(), key=lambda e: (-e[1].time, -e[1].calls)):
+        lines.append(f"{s.calls:>10} {s.checked:>10} {s.wrapped:>10} {s.violations:>10} {s.time:>10.4f}  {name}")
+    return "\n".join(lines)
+
+
+class StatsDumper(threading.Thread):
+    """
+    Writes the statistics to out every interval seconds, until stop() is called.
+    """
+
+    def __init__(self, interval: float, out: Optional[TextIO] = None):
+        super().__init__(name="untypy-stats", daemon=True)
+        self.interval = interval
+        self.out = out
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.dump()
+
+    def dump(self) -> None:
+        out = sys.stderr if self.out is None else self.out
+        print(format_stats(GlobalStats.snapshot()), file=out, flush=True)
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+
+def enable_stats(timing: bool = False) -> None:
+    GlobalStats.enable(timing)
+
+
+def stats() -> Dict[str, FunctionStats]:
+    return GlobalStats.snapshot()
+
+
+def dump_stats(interval: float, out: Optional[TextIO] = None) -> StatsDumper:
+    dumper = StatsDumper(interval, out)
+    dumper.start()
+    return dumper
@@ -1,13 +1,17 @@
 import inspect
 import sys
+import time
 import typing
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
 
-from untypy.error import UntypyAttributeError
+from untypy.error import UntypyAttributeError, UntypyTypeError, LazyCallerFrame
 from untypy.impl.any import SelfChecker
 from untypy.interfaces import WrappedFunction, TypeChecker, CreationContext, WrappedFunctionContextProvider, \
     ExecutionContext
-from untypy.util import ArgumentExecutionContext, ReturnExecutionContext
+from untypy.util import ArgumentExecutionContext, ReturnExecutionContext, ArgumentExecutionContexts, \
+    wrapping_arguments
+from untypy.util.awaitable import await_checked, is_coroutine_function, mark_coroutine_function
+from untypy.util.stats import GlobalStats, counted, function_name
 
 
 class TypedFunctionBuilder(WrappedFunction):
@@ -18,6 +22,9 @@ class TypedFunctionBuilder(WrappedFunction):
     special_args = ['self', 'cls']
     method_name_ignore_return = ['__init__']
 
+    # Generate a wrapper specialized to the signature of the function, if possible.
+    compile_wrappers = True
+
     def __init__(self, inner: Callable, ctx: CreationContext):
         self.inner = inner
         self.signature = inspect.signature(inner)
@@ -66,43 +73,231 @@ class TypedFunctionBuilder(WrappedFunction):
         if hasattr(self.inner, "__fc"):
             self.fc = getattr(self.inner, "__fc")
         self.checkers = checkers
+        self.stats_name = function_name(inner)
 
     def build(self):
+        caller = LazyCallerFrame()
+        contexts = ArgumentExecutionContexts(self, caller)
+        shared = contexts.__getitem__
+        return_ctx = ReturnExecutionContext(self)
+        capture = wrapping_arguments(self.checkers)
+        is_async = is_coroutine_function(self.inner)
+        if is_async:
+            wrap_return = await_checked(self.wrap_return)
+        else:
+            wrap_return = self.wrap_return
+
         def wrapper(*args, **kwargs):
-            # first is this fn
-            caller = sys._getframe(1)
-            (args, kwargs, bindings) = self.wrap_arguments(lambda n: ArgumentExecutionContext(self, caller, n), args,
-                                                           kwargs)
+            if capture:
+                # first is this fn
+                ctxprv = contexts.capturing(sys._getframe(1), capture)
+            else:
+                ctxprv = shared
+            (args, kwargs, bindings) = self.wrap_arguments(ctxprv, args, kwargs)
             ret = self.inner(*args, **kwargs)
-            ret = self.wrap_return(ret, bindings, ReturnExecutionContext(self))
+            ret = wrap_return(ret, bindings, return_ctx)
             return ret
 
-        if inspect.iscoroutine(self.inner):
-            raise UntypyAttributeError("Async functions are currently not supported.")
-        else:
+        w = None
+        if self.compile_wrappers and not is_async:
+            w = self.build_compiled(contexts, return_ctx, capture)
+        if w is None:
             w = wrapper
+        caller.add(w.__code__)
 
         setattr(w, '__wrapped__', self.inner)
         setattr(w, '__name__', self.inner.__name__)
         setattr(w, '__signature__', self.signature)
         setattr(w, '__wf', self)
+        if is_async:
+            mark_coroutine_function(w)
         return w
 
+    def build_compiled(self, contexts: ArgumentExecutionContexts, return_ctx: ExecutionContext,
+                       capture: frozenset) -> Optional[Callable]:
+        """
+        Generates a wrapper with the same parameters as the original function, so Python
+        itself binds the arguments and fills in the defaults. Returns None for signatures
+        using *args, **kwargs, keyword-only arguments or for functions with conditions.
+
+        While statistics are enabled, calls are forwarded to a second generated wrapper,
+        which performs the same checks and counts them.
+        """
+        if self.fc is not None:
+            return None
+
+        params = list(self.signature.parameters.values())
+        for param in params:
+            if param.kind not in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+                return None
+            if param.name.startswith('_untypy_'):
+                return None
+
+        closure = {
+            '_untypy_inner': self.inner,
+            '_untypy_wf': self,
+            '_untypy_getframe': sys._getframe,
+            '_untypy_type': type,
+            '_untypy_ArgumentExecutionContext': ArgumentExecutionContext,
+            '_untypy_return_checker': self.checkers['return'].check_and_wrap,
+            '_untypy_return_ctx': return_ctx,
+            '_untypy_stats': GlobalStats,
+            '_untypy_stats_name': self.stats_name,
+            '_untypy_clock': time.perf_counter_ns,
+            '_untypy_UntypyTypeError': UntypyTypeError,
+        }
+
+        def type_guard(var: str, name: str, types: list[type]) -> str:
+            # Identity preserving checkers accept these types unchanged, so a full check is only
+            # needed if the guard fails.
+            if len(types) == 1:
+                closure[name] = types[0]
+                return f'_untypy_type({var}) is {name}'
+            closure[name] = frozenset(types)
+            return f'_untypy_type({var}) in {name}'
+
+        parameters = []
+        checks = []
+        counted_checks = []
+        guards = []
+        fallbacks = []
+
+        def flush_guards():
+            if len(guards) > 0:
+                lines = [f"    if not ({' and '.join(guards)}):", *fallbacks]
+                checks.extend(lines)
+                counted_checks.extend(lines)
+                guards.clear()
+                fallbacks.clear()
+
+        for (i, param) in enumerate(params):
+            parameter = param.name
+            if param.default is not inspect.Parameter.empty:
+                closure[f'_untypy_default_{i}'] = param.default
+                parameter += f'=_untypy_default_{i}'
+            parameters.append(parameter)
+            if param.kind is inspect.Parameter.POSITIONAL_ONLY and (
+                    i + 1 == len(params) or params[i + 1].kind is not inspect.Parameter.POSITIONAL_ONLY):
+                parameters.append('/')
+
+            checker = self.checkers[param.name]
+            if isinstance(checker, SelfChecker):
+                continue
+            closure[f'_untypy_checker_{i}'] = checker.check_and_wrap
+            if param.name in capture:
+                closure[f'_untypy_name_{i}'] = param.name
+                ctx = f'_untypy_ArgumentExecutionContext(_untypy_wf, _untypy_caller, _untypy_name_{i})'
+            else:
+                closure[f'_untypy_ctx_{i}'] = contexts[param.name]
+                ctx = f'_untypy_ctx_{i}'
+            check = f'_untypy_checker_{i}({param.name}, {ctx})'
+
+            types = checker.exact_types() if checker.is_identity_preserving() else None
+            if types is not None:
+                guards.append(type_guard(param.name, f'_untypy_types_{i}', types))
+                fallbacks.append(f'      {check}')
+                continue
+            flush_guards()
+            if checker.is_identity_preserving():
+                checks.append(f'    {check}')
+                counted_checks.append(f'    {check}')
+            else:
+                checks.append(f'    {param.name} = {check}')
+                counted_checks.extend([
+                    f'    _untypy_v = {check}',
+                    f'    if _untypy_v is not {param.name}:',
+                    f'      _untypy_counters.wrapped += 1',
+                    f'    {param.name} = _untypy_v',
+                ])
+        flush_guards()
+
+        return_checker = self.checkers['return']
+        return_types = return_checker.exact_types() if return_checker.is_identity_preserving() else None
+        if return_types is not None:
+            guard = type_guard('_untypy_ret', '_untypy_return_types', return_types)
+            checks_return = [
+                f"    if {guard}:",
+                "      return _untypy_ret",
+            ]
+            counted_checks_return = [
+                f"    if {guard}:",
+                "      _untypy_v = _untypy_ret",
+                "    else:",
+                "      _untypy_v = _untypy_return_checker(_untypy_ret, _untypy_return_ctx)",
+            ]
+        else:
+            checks_return = []
+            counted_checks_return = ["    _untypy_v = _untypy_return_checker(_untypy_ret, _untypy_return_ctx)"]
+
+        def counting(lines: list[str]) -> list[str]:
+            return [
+                "    _untypy_start = _untypy_clock() if _untypy_stats.timing else 0",
+                "    try:",
+                *map(lambda line: '  ' + line, lines),
+                "    except _untypy_UntypyTypeError:",
+                "      _untypy_counters.violations += 1",
+                "      raise",
+                "    finally:",
+                "      if _untypy_start:",
+                "        _untypy_counters.time += _untypy_clock() - _untypy_start",
+            ]
+
+        arguments = ', '.join(map(lambda p: p.name, params))
+        counting_source = [
+            f"  def counting_wrapper({', '.join(parameters)}):",
+            # called by the wrapper below, so the caller is one frame further up
+            *(["    _untypy_caller = _untypy_getframe(2)"] if capture else []),
+            "    _untypy_counters = _untypy_stats.counters(_untypy_stats_name)",
+            "    _untypy_counters.calls += 1",
+            *(counting(counted_checks) if counted_checks else []),
+            f"    _untypy_counters.checked += {len(params)}",
+            f"    _untypy_ret = _untypy_inner({arguments})",
+            *counting(counted_checks_return),
+            "    _untypy_counters.checked += 1",
+            "    if _untypy_v is not _untypy_ret:",
+            "      _untypy_counters.wrapped += 1",
+            "    return _untypy_v",
+        ]
+        source = '\n'.join([
+            f"def _untypy_create({', '.join(closure)}):",
+            *counting_source,
+            f"  def wrapper({', '.join(parameters)}):",
+            "    if _untypy_stats.enabled:",
+            f"      return counting_wrapper({arguments})",
+            *(["    _untypy_caller = _untypy_getframe(1)"] if capture else []),
+            *checks,
+            f"    _untypy_ret = _untypy_inner({arguments})",
+            *checks_return,
+            "    return _untypy_return_checker(_untypy_ret, _untypy_return_ctx)",
+            "  return wrapper",
+        ])
+        namespace = {}
+        exec(compile(source, f"<untypy wrapper of {self.inner.__qualname__}>", 'exec'), namespace)
+        return namespace['_untypy_create'](**closure)
+
     def wrap_arguments(self, ctxprv: WrappedFunctionContextProvider, args, kwargs):
         bindings = self.signature.bind(*args, **kwargs)
         bindings.apply_defaults()
         if self.fc is not None:
             self.fc.prehook(bindings, ctxprv)
+        counters = GlobalStats.counters(self.stats_name) if GlobalStats.enabled else None
+        if counters is not None:
+            counters.calls += 1
         for name in bindings.arguments:
             check = self.checkers[name]
             ctx = ctxprv(name)
-            bindings.arguments[name] = check.check_and_wrap(bindings.arguments[name], ctx)
+            if counters is None:
+                bindings.arguments[name] = check.check_and_wrap(bindings.arguments[name], ctx)
+            else:
+                bindings.arguments[name] = counted(counters, check, bindings.arguments[name], ctx)
         return bindings.args, bindings.kwargs, bindings
 
     def wrap_return(self, ret, bindings, ctx: ExecutionContext):
         check = self.checkers['return']
         if self.fc is not None:
             self.fc.posthook(ret, bindings, ctx)
+        if GlobalStats.enabled:
+            return counted(GlobalStats.counters(self.stats_name), check, ret, ctx)
         return check.check_and_wrap(ret, ctx)
 
     def describe(self):